@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+'''
+Compare creating accounts one at a time with Account.create against creating them
+together with Account.createMany, in this process and over a pool of workers.
+
+    python benchmarks/bench_create_many.py
+'''
+import os
+import timeit
+
+from eth_account import (
+    Account,
+)
+
+COUNT = 2000
+
+
+def best_of(fn, repeat=3):
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) / COUNT
+
+
+def main():
+    def one_at_a_time():
+        return [(account.privateKey, account.address) for account in (
+            Account.create() for _ in range(COUNT)
+        )]
+
+    def batched():
+        return Account.createMany(COUNT)
+
+    def parallel():
+        return Account.createMany(COUNT, workers=os.cpu_count())
+
+    before = best_of(one_at_a_time)
+    after = best_of(batched)
+    after_parallel = best_of(parallel)
+    print("per account: create %7.1f us  createMany %7.1f us  speedup %.1fx" % (
+        before * 1e6,
+        after * 1e6,
+        before / after,
+    ))
+    print("with %d workers: createMany %7.1f us  speedup %.1fx" % (
+        os.cpu_count(),
+        after_parallel * 1e6,
+        before / after_parallel,
+    ))
+
+
+if __name__ == '__main__':
+    main()
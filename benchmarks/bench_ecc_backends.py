@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+'''
+Compare the default eth-keys backend with the pure-Python
+:class:`~eth_account.backends.FastPythonECCBackend` on the operations that
+eth_account performs: deriving a public key, signing a hash and recovering the
+signer of a hash.
+
+    python benchmarks/bench_ecc_backends.py
+'''
+import timeit
+
+from eth_keys.backends import (
+    NativeECCBackend,
+)
+
+from eth_account import (
+    Account,
+)
+from eth_account.backends import (
+    FastPythonECCBackend,
+)
+
+KEY_BYTES = b'unicorns' * 4
+MESSAGE_HASH = b'\x14' * 32
+
+
+def best_of(fn, number=100, repeat=5):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def account_with_backend(backend):
+    account = Account()
+    account.setKeyBackend(backend)
+    return account
+
+
+def main():
+    native = account_with_backend(NativeECCBackend)
+    fast = account_with_backend(FastPythonECCBackend)
+    signature = native.signHash(MESSAGE_HASH, KEY_BYTES).signature
+    # build the precomputed tables before timing
+    fast.privateKeyToAccount(KEY_BYTES)
+
+    cases = (
+        ('privateKeyToAccount', lambda api: api.privateKeyToAccount(KEY_BYTES).address),
+        ('signHash', lambda api: api.signHash(MESSAGE_HASH, KEY_BYTES)),
+        ('recoverHash', lambda api: api.recoverHash(MESSAGE_HASH, signature=signature)),
+    )
+    for label, operation in cases:
+        assert operation(native) == operation(fast)
+        before = best_of(lambda: operation(native))
+        after = best_of(lambda: operation(fast))
+        print("%-20s native %8.1f us  fast %8.1f us  speedup %.1fx" % (
+            label,
+            before * 1e6,
+            after * 1e6,
+            before / after,
+        ))
+
+
+if __name__ == '__main__':
+    main()
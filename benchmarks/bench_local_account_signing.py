@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+'''
+Measure the per-signature cost that LocalAccount saves by signing with its
+cached key object, instead of passing the raw private key bytes back to Account
+(which parses them and derives the public key again on every call).
+
+    python benchmarks/bench_local_account_signing.py
+'''
+import timeit
+
+from eth_account import (
+    Account,
+)
+
+TRANSACTION = {
+    'to': '0xF0109fC8DF283027b6285cc889F5aA624EaC1F55',
+    'value': 1000000000,
+    'gas': 2000000,
+    'gasPrice': 234567897654321,
+    'nonce': 0,
+    'chainId': 1,
+}
+MESSAGE_HASH = b'\x14' * 32
+
+
+def best_of(fn, number=200, repeat=5):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def main():
+    account = Account.privateKeyToAccount(b'unicorns' * 4)
+    key_bytes = account.privateKey
+
+    cases = (
+        (
+            'signHash',
+            lambda: Account.signHash(MESSAGE_HASH, key_bytes),
+            lambda: account.signHash(MESSAGE_HASH),
+        ),
+        (
+            'signTransaction',
+            lambda: Account.signTransaction(TRANSACTION, key_bytes),
+            lambda: account.signTransaction(TRANSACTION),
+        ),
+    )
+    for label, reparsing, cached in cases:
+        assert reparsing() == cached()
+        before = best_of(reparsing)
+        after = best_of(cached)
+        print("%-16s raw key %7.1f us  cached key %7.1f us  saved %7.1f us (%.0f%%)" % (
+            label,
+            before * 1e6,
+            after * 1e6,
+            (before - after) * 1e6,
+            100 * (before - after) / before,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+'''
+Compare recovering signers one at a time with Account.recoverHash against
+recovering them together with Account.recoverHashes.
+
+    python benchmarks/bench_recover_hashes.py
+'''
+import timeit
+
+from eth_utils import (
+    keccak,
+)
+
+from eth_account import (
+    Account,
+)
+
+BATCH_SIZE = 200
+
+
+def best_of(fn, repeat=3):
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) / BATCH_SIZE
+
+
+def main():
+    key_bytes = b'unicorns' * 4
+    msg_hashes = [keccak(index.to_bytes(4, 'big')) for index in range(BATCH_SIZE)]
+    pairs = [
+        (msg_hash, Account.signHash(msg_hash, key_bytes).signature)
+        for msg_hash in msg_hashes
+    ]
+
+    def one_at_a_time():
+        return [Account.recoverHash(msg_hash, signature=signature) for msg_hash, signature in pairs]
+
+    def batched():
+        return Account.recoverHashes(pairs)
+
+    assert one_at_a_time() == batched()
+    before = best_of(one_at_a_time)
+    after = best_of(batched)
+    print("per signature: recoverHash %7.1f us  recoverHashes %7.1f us  speedup %.1fx" % (
+        before * 1e6,
+        after * 1e6,
+        before / after,
+    ))
+
+
+if __name__ == '__main__':
+    main()
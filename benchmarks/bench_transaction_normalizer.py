@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+'''
+Compare the single-pass transaction normalizer with the original
+merge/chain_id_to_v/apply_formatters_to_dict pipeline.
+
+    python benchmarks/bench_transaction_normalizer.py
+'''
+import timeit
+
+from cytoolz import (
+    merge,
+    partial,
+    pipe,
+)
+from eth_utils.curried import (
+    apply_formatters_to_dict,
+)
+
+from eth_account._utils.transactions import (
+    TRANSACTION_DEFAULTS,
+    TRANSACTION_FORMATTERS,
+    Transaction,
+    UnsignedTransaction,
+    chain_id_to_v,
+    normalize_transaction_fields,
+)
+
+TRANSACTIONS = {
+    'native types': {
+        'to': b'\xf0\x10\x9f\xc8\xdf\x28\x30\x27\xb6\x28\x5c\xc8\x89\xf5\xaa\x62\x4e\xac\x1f\x55',
+        'value': 1000000000,
+        'gas': 2000000,
+        'gasPrice': 234567897654321,
+        'nonce': 0,
+        'chainId': 1,
+    },
+    'hex strings': {
+        'to': '0xF0109fC8DF283027b6285cc889F5aA624EaC1F55',
+        'value': '0x3b9aca00',
+        'gas': '0x1e8480',
+        'gasPrice': '0xd55698372431',
+        'nonce': '0x0',
+        'data': '0xa9059cbb',
+        'chainId': 1,
+    },
+}
+
+
+def pipeline(transaction_dict):
+    filled_transaction = pipe(
+        transaction_dict,
+        dict,
+        partial(merge, TRANSACTION_DEFAULTS),
+        chain_id_to_v,
+        apply_formatters_to_dict(TRANSACTION_FORMATTERS),
+    )
+    if 'v' in filled_transaction:
+        return Transaction.from_dict(filled_transaction)
+    else:
+        return UnsignedTransaction.from_dict(filled_transaction)
+
+
+def normalizer(transaction_dict):
+    fields = normalize_transaction_fields(transaction_dict)
+    if len(fields) == 6:
+        return UnsignedTransaction(*fields)
+    else:
+        return Transaction(*fields)
+
+
+def best_of(fn, arg, number=20000, repeat=5):
+    return min(timeit.repeat(lambda: fn(arg), number=number, repeat=repeat)) / number
+
+
+def main():
+    for label, transaction in TRANSACTIONS.items():
+        assert pipeline(transaction) == normalizer(transaction)
+
+        fields_only = best_of(normalize_transaction_fields, transaction)
+        old = best_of(pipeline, transaction)
+        new = best_of(normalizer, transaction)
+        print("%-13s pipeline %6.2f us  normalizer %6.2f us  (fields only %5.2f us)  %.2fx" % (
+            label,
+            old * 1e6,
+            new * 1e6,
+            fields_only * 1e6,
+            old / new,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+from functools import (
+    lru_cache,
+)
+
+from eth_utils import (
+    decode_hex,
+    is_hex_address,
+    keccak,
+    to_checksum_address as _to_checksum_address,
+)
+
+# Signers and recovered senders repeat a lot, and checksumming an address costs a hex
+# encoding and another keccak, so remember the checksum of recently seen addresses.
+CHECKSUM_ENCODING_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=CHECKSUM_ENCODING_CACHE_SIZE)
+def to_checksum_address(address_bytes):
+    '''
+    Checksum-encode a canonical 20-byte address, remembering recent results.
+
+    :param bytes address_bytes: the canonical address
+    :rtype: str
+    '''
+    return _to_checksum_address(address_bytes)
+
+
+def is_recent_checksum_address(address):
+    '''
+    Check that a hex address string is checksummed, like
+    :func:`eth_utils.is_checksum_address`, using the cache of
+    :func:`to_checksum_address`.
+
+    :param str address: the address to check
+    :rtype: bool
+    '''
+    if not is_hex_address(address):
+        return False
+    return to_checksum_address(decode_hex(address)) == address
+
+
+def public_key_bytes_to_address(public_key_bytes):
+    '''
+    The canonical 20-byte address of an uncompressed 64-byte public key.
+    '''
+    return keccak(public_key_bytes)[-20:]
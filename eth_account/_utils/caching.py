@@ -0,0 +1,207 @@
+from collections import (
+    OrderedDict,
+    deque,
+    namedtuple,
+)
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+_MISSING = object()
+
+
+class LRUCache(object):
+    '''
+    A bounded mapping that evicts the least recently used entry when it is full.
+
+    All operations take a lock, so one cache can be shared between threads. Values
+    are computed by the caller outside of the lock, so two threads that miss on the
+    same key at once may both compute it; the last one to finish is kept.
+    '''
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1, got %r" % maxsize)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        '''
+        Look up a key, marking it as the most recently used, and count the hit or miss.
+        '''
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            replaced = self._entries.get(key, _MISSING)
+            if replaced is not _MISSING:
+                self._discard(replaced)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                (_, evicted) = self._entries.popitem(last=False)
+                self._discard(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        '''
+        Drop all entries and reset the counters.
+        '''
+        with self._lock:
+            for value in self._entries.values():
+                self._discard(value)
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                self.evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.info())
+
+    def _discard(self, value):
+        '''
+        Called, with the lock held, on each value that leaves the cache.
+        '''
+        pass
+
+
+class DerivedKeyCache(LRUCache):
+    '''
+    Remembers the keys derived from keyfile passwords, for at most ``ttl`` seconds.
+
+    Entries are keyed by an HMAC of the password, the key derivation function and its
+    parameters (salt included), under a secret drawn for each cache, so that neither
+    passwords nor anything that could be checked against a guessed password are kept.
+    Derived keys are held in a :class:`bytearray`, which is overwritten with zeros when
+    the entry expires, is evicted or the cache is cleared.
+
+    Expired entries are dropped on every access, and by a timer thread that runs
+    while the cache holds entries, so a key that is never looked up again doesn't
+    outlive its ``ttl`` either.
+    '''
+    def __init__(self, maxsize, ttl):
+        if ttl <= 0:
+            raise ValueError("Time to live must be positive, got %r" % ttl)
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self._secret = os.urandom(32)
+        # reentrant, so that the purging methods can call those of LRUCache
+        self._lock = threading.RLock()
+        # (expiry time, key) of each put, oldest first: the ttl is the same for all
+        # entries, so this is also the order in which they expire
+        self._expiries = deque()
+        self._timer = None
+
+    def key(self, kdf, kdfparams, password):
+        message = json.dumps([kdf, kdfparams], sort_keys=True).encode('utf-8')
+        mac = hmac.new(self._secret, message, hashlib.sha256)
+        mac.update(password)
+        return mac.digest()
+
+    def get(self, key, default=None):
+        '''
+        Look up a derived key, as :class:`bytes`, treating an expired entry as missing.
+        '''
+        with self._lock:
+            self._purge()
+            entry = super().get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            return bytes(entry[1])
+
+    def put(self, key, derived_key):
+        with self._lock:
+            self._purge()
+            expires = time.monotonic() + self.ttl
+            super().put(key, (expires, bytearray(derived_key)))
+            self._expiries.append((expires, key))
+            if len(self._expiries) > 2 * self.maxsize:
+                # drop the records of entries that were since replaced or evicted
+                self._expiries = deque(sorted(
+                    (expires, key) for key, (expires, _) in self._entries.items()
+                ))
+            self._schedule()
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._expiries.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def info(self):
+        with self._lock:
+            self._purge()
+            return super().info()
+
+    def __contains__(self, key):
+        with self._lock:
+            self._purge()
+            return super().__contains__(key)
+
+    def __len__(self):
+        with self._lock:
+            self._purge()
+            return super().__len__()
+
+    def _purge(self):
+        '''
+        Drop the expired entries. Called with the lock held.
+        '''
+        now = time.monotonic()
+        while self._expiries and self._expiries[0][0] <= now:
+            (expires, key) = self._expiries.popleft()
+            entry = self._entries.get(key)
+            # skip the records of entries that were replaced since
+            if entry is not None and entry[0] == expires:
+                del self._entries[key]
+                self._discard(entry)
+                self.evictions += 1
+
+    def _schedule(self):
+        if self._timer is None and self._expiries:
+            delay = max(0, self._expiries[0][0] - time.monotonic())
+            self._timer = threading.Timer(delay, self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _expire(self):
+        with self._lock:
+            self._timer = None
+            self._purge()
+            self._schedule()
+
+    def _discard(self, entry):
+        (_, derived_key) = entry
+        derived_key[:] = bytes(len(derived_key))
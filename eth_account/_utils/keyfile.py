@@ -0,0 +1,382 @@
+import contextlib
+import hashlib
+import itertools
+import json
+import os
+import threading
+
+import eth_keyfile
+from eth_keyfile import (
+    keyfile as eth_keyfile_module,
+)
+from eth_keyfile.keyfile import (
+    normalize_keys,
+)
+from eth_utils import (
+    decode_hex,
+    encode_hex,
+    is_dict,
+    remove_0x_prefix,
+    text_if_str,
+    to_bytes,
+)
+
+# hashlib.scrypt is only there when Python is built against OpenSSL 1.1 or later
+HAS_OPENSSL_SCRYPT = hasattr(hashlib, 'scrypt')
+
+KDF_ENGINES = ('auto', 'openssl', 'eth-keyfile')
+
+# Extra memory allowed to OpenSSL's scrypt, above what its parameters need
+SCRYPT_MAXMEM_MARGIN = 1024 ** 2
+
+_MISSING = object()
+
+# path -> ((modification time, size), profile) of the profiles read so far
+_loaded_profiles = {}
+
+
+def parse_keyfile_json(keyfile_json):
+    '''
+    Accept an encrypted keyfile as a JSON string or an already-decoded dict.
+    '''
+    if isinstance(keyfile_json, str):
+        return json.loads(keyfile_json)
+    elif is_dict(keyfile_json):
+        return keyfile_json
+    else:
+        raise TypeError("The keyfile should be supplied as a JSON string, or a dictionary.")
+
+
+def kdf_memory_cost(keyfile_json):
+    '''
+    Estimate the memory, in bytes, needed to derive the key of an encrypted keyfile.
+
+    Scrypt fills a table of ``n`` blocks of ``128 * r`` bytes each, while pbkdf2 needs
+    next to nothing. A keyfile that can't be read is estimated at 0 bytes; the error
+    is raised when it is actually decrypted.
+    '''
+    try:
+        crypto = normalize_keys(parse_keyfile_json(keyfile_json))['crypto']
+        if crypto['kdf'] != 'scrypt':
+            return 0
+        kdfparams = crypto['kdfparams']
+        return 128 * int(kdfparams['r']) * int(kdfparams['n'])
+    except (TypeError, ValueError, KeyError, AttributeError):
+        return 0
+
+
+def pair_keyfiles_with_passwords(keyfiles, passwords):
+    '''
+    Pair each keyfile with its password, as bytes, lazily. ``passwords`` is either a
+    single password for all the keyfiles, or one password per keyfile.
+    '''
+    if isinstance(passwords, (str, bytes)):
+        pairs = zip(keyfiles, itertools.repeat(passwords))
+    else:
+        pairs = itertools.zip_longest(keyfiles, passwords, fillvalue=_MISSING)
+
+    for keyfile, password in pairs:
+        if keyfile is _MISSING or password is _MISSING:
+            raise ValueError("There must be exactly one password per keyfile")
+        yield (keyfile, text_if_str(to_bytes, password))
+
+
+def scrypt_maxmem(n, r, p):
+    '''
+    The memory limit to pass to :func:`hashlib.scrypt`, whose default of 32 MB is too
+    low for common keyfile parameters.
+    '''
+    return 128 * r * (n + p + 2) + SCRYPT_MAXMEM_MARGIN
+
+
+def openssl_supports_scrypt(n, r):
+    # OpenSSL enforces the limit of RFC 7914 on n, which rules out the default
+    # parameters of eth-keyfile (n = 2 ** 18 with r = 1)
+    return HAS_OPENSSL_SCRYPT and n < 2 ** (16 * r)
+
+
+def _validate_engine(engine):
+    if engine not in KDF_ENGINES:
+        raise ValueError("Unknown KDF engine %r, expected one of %r" % (engine, KDF_ENGINES))
+
+
+def _scrypt(engine, password, salt, n, r, p, dklen):
+    if engine != 'openssl':
+        # 'auto' means eth-keyfile, whose pycryptodome scrypt measured faster than
+        # OpenSSL's
+        eth_keyfile_scrypt = _eth_keyfile_function('_scrypt_hash')
+        return eth_keyfile_scrypt(password, salt=salt, n=n, r=r, p=p, buflen=dklen)
+    if not HAS_OPENSSL_SCRYPT:
+        raise ValueError("hashlib.scrypt is not available, use the 'auto' KDF engine")
+    elif not openssl_supports_scrypt(n, r):
+        raise ValueError(
+            "OpenSSL can't run scrypt with n=%d and r=%d, use the 'auto' KDF engine" % (n, r)
+        )
+    return hashlib.scrypt(
+        password,
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=scrypt_maxmem(n, r, p),
+        dklen=dklen,
+    )
+
+
+def derive_key(kdf, kdfparams, password, engine='auto'):
+    '''
+    Derive the key of a version 3 keyfile from its password, as eth-keyfile does.
+
+    Scrypt runs in OpenSSL with the ``'openssl'`` engine, and in eth-keyfile's
+    implementation otherwise.
+
+    :param str engine: one of :data:`KDF_ENGINES`
+    :raises ValueError: for a pbkdf2 pseudo-random function other than HMAC, or
+        scrypt parameters that the ``'openssl'`` engine can't run
+    :raises TypeError: for a key derivation function other than scrypt or pbkdf2
+    '''
+    _validate_engine(engine)
+    salt = decode_hex(kdfparams['salt'])
+    if kdf == 'pbkdf2':
+        return hashlib.pbkdf2_hmac(
+            _pbkdf2_hash_name(kdfparams),
+            password,
+            salt,
+            kdfparams['c'],
+            kdfparams['dklen'],
+        )
+    elif kdf == 'scrypt':
+        (n, r, p) = (kdfparams['n'], kdfparams['r'], kdfparams['p'])
+        return _scrypt(engine, password, salt, n, r, p, kdfparams['dklen'])
+    else:
+        raise TypeError("Unsupported key derivation function: {0}".format(kdf))
+
+
+def _pbkdf2_hash_name(kdfparams):
+    (should_be_hmac, _, hash_name) = kdfparams['prf'].partition('-')
+    if should_be_hmac != 'hmac':
+        raise ValueError("Unsupported pbkdf2 pseudo-random function: %r" % kdfparams['prf'])
+    return hash_name
+
+
+class _KDFHook(object):
+    '''
+    Runs the key derivation of eth-keyfile, while it is installed with
+    :func:`_kdf_hook` in the current thread. Scrypt runs on the chosen engine, and
+    derived keys are looked up in the cache first.
+
+    A key derived here is only added to the cache by :meth:`commit`, once
+    eth-keyfile confirmed it against the keyfile's MAC.
+    '''
+    def __init__(self, engine, cache=None):
+        _validate_engine(engine)
+        self.engine = engine
+        self.cache = cache
+        self._pending = None
+
+    def scrypt(self, password, salt, n, r, p, buflen):
+        return self._derive(
+            'scrypt',
+            {'dklen': buflen, 'n': n, 'r': r, 'p': p, 'salt': _encode_hex_no_prefix(salt)},
+            password,
+            lambda: _scrypt(self.engine, password, salt, n, r, p, buflen),
+        )
+
+    def pbkdf2(self, password, hash_name, salt, iterations, dklen):
+        kdfparams = {
+            'c': iterations,
+            'dklen': dklen,
+            'prf': 'hmac-' + hash_name,
+            'salt': _encode_hex_no_prefix(salt),
+        }
+        eth_keyfile_pbkdf2 = _eth_keyfile_function('_pbkdf2_hash')
+        return self._derive(
+            'pbkdf2',
+            kdfparams,
+            password,
+            lambda: eth_keyfile_pbkdf2(password, hash_name, salt, iterations, dklen),
+        )
+
+    def _derive(self, kdf, kdfparams, password, derive):
+        if self.cache is None:
+            return derive()
+        cache_key = self.cache.key(kdf, kdfparams, password)
+        derived_key = self.cache.get(cache_key)
+        if derived_key is None:
+            derived_key = derive()
+            self._pending = (cache_key, derived_key)
+        return derived_key
+
+    def commit(self):
+        if self._pending is not None:
+            self.cache.put(*self._pending)
+            self._pending = None
+
+
+# eth-keyfile looks its key derivation functions up as module globals. While a hook
+# is installed in any thread, they are swapped for dispatchers, which call the hook
+# installed in the current thread, or the original function in threads without one.
+_HOOKED_FUNCTIONS = {'_scrypt_hash': 'scrypt', '_pbkdf2_hash': 'pbkdf2'}
+
+_installed_hooks = threading.local()
+_dispatchers_lock = threading.Lock()
+_dispatcher_users = 0
+# name -> the function of eth-keyfile that a dispatcher stands in for
+_replaced_functions = {}
+
+
+def _eth_keyfile_function(name):
+    # eth-keyfile's own function, even while a dispatcher stands in for it
+    function = getattr(eth_keyfile_module, name)
+    return getattr(function, '__wrapped__', function)
+
+
+def _dispatcher(name, original):
+    hook_method = _HOOKED_FUNCTIONS[name]
+
+    def dispatch(*args, **kwargs):
+        hook = getattr(_installed_hooks, 'hook', None)
+        if hook is None:
+            return original(*args, **kwargs)
+        return getattr(hook, hook_method)(*args, **kwargs)
+
+    dispatch.__wrapped__ = original
+    return dispatch
+
+
+def _install_dispatchers():
+    global _dispatcher_users
+    with _dispatchers_lock:
+        if _dispatcher_users == 0:
+            if not all(hasattr(eth_keyfile_module, name) for name in _HOOKED_FUNCTIONS):
+                # this version of eth-keyfile derives keys some other way
+                return False
+            for name in _HOOKED_FUNCTIONS:
+                _replaced_functions[name] = getattr(eth_keyfile_module, name)
+                setattr(eth_keyfile_module, name, _dispatcher(name, _replaced_functions[name]))
+        _dispatcher_users += 1
+        return True
+
+
+def _remove_dispatchers():
+    global _dispatcher_users
+    with _dispatchers_lock:
+        _dispatcher_users -= 1
+        if _dispatcher_users == 0:
+            for name, original in _replaced_functions.items():
+                setattr(eth_keyfile_module, name, original)
+            _replaced_functions.clear()
+
+
+@contextlib.contextmanager
+def _kdf_hook(hook):
+    '''
+    Run eth-keyfile's key derivation through ``hook`` in the current thread, for the
+    duration of the block. eth-keyfile is only patched while a hook that changes
+    something is installed, and it is left alone otherwise.
+    '''
+    if hook.engine != 'openssl' and hook.cache is None:
+        # eth-keyfile would derive the key exactly the same way
+        yield hook
+        return
+    if not _install_dispatchers():
+        if hook.engine == 'openssl':
+            raise ValueError(
+                "eth-keyfile %s can't run scrypt in OpenSSL, use the 'auto' KDF engine" %
+                getattr(eth_keyfile, '__version__', '(this version)')
+            )
+        # the cache can't be consulted, so eth-keyfile derives the key
+        yield hook
+        return
+
+    previous = getattr(_installed_hooks, 'hook', None)
+    _installed_hooks.hook = hook
+    try:
+        yield hook
+    finally:
+        _installed_hooks.hook = previous
+        _remove_dispatchers()
+
+
+def _encode_hex_no_prefix(value):
+    return remove_0x_prefix(encode_hex(value))
+
+
+def create_keyfile_json(private_key, password, kdf, iterations=None, engine='auto'):
+    '''
+    Encrypt a private key into a version 3 keyfile with
+    :func:`eth_keyfile.create_keyfile_json`, running scrypt on the chosen engine.
+    '''
+    with _kdf_hook(_KDFHook(engine)):
+        return eth_keyfile.create_keyfile_json(
+            private_key,
+            password,
+            kdf=kdf,
+            iterations=iterations,
+        )
+
+
+def decode_keyfile_json(keyfile_json, password, engine='auto', cache=None):
+    '''
+    Decrypt the private key of a version 3 keyfile with
+    :func:`eth_keyfile.decode_keyfile_json`, running scrypt on the chosen engine.
+
+    :param cache: where to look up the derived key first, and to remember it once
+        the MAC confirms it
+    :type cache: ~eth_account._utils.caching.DerivedKeyCache or None
+    :raises ValueError: if the password is wrong
+    '''
+    keyfile = normalize_keys(keyfile_json)
+    crypto = keyfile.get('crypto', {})
+    if crypto.get('kdf') == 'pbkdf2':
+        # eth-keyfile only asserts this, which is skipped under python -O
+        _pbkdf2_hash_name(crypto['kdfparams'])
+
+    hook = _KDFHook(engine, cache)
+    with _kdf_hook(hook):
+        private_key = eth_keyfile.decode_keyfile_json(keyfile, password)
+    hook.commit()
+    return private_key
+
+
+def load_kdf_profile(profile):
+    '''
+    Read a profile written by :mod:`eth_account.kdf_calibrate`.
+
+    A profile file is only parsed again when its modification time or size changed,
+    so it can be looked up on every :meth:`~eth_account.account.Account.encrypt`.
+
+    :param profile: the path of the profile, or the already-loaded profile
+    :type profile: str or dict
+    :rtype: dict
+    '''
+    if is_dict(profile):
+        return profile
+    path = os.path.expanduser(profile)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _loaded_profiles.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with open(path) as profile_file:
+        loaded = json.load(profile_file)
+    _loaded_profiles[path] = (version, loaded)
+    return loaded
+
+
+def profile_iterations(profile, kdf):
+    '''
+    :returns: the work factor that the profile picked for the key derivation
+        function, or ``None`` if it has none for that function
+    '''
+    return load_kdf_profile(profile).get(kdf, {}).get('iterations')
+
+
+def profile_engine(profile, default):
+    '''
+    :returns: the KDF engine that the profile was measured with, or ``default`` if
+        it doesn't say
+    '''
+    engine = load_kdf_profile(profile).get('engine', default)
+    _validate_engine(engine)
+    return engine
@@ -0,0 +1,276 @@
+from collections import (
+    deque,
+)
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+import itertools
+import os
+import pickle
+
+DEFAULT_BATCH_SIZE = 256
+
+# Used as the memory budget for parallel key derivation, if the physical memory of
+# the host can't be found out.
+FALLBACK_MEMORY_BUDGET = 1024 ** 3
+
+# Accounts already loaded in this (worker) process, keyed by backend type and key bytes.
+# Kept small, so that a long-lived worker fed many distinct keys doesn't grow unbounded.
+_WORKER_ACCOUNTS = {}
+_MAX_WORKER_ACCOUNTS = 1024
+
+
+def chunked(iterable, size):
+    '''
+    Split an iterable into lists of at most ``size`` items, lazily.
+    '''
+    if size < 1:
+        raise ValueError("Batch size must be at least 1, got %r" % size)
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def executor_workers(executor, workers=None):
+    '''
+    The number of jobs that ``executor`` runs at once: ``workers`` if it is given.
+    Otherwise, the pool size that the :mod:`concurrent.futures` executors keep in a
+    private attribute, or for other executors, the number of CPUs.
+    '''
+    if workers is not None:
+        return workers
+    return getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+
+
+def imap_batches(executor, fn, batches, fn_args=(), workers=None, max_in_flight=None):
+    '''
+    Run ``fn(*fn_args, batch)`` for each batch on the executor, yielding the results
+    in the same order as ``batches``.
+
+    At most ``max_in_flight`` batches are submitted at any time, by default twice the
+    executor's ``workers`` (see :func:`executor_workers`), so ``batches`` may be a lazy
+    (or unbounded) iterator without buffering all of it in memory.
+    '''
+    if max_in_flight is None:
+        max_in_flight = 2 * executor_workers(executor, workers)
+
+    pending = deque()
+    batch_iter = iter(batches)
+    for batch in itertools.islice(batch_iter, max_in_flight):
+        pending.append(executor.submit(fn, *fn_args, batch))
+
+    while pending:
+        result = pending.popleft().result()
+        for batch in itertools.islice(batch_iter, 1):
+            pending.append(executor.submit(fn, *fn_args, batch))
+        yield result
+
+
+def imap_within_budget(executor, fn, jobs, budget, workers=None, max_in_flight=None):
+    '''
+    Run ``fn(*args)`` for each ``(cost, args)`` job on the executor, yielding the
+    results in the same order as ``jobs``.
+
+    Jobs are submitted in order, and only while the total cost of the jobs in flight
+    stays within ``budget``, so that, say, the memory they use together is bounded.
+    A job that costs more than the whole budget is run on its own. At most
+    ``max_in_flight`` jobs are submitted at any time, by default the executor's
+    ``workers`` (see :func:`executor_workers`).
+    '''
+    if max_in_flight is None:
+        max_in_flight = executor_workers(executor, workers)
+
+    # the cost and future of each submitted job, whose result isn't yielded yet
+    pending = deque()
+    cost_in_flight = 0
+    for cost, args in jobs:
+        while pending and (len(pending) >= max_in_flight or cost_in_flight + cost > budget):
+            (done_cost, future) = pending.popleft()
+            cost_in_flight -= done_cost
+            yield future.result()
+        pending.append((cost, executor.submit(fn, *args)))
+        cost_in_flight += cost
+
+    while pending:
+        (_, future) = pending.popleft()
+        yield future.result()
+
+
+def default_memory_budget():
+    '''
+    Half of the physical memory of the host, in bytes, or
+    :data:`FALLBACK_MEMORY_BUDGET` where that can't be found out.
+    '''
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE') // 2
+    except (AttributeError, ValueError, OSError):
+        return FALLBACK_MEMORY_BUDGET
+
+
+def map_capturing_exceptions(fn, items):
+    '''
+    Apply ``fn`` to every item, returning either the result or the exception
+    raised for each item, in order.
+    '''
+    results = []
+    for item in items:
+        try:
+            results.append(fn(item))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+def raise_first_exception(results):
+    '''
+    Raise the first exception found in ``results``, or return ``results`` unchanged.
+    '''
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+    return results
+
+
+class _ExceptionProxy(object):
+    '''
+    Carries an exception back from a worker process, for exception types that can't
+    be unpickled directly, like those whose ``__init__`` takes extra arguments.
+    '''
+    def __init__(self, exc):
+        self.exc_type = type(exc)
+        self.args = exc.args
+        self.state = vars(exc)
+
+    def restore(self):
+        exc = self.exc_type.__new__(self.exc_type)
+        exc.args = self.args
+        exc.__dict__.update(self.state)
+        return exc
+
+
+def _portable_exception(exc):
+    try:
+        pickle.loads(pickle.dumps(exc))
+    except Exception:
+        proxy = _ExceptionProxy(exc)
+        try:
+            pickle.dumps(proxy)
+        except Exception:
+            return RuntimeError("%s: %s" % (type(exc).__name__, exc))
+        return proxy
+    else:
+        return exc
+
+
+def portable_results(results):
+    '''
+    Prepare a worker's results, where some may be exceptions, for sending them back to
+    the parent process. Undo with :func:`restore_results`.
+    '''
+    return [
+        _portable_exception(result) if isinstance(result, Exception) else result
+        for result in results
+    ]
+
+
+def restore_results(results):
+    return [
+        result.restore() if isinstance(result, _ExceptionProxy) else result
+        for result in results
+    ]
+
+
+def process_pool(workers):
+    if workers < 1:
+        raise ValueError("Number of workers must be at least 1, got %r" % workers)
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _load_worker_account(backend, key_bytes):
+    cache_key = (type(backend), key_bytes)
+    try:
+        return _WORKER_ACCOUNTS[cache_key]
+    except KeyError:
+        # imported here to avoid a circular import: eth_account.account uses this module
+        from eth_account.account import Account
+
+        account_api = Account()
+        account_api.setKeyBackend(backend)
+
+        if len(_WORKER_ACCOUNTS) >= _MAX_WORKER_ACCOUNTS:
+            _WORKER_ACCOUNTS.clear()
+        account = account_api.privateKeyToAccount(key_bytes)
+        _WORKER_ACCOUNTS[cache_key] = account
+        return account
+
+
+def sign_transaction_batch(backend, key_bytes, raw_bytes, transaction_dicts):
+    '''
+    Worker entry point: sign a batch of transactions with one key.
+
+    Only the eth-keys backend and the raw key are sent to the worker, and the key is
+    loaded once per worker process and reused across batches. Results are returned
+    as plain dicts (or the exception raised for that transaction), because they have
+    to be pickled back to the parent process. Their bytes fields are
+    :class:`~hexbytes.main.HexBytes`, or plain :class:`bytes` if ``raw_bytes`` is set.
+    '''
+    account = _load_worker_account(backend, key_bytes)
+    sign = account._publicapi._signTransactionWithAccount
+    return portable_results(map_capturing_exceptions(
+        lambda transaction_dict: dict(sign(account, transaction_dict, raw_bytes=raw_bytes)),
+        transaction_dicts,
+    ))
+
+
+def recover_transaction_batch(backend, serialized_transactions):
+    '''
+    Worker entry point: recover the sender of each transaction in a batch. Returns
+    the addresses, or the exception raised for each transaction.
+    '''
+    # imported here to avoid a circular import: eth_account.account uses this module
+    from eth_account.account import Account
+
+    account_api = Account()
+    account_api.setKeyBackend(backend)
+    return portable_results(account_api._recoverTransactionBatch(serialized_transactions))
+
+
+def create_key_batch(extra_key_bytes, count):
+    '''
+    Worker entry point: create ``count`` new keys. Returns the packed keys and the
+    packed addresses, as in :meth:`~eth_account.account.Account._createKeyBatch`.
+    '''
+    # imported here to avoid a circular import: eth_account.account uses this module
+    from eth_account.account import Account
+
+    return Account._createKeyBatch(count, extra_key_bytes)
+
+
+def decrypt_keyfile(keyfile_json, password_bytes, kdf_engine):
+    '''
+    Worker entry point: decrypt one keyfile. Returns the private key, or the
+    exception raised.
+    '''
+    # imported here to avoid a circular import: eth_account.account uses this module
+    from eth_account.account import Account
+
+    account_api = Account()
+    account_api.kdf_engine = kdf_engine
+    try:
+        return account_api.decrypt(keyfile_json, password_bytes)
+    except Exception as exc:
+        return _portable_exception(exc)
+
+
+def call_account_method(account_api, method_name, args, kwargs):
+    '''
+    Executor entry point: call one method of the account API. Returns the result, or
+    the exception raised, in a list that :func:`restore_results` undoes.
+    '''
+    return portable_results(map_capturing_exceptions(
+        lambda method: method(*args, **kwargs),
+        [getattr(account_api, method_name)],
+    ))
@@ -0,0 +1,154 @@
+'''
+Minimal RLP primitives for the fixed shapes used by legacy transactions.
+
+These work directly on ``int`` and ``bytes`` values, skipping the generic sedes
+machinery in :mod:`rlp`, but produce exactly the same bytes as :func:`rlp.encode`.
+The decoders only locate items, as offsets into the encoded bytes, and accept
+exactly the canonical encodings that :func:`rlp.decode` accepts.
+'''
+from rlp.exceptions import (
+    DecodingError,
+    ListDeserializationError,
+    SerializationError,
+)
+
+SHORT_STRING_OFFSET = 0x80
+SHORT_LIST_OFFSET = 0xc0
+# payloads at least this long get a length-of-length prefix, after offset + 55
+SHORT_LENGTH_LIMIT = 56
+
+EMPTY_STRING = bytes([SHORT_STRING_OFFSET])
+
+# single byte integers 1..127 encode as themselves, but zero is the empty string
+_SMALL_INTS = (EMPTY_STRING,) + tuple(bytes([value]) for value in range(1, SHORT_STRING_OFFSET))
+
+
+def _encode_length(length, offset):
+    if length < SHORT_LENGTH_LIMIT:
+        return bytes([offset + length])
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, 'big')
+    return bytes([offset + SHORT_LENGTH_LIMIT - 1 + len(length_bytes)]) + length_bytes
+
+
+def encode_bytes(value):
+    '''
+    RLP-encode a byte string.
+    '''
+    if len(value) == 1 and value[0] < SHORT_STRING_OFFSET:
+        return bytes(value)
+    return _encode_length(len(value), SHORT_STRING_OFFSET) + value
+
+
+def encode_int(value):
+    '''
+    RLP-encode a non-negative integer, as a big-endian byte string without leading zeros.
+    '''
+    if value < SHORT_STRING_OFFSET:
+        if value < 0:
+            raise SerializationError("Cannot serialize negative integers", value)
+        return _SMALL_INTS[value]
+    return encode_bytes(value.to_bytes((value.bit_length() + 7) // 8, 'big'))
+
+
+def encode_list(*encoded_items):
+    '''
+    RLP-encode a list, given the already-encoded items.
+
+    The list header is computed from the total payload length, and the result is
+    assembled with a single allocation of the final size.
+    '''
+    payload_length = sum(map(len, encoded_items))
+    return b''.join((_encode_length(payload_length, SHORT_LIST_OFFSET),) + encoded_items)
+
+
+def decode_item(data, start=0, end=None):
+    '''
+    Locate the RLP item that begins at ``start`` in ``data``, without copying it.
+
+    :param data: the encoded bytes, which may be a :class:`memoryview`
+    :param int start: the offset of the item's first byte
+    :param int end: the offset that the item must not extend past, by default the
+        end of ``data``
+    :returns: whether the item is a list, and the offsets of the start and end of
+        its payload
+    :rtype: (bool, int, int)
+    :raises DecodingError: if the item is truncated or not canonically encoded
+    '''
+    if end is None:
+        end = len(data)
+    if start >= end:
+        raise DecodingError("RLP string too short", data)
+
+    prefix = data[start]
+    if prefix < SHORT_STRING_OFFSET:
+        return (False, start, start + 1)
+    elif prefix < SHORT_LIST_OFFSET:
+        (is_list, short_length) = (False, prefix - SHORT_STRING_OFFSET)
+    else:
+        (is_list, short_length) = (True, prefix - SHORT_LIST_OFFSET)
+
+    if short_length < SHORT_LENGTH_LIMIT:
+        payload_start = start + 1
+        length = short_length
+        if length == 1 and not is_list and payload_start < end:
+            if data[payload_start] < SHORT_STRING_OFFSET:
+                raise DecodingError("Single byte not encoded as itself", data)
+    else:
+        payload_start = start + 1 + short_length - (SHORT_LENGTH_LIMIT - 1)
+        if payload_start > end:
+            raise DecodingError("RLP string too short", data)
+        if data[start + 1] == 0:
+            raise DecodingError("Length starts with zero bytes", data)
+        length = int.from_bytes(data[start + 1:payload_start], 'big')
+        if length < SHORT_LENGTH_LIMIT:
+            raise DecodingError("Long length used for a short payload", data)
+
+    payload_end = payload_start + length
+    if payload_end > end:
+        raise DecodingError("RLP string too short", data)
+    return (is_list, payload_start, payload_end)
+
+
+def _validate_list_payload(data, start, end):
+    position = start
+    while position < end:
+        (is_list, payload_start, item_end) = decode_item(data, position, end)
+        if is_list:
+            _validate_list_payload(data, payload_start, item_end)
+        position = item_end
+
+
+def decode_list(data):
+    '''
+    Locate the items of the RLP list that makes up all of ``data``, without copying
+    or decoding them.
+
+    Items that are lists themselves are checked all the way down, so that any
+    invalid RLP raises :class:`~rlp.exceptions.DecodingError`, as :func:`rlp.decode`
+    would, before the caller looks at the items.
+
+    :returns: for each item, whether it is a list, the offset where its encoding
+        starts, and the offsets of the start and end of its payload
+    :rtype: list((bool, int, int, int))
+    :raises DecodingError: if ``data`` is not exactly one canonically encoded item
+    :raises ListDeserializationError: if that item is a string rather than a list,
+        like a :class:`rlp.sedes.List` deserializing it
+    '''
+    (is_list, payload_start, payload_end) = decode_item(data)
+    if payload_end != len(data):
+        raise DecodingError(
+            "RLP string ends with %d superfluous bytes" % (len(data) - payload_end),
+            data,
+        )
+    if not is_list:
+        raise ListDeserializationError("Can only deserialize sequences", data)
+
+    items = []
+    position = payload_start
+    while position < payload_end:
+        (item_is_list, item_payload_start, item_end) = decode_item(data, position, payload_end)
+        if item_is_list:
+            _validate_list_payload(data, item_payload_start, item_end)
+        items.append((item_is_list, position, item_payload_start, item_end))
+        position = item_end
+    return items
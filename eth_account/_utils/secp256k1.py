@@ -0,0 +1,390 @@
+'''
+Pure-Python secp256k1 arithmetic, tuned for CPython.
+
+- Points are kept in Jacobian coordinates ``(X, Y, Z)`` between operations, so that
+  no modular inversion is needed until the final conversion to affine coordinates.
+  ``Z == 0`` is the point at infinity. Affine points are ``(x, y)`` tuples.
+- Multiples of the generator use a precomputed fixed-base comb.
+- Other multiples use width-w NAF, with the scalar split in two half-length scalars
+  by the GLV endomorphism ``lambda * (x, y) == (beta * x, y)``.
+- ``u1 * G + u2 * Q`` (verification and public key recovery) interleaves all the
+  half-length scalars in a single doubling chain (Shamir's trick).
+- Several Jacobian points can be normalized with one shared modular inversion
+  (Montgomery's trick).
+'''
+from eth_keys.constants import (
+    SECPK1_B as B,
+    SECPK1_N as N,
+    SECPK1_P as P,
+    SECPK1_Gx as Gx,
+    SECPK1_Gy as Gy,
+)
+
+G = (Gx, Gy)
+INFINITY = (0, 1, 0)
+
+# GLV endomorphism: BETA is a cube root of unity mod P, LAMBDA the matching one mod N,
+# and (A1, B1), (A2, B2) a short basis of the lattice {(a, b): a + b * LAMBDA == 0 mod N}
+BETA = 0x7ae96a2b657c07106e64479eac3434e99cf0497512f58995c1396c28719501ee
+LAMBDA = 0x5363ad4cc05c30e0a5261c028812645a122e22ea20816678df02967c1b23bd72
+A1 = 0x3086d221a7d46bcde86c90e49284eb15
+B1 = -0xe4437ed6010e88286f547fa90abfe4c3
+A2 = 0x114ca50f7a8e2f3f657c1108d9d44cfd8
+B2 = A1
+
+# Comb parameters for the generator: TEETH bits are combined per table lookup,
+# using COMB_TABLES tables, so a 256-bit multiplication takes COMB_COLUMNS doublings
+# and COMB_TABLES * COMB_COLUMNS additions. multiply_generator() reads the comb
+# columns a byte at a time, so COMB_COLUMNS must stay 8.
+COMB_TEETH = 8
+COMB_TABLES = 4
+COMB_SPACING = 256 // COMB_TEETH  # bits between teeth
+COMB_COLUMNS = COMB_SPACING // COMB_TABLES
+
+# wNAF window widths: the generator's precomputed tables can afford a wider window
+VARIABLE_BASE_WINDOW = 5
+GENERATOR_WINDOW = 8
+
+# SPREAD[byte] has bit i of the byte moved to bit 8 * i, to transpose comb columns
+_SPREAD = tuple(
+    sum(((byte >> bit) & 1) << (8 * bit) for bit in range(8))
+    for byte in range(256)
+)
+
+_comb_tables = None
+_generator_wnaf_tables = None
+
+
+def inverse_mod(value, modulus):
+    if value % modulus == 0:
+        raise ZeroDivisionError("%d has no inverse modulo %d" % (value, modulus))
+    return pow(value, modulus - 2, modulus)
+
+
+def batch_inverse(values, modulus):
+    '''
+    Invert every value modulo the (prime) modulus, with a single modular exponentiation
+    and three multiplications per value (Montgomery's trick).
+    '''
+    prefix_products = []
+    accumulator = 1
+    for value in values:
+        prefix_products.append(accumulator)
+        accumulator = accumulator * value % modulus
+
+    accumulator_inverse = inverse_mod(accumulator, modulus)
+    inverses = [0] * len(prefix_products)
+    for index in range(len(prefix_products) - 1, -1, -1):
+        inverses[index] = accumulator_inverse * prefix_products[index] % modulus
+        accumulator_inverse = accumulator_inverse * values[index] % modulus
+    return inverses
+
+
+def jacobian_double(point):
+    (X1, Y1, Z1) = point
+    if not Y1 or not Z1:
+        return INFINITY
+    XX = X1 * X1 % P
+    YY = Y1 * Y1 % P
+    YYYY = YY * YY % P
+    S = 2 * ((X1 + YY) ** 2 - XX - YYYY) % P
+    M = 3 * XX % P
+    X3 = (M * M - 2 * S) % P
+    Y3 = (M * (S - X3) - 8 * YYYY) % P
+    Z3 = 2 * Y1 * Z1 % P
+    return (X3, Y3, Z3)
+
+
+def jacobian_add_affine(point, affine):
+    '''
+    Add an affine point (which must not be the point at infinity) to a Jacobian point.
+    '''
+    (X1, Y1, Z1) = point
+    (x2, y2) = affine
+    if not Z1:
+        return (x2, y2, 1)
+    Z1Z1 = Z1 * Z1 % P
+    H = (x2 * Z1Z1 - X1) % P
+    R = 2 * (y2 * Z1 * Z1Z1 - Y1) % P
+    if not H:
+        if not R:
+            return jacobian_double(point)
+        return INFINITY
+    HH = H * H % P
+    I = 4 * HH  # noqa: E741
+    J = H * I % P
+    V = X1 * I % P
+    X3 = (R * R - J - 2 * V) % P
+    Y3 = (R * (V - X3) - 2 * Y1 * J) % P
+    Z3 = ((Z1 + H) ** 2 - Z1Z1 - HH) % P
+    return (X3, Y3, Z3)
+
+
+def jacobian_add(point1, point2):
+    (X1, Y1, Z1) = point1
+    (X2, Y2, Z2) = point2
+    if not Z1:
+        return point2
+    if not Z2:
+        return point1
+    Z1Z1 = Z1 * Z1 % P
+    Z2Z2 = Z2 * Z2 % P
+    U1 = X1 * Z2Z2 % P
+    S1 = Y1 * Z2 * Z2Z2 % P
+    H = (X2 * Z1Z1 - U1) % P
+    R = 2 * (Y2 * Z1 * Z1Z1 - S1) % P
+    if not H:
+        if not R:
+            return jacobian_double(point1)
+        return INFINITY
+    I = 4 * H * H % P  # noqa: E741
+    J = H * I % P
+    V = U1 * I % P
+    X3 = (R * R - J - 2 * V) % P
+    Y3 = (R * (V - X3) - 2 * S1 * J) % P
+    Z3 = ((Z1 + Z2) ** 2 - Z1Z1 - Z2Z2) * H % P
+    return (X3, Y3, Z3)
+
+
+def to_affine(point):
+    (X, Y, Z) = point
+    if not Z:
+        raise ValueError("The point at infinity has no affine coordinates")
+    Z_inverse = inverse_mod(Z, P)
+    Z_inverse_squared = Z_inverse * Z_inverse % P
+    return (X * Z_inverse_squared % P, Y * Z_inverse_squared * Z_inverse % P)
+
+
+def batch_to_affine(points):
+    '''
+    Convert many Jacobian points to affine coordinates, sharing a single inversion.
+    '''
+    Z_inverses = batch_inverse([Z for (_, _, Z) in points], P)
+    affine_points = []
+    for (X, Y, _), Z_inverse in zip(points, Z_inverses):
+        Z_inverse_squared = Z_inverse * Z_inverse % P
+        affine_points.append((X * Z_inverse_squared % P, Y * Z_inverse_squared * Z_inverse % P))
+    return affine_points
+
+
+def is_on_curve(affine):
+    (x, y) = affine
+    return 0 <= x < P and 0 <= y < P and (y * y - x * x * x - B) % P == 0
+
+
+def lift_x(x, is_odd):
+    '''
+    Find the curve point with the given x coordinate and y parity, or ``None`` if
+    ``x`` is not the x coordinate of any point.
+    '''
+    y_squared = (x * x * x + B) % P
+    y = pow(y_squared, (P + 1) // 4, P)
+    if y * y % P != y_squared:
+        return None
+    if (y & 1) != is_odd:
+        y = P - y
+    return (x, y)
+
+
+def endomorphism(affine):
+    (x, y) = affine
+    return (BETA * x % P, y)
+
+
+def glv_split(scalar):
+    '''
+    Split ``scalar`` into ``(k1, k2)`` of about 128 bits each (either may be negative),
+    such that ``k1 + k2 * LAMBDA == scalar (mod N)``.
+    '''
+    c1 = (B2 * scalar + N // 2) // N
+    c2 = (-B1 * scalar + N // 2) // N
+    k1 = scalar - c1 * A1 - c2 * A2
+    k2 = -c1 * B1 - c2 * B2
+    return (k1, k2)
+
+
+def wnaf(scalar, width):
+    '''
+    Width-w non-adjacent form of a non-negative scalar, least significant digit first.
+    Every nonzero digit is odd and less than ``2 ** (width - 1)`` in absolute value.
+    '''
+    window = 1 << width
+    half_window = window >> 1
+    digits = []
+    while scalar:
+        if scalar & 1:
+            digit = scalar & (window - 1)
+            if digit >= half_window:
+                digit -= window
+            scalar -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        scalar >>= 1
+    return digits
+
+
+def odd_multiples(affine, width):
+    '''
+    The affine points ``P, 3P, 5P, ...`` up to ``(2 ** (width - 1) - 1) * P``.
+    '''
+    count = 1 << (width - 2)
+    point = (affine[0], affine[1], 1)
+    double = jacobian_double(point)
+    multiples = [point]
+    for _ in range(count - 1):
+        multiples.append(jacobian_add(multiples[-1], double))
+    return batch_to_affine(multiples)
+
+
+def _negated(points):
+    return [(x, P - y) for (x, y) in points]
+
+
+def _signed_tables(positive, negative, scalar):
+    if scalar < 0:
+        return (-scalar, negative, positive)
+    else:
+        return (scalar, positive, negative)
+
+
+def _interleaved_wnaf(terms):
+    '''
+    Sum of ``scalar * point`` for each ``(scalar, width, positive, negative)`` term,
+    where ``positive`` holds the odd multiples of the point and ``negative`` their
+    negations, using a single shared doubling chain.
+    '''
+    digit_tables = [
+        (wnaf(scalar, width), positive, negative)
+        for (scalar, width, positive, negative) in terms
+    ]
+    result = INFINITY
+    for index in range(max(len(digits) for (digits, _, _) in digit_tables) - 1, -1, -1):
+        result = jacobian_double(result)
+        for (digits, positive, negative) in digit_tables:
+            if index < len(digits):
+                digit = digits[index]
+                if digit > 0:
+                    result = jacobian_add_affine(result, positive[digit >> 1])
+                elif digit < 0:
+                    result = jacobian_add_affine(result, negative[-digit >> 1])
+    return result
+
+
+def _glv_terms(scalar, width, multiples, negated_multiples, endomorphism_multiples,
+               negated_endomorphism_multiples):
+    (k1, k2) = glv_split(scalar)
+    (k1, positive1, negative1) = _signed_tables(multiples, negated_multiples, k1)
+    (k2, positive2, negative2) = _signed_tables(
+        endomorphism_multiples,
+        negated_endomorphism_multiples,
+        k2,
+    )
+    return [(k1, width, positive1, negative1), (k2, width, positive2, negative2)]
+
+
+def _generator_tables():
+    global _generator_wnaf_tables
+    if _generator_wnaf_tables is None:
+        multiples = odd_multiples(G, GENERATOR_WINDOW)
+        endomorphism_multiples = [endomorphism(point) for point in multiples]
+        _generator_wnaf_tables = (
+            multiples,
+            _negated(multiples),
+            endomorphism_multiples,
+            _negated(endomorphism_multiples),
+        )
+    return _generator_wnaf_tables
+
+
+def _comb():
+    '''
+    Comb tables for G: ``tables[t][index]`` is the sum, over each bit ``i`` set in
+    ``index``, of ``2 ** (i * COMB_SPACING + t * COMB_COLUMNS) * G``.
+    '''
+    global _comb_tables
+    if _comb_tables is None:
+        powers_of_two = [(G[0], G[1], 1)]
+        for _ in range(255):
+            powers_of_two.append(jacobian_double(powers_of_two[-1]))
+
+        tables = []
+        for table in range(COMB_TABLES):
+            entries = [INFINITY]
+            for tooth in range(COMB_TEETH):
+                tooth_point = powers_of_two[tooth * COMB_SPACING + table * COMB_COLUMNS]
+                entries.extend([jacobian_add(entry, tooth_point) for entry in entries])
+            tables.append([None] + batch_to_affine(entries[1:]))
+        _comb_tables = tables
+    return _comb_tables
+
+
+def multiply_generator(scalar):
+    '''
+    ``scalar * G`` in Jacobian coordinates, for ``0 <= scalar < 2 ** 256``.
+    '''
+    tables = _comb()
+    scalar_bytes = scalar.to_bytes(32, 'little')
+
+    # columns[t] packs, for each column c, the comb index of table t in its byte c
+    columns = []
+    for table in range(COMB_TABLES):
+        packed = 0
+        for tooth in range(COMB_TEETH):
+            packed |= _SPREAD[scalar_bytes[tooth * COMB_TABLES + table]] << tooth
+        columns.append(packed)
+
+    result = INFINITY
+    for column in range(COMB_COLUMNS - 1, -1, -1):
+        result = jacobian_double(result)
+        shift = 8 * column
+        for table in range(COMB_TABLES):
+            index = (columns[table] >> shift) & 0xff
+            if index:
+                result = jacobian_add_affine(result, tables[table][index])
+    return result
+
+
+def multiply(affine, scalar):
+    '''
+    ``scalar * point`` in Jacobian coordinates, for an affine point on the curve.
+    '''
+    scalar %= N
+    if not scalar:
+        return INFINITY
+    multiples = odd_multiples(affine, VARIABLE_BASE_WINDOW)
+    endomorphism_multiples = [endomorphism(point) for point in multiples]
+    terms = _glv_terms(
+        scalar,
+        VARIABLE_BASE_WINDOW,
+        multiples,
+        _negated(multiples),
+        endomorphism_multiples,
+        _negated(endomorphism_multiples),
+    )
+    return _interleaved_wnaf(terms)
+
+
+def multiply_two(generator_scalar, affine, point_scalar):
+    '''
+    ``generator_scalar * G + point_scalar * point`` in Jacobian coordinates.
+    '''
+    generator_scalar %= N
+    point_scalar %= N
+    terms = []
+    if generator_scalar:
+        terms.extend(_glv_terms(generator_scalar, GENERATOR_WINDOW, *_generator_tables()))
+    if point_scalar:
+        multiples = odd_multiples(affine, VARIABLE_BASE_WINDOW)
+        endomorphism_multiples = [endomorphism(point) for point in multiples]
+        terms.extend(_glv_terms(
+            point_scalar,
+            VARIABLE_BASE_WINDOW,
+            multiples,
+            _negated(multiples),
+            endomorphism_multiples,
+            _negated(endomorphism_multiples),
+        ))
+    if not terms:
+        return INFINITY
+    return _interleaved_wnaf(terms)
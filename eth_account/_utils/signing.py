@@ -3,6 +3,7 @@ from cytoolz import (
     pipe,
 )
 from eth_utils import (
+    keccak,
     to_bytes,
     to_int,
     to_text,
@@ -14,10 +15,15 @@ from eth_account._utils.structured_data.hashing import (
     load_and_validate_structured_message,
 )
 from eth_account._utils.transactions import (
+    UNSIGNED_TRANSACTION_FIELDS,
     ChainAwareUnsignedTransaction,
     UnsignedTransaction,
-    encode_transaction,
-    serializable_unsigned_transaction_from_dict,
+    assert_valid_fields,
+    encode_signed_transaction,
+    encode_signing_payload,
+    encode_unsigned_fields,
+    locate_signed_transaction_fields,
+    normalize_transaction_fields,
     strip_signature,
 )
 
@@ -31,22 +37,26 @@ STRUCTURED_DATA_SIGN_VERSION = b'\x01'  # Hex value 0x01
 
 
 def sign_transaction_dict(eth_key, transaction_dict):
-    # generate RLP-serializable transaction, with defaults filled
-    unsigned_transaction = serializable_unsigned_transaction_from_dict(transaction_dict)
+    # validate the transaction, then fill defaults and convert the fields
+    assert_valid_fields(transaction_dict)
+    fields = normalize_transaction_fields(transaction_dict)
 
-    transaction_hash = unsigned_transaction.hash()
+    # encode the fields shared by the signing payload and the signed transaction only once
+    unsigned_body = encode_unsigned_fields(*fields[:len(UNSIGNED_TRANSACTION_FIELDS)])
 
     # detect chain
-    if isinstance(unsigned_transaction, UnsignedTransaction):
+    if len(fields) == len(UNSIGNED_TRANSACTION_FIELDS):
         chain_id = None
     else:
-        chain_id = unsigned_transaction.v
+        chain_id = fields[len(UNSIGNED_TRANSACTION_FIELDS)]
+
+    transaction_hash = keccak(encode_signing_payload(unsigned_body, chain_id))
 
     # sign with private key
     (v, r, s) = sign_transaction_hash(eth_key, transaction_hash, chain_id)
 
     # serialize transaction with rlp
-    encoded_transaction = encode_transaction(unsigned_transaction, vrs=(v, r, s))
+    encoded_transaction = encode_signed_transaction(unsigned_body, vrs=(v, r, s))
 
     return (v, r, s, encoded_transaction)
 
@@ -117,6 +127,32 @@ def hash_of_signed_transaction(txn_obj):
     return signable_transaction.hash()
 
 
+def hash_and_vrs_of_serialized_transaction(txn_bytes):
+    '''
+    Regenerate the hash of a serialized signed transaction, as
+    :func:`hash_of_signed_transaction` does for a decoded one, and extract its signature.
+
+    The encodings of the six unsigned fields are sliced straight out of the
+    serialized transaction and re-wrapped with the chain ID, so none of the fields
+    are decoded or re-encoded.
+
+    :param txn_bytes: the complete signed transaction
+    :type txn_bytes: bytes or memoryview
+    :returns: the hash that was signed, and the ``(v, r, s)`` of the signature
+    '''
+    field_offsets = locate_signed_transaction_fields(txn_bytes)
+    (v, r, s) = (
+        int.from_bytes(txn_bytes[value_start:value_end], 'big')
+        for (_, value_start, value_end) in field_offsets[len(UNSIGNED_TRANSACTION_FIELDS):]
+    )
+    (chain_id, _v) = extract_chain_id(v)
+
+    unsigned_start = field_offsets[0][0]
+    unsigned_end = field_offsets[len(UNSIGNED_TRANSACTION_FIELDS) - 1][2]
+    unsigned_body = txn_bytes[unsigned_start:unsigned_end]
+    return (keccak(encode_signing_payload(unsigned_body, chain_id)), (v, r, s))
+
+
 def extract_chain_id(raw_v):
     '''
     Extracts chain ID, according to EIP-155
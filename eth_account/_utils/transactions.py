@@ -2,17 +2,13 @@ import itertools
 
 from cytoolz import (
     curry,
-    dissoc,
     identity,
     merge,
-    partial,
-    pipe,
 )
 from eth_rlp import (
     HashableRLP,
 )
 from eth_utils.curried import (
-    apply_formatters_to_dict,
     apply_one_of_formatters,
     hexstr_if_str,
     is_0x_prefixed,
@@ -24,35 +20,149 @@ from eth_utils.curried import (
     to_bytes,
     to_int,
 )
-import rlp
+from rlp.exceptions import (
+    DeserializationError,
+    ListDeserializationError,
+    ListSerializationError,
+    ObjectDeserializationError,
+    ObjectSerializationError,
+    SerializationError,
+)
 from rlp.sedes import (
     Binary,
     big_endian_int,
     binary,
 )
 
+from eth_account._utils.addresses import (
+    is_recent_checksum_address,
+)
+from eth_account._utils.raw_rlp import (
+    EMPTY_STRING,
+    decode_list,
+    encode_bytes,
+    encode_int,
+    encode_list,
+)
+
 
 def serializable_unsigned_transaction_from_dict(transaction_dict):
     assert_valid_fields(transaction_dict)
-    filled_transaction = pipe(
-        transaction_dict,
-        dict,
-        partial(merge, TRANSACTION_DEFAULTS),
-        chain_id_to_v,
-        apply_formatters_to_dict(TRANSACTION_FORMATTERS),
-    )
-    if 'v' in filled_transaction:
-        serializer = Transaction
+    fields = normalize_transaction_fields(transaction_dict)
+    if len(fields) == len(UNSIGNED_TRANSACTION_FIELDS):
+        return UnsignedTransaction(*fields)
     else:
-        serializer = UnsignedTransaction
-    return serializer.from_dict(filled_transaction)
+        return Transaction(*fields)
 
 
 def encode_transaction(unsigned_transaction, vrs):
+    unsigned_body = encode_unsigned_fields(*strip_signature(unsigned_transaction))
+    return encode_signed_transaction(unsigned_body, vrs)
+
+
+def field_serialization_error(field, obj, element_exception):
+    '''
+    The error that :func:`rlp.encode` raises when a field of a :class:`Transaction`
+    can't be serialized, so that the direct encoders raise the same
+    :class:`~rlp.exceptions.ObjectSerializationError`, naming the same field.
+    '''
+    list_exception = ListSerializationError(
+        obj=obj,
+        element_exception=element_exception,
+        index=Transaction._meta.field_names.index(field),
+    )
+    return ObjectSerializationError(obj=obj, sedes=Transaction, list_exception=list_exception)
+
+
+def encode_int_field(field, value):
+    '''
+    RLP-encode the integer ``value`` of the transaction field ``field``.
+
+    :raises ~rlp.exceptions.ObjectSerializationError: if the value is negative
+    '''
+    try:
+        return encode_int(value)
+    except SerializationError as exc:
+        raise field_serialization_error(field, value, exc)
+
+
+def _encode_to(to):
+    if len(to) not in (0, 20):
+        raise SerializationError("'to' must be empty or exactly 20 bytes", to)
+    return encode_bytes(to)
+
+
+_UNSIGNED_FIELD_ENCODERS = (
+    encode_int,
+    encode_int,
+    encode_int,
+    _encode_to,
+    encode_int,
+    encode_bytes,
+)
+
+
+def _field_error(fields, names, encoders):
+    # encoding ``fields`` failed: encode them again, one by one, to name the culprit
+    for field, encode, val in zip(names, encoders, fields):
+        try:
+            encode(val)
+        except SerializationError as exc:
+            return field_serialization_error(field, fields, exc)
+
+
+def encode_unsigned_fields(nonce, gasPrice, gas, to, value, data):
+    '''
+    RLP-encode the six fields that the signing payload and the signed transaction
+    have in common, so that they can be encoded once and shared by both.
+
+    :returns: the concatenated item encodings, without a list header
+    :raises ~rlp.exceptions.ObjectSerializationError: if a field can't be serialized,
+        like :func:`rlp.encode` on an :class:`UnsignedTransaction`
+    '''
+    try:
+        return b''.join((
+            encode_int(nonce),
+            encode_int(gasPrice),
+            encode_int(gas),
+            _encode_to(to),
+            encode_int(value),
+            encode_bytes(data),
+        ))
+    except SerializationError:
+        raise _field_error(
+            (nonce, gasPrice, gas, to, value, data),
+            UnsignedTransaction._meta.field_names,
+            _UNSIGNED_FIELD_ENCODERS,
+        )
+
+
+def encode_signing_payload(unsigned_body, chain_id):
+    '''
+    The serialized transaction whose hash gets signed: the unsigned fields, plus
+    ``(chain_id, 0, 0)`` if the transaction is bound to a chain (see EIP 155).
+    '''
+    if chain_id is None:
+        return encode_list(unsigned_body)
+    else:
+        # the chain ID takes the place of v, which is what rlp reports it as
+        return encode_list(
+            unsigned_body,
+            encode_int_field('v', chain_id),
+            EMPTY_STRING,
+            EMPTY_STRING,
+        )
+
+
+def encode_signed_transaction(unsigned_body, vrs):
+    '''
+    The serialized signed transaction, ready for broadcast.
+    '''
     (v, r, s) = vrs
-    chain_naive_transaction = dissoc(unsigned_transaction.as_dict(), 'v', 'r', 's')
-    signed_transaction = Transaction(v=v, r=r, s=s, **chain_naive_transaction)
-    return rlp.encode(signed_transaction)
+    try:
+        return encode_list(unsigned_body, encode_int(v), encode_int(r), encode_int(s))
+    except SerializationError:
+        raise _field_error(tuple(vrs), ('v', 'r', 's'), (encode_int,) * 3)
 
 
 def is_int_or_prefixed_hexstr(val):
@@ -69,6 +179,8 @@ def is_empty_or_checksum_address(val):
         return True
     elif is_binary_address(val):
         return True
+    elif isinstance(val, str):
+        return is_recent_checksum_address(val)
     elif is_checksum_address(val):
         return True
     else:
@@ -126,20 +238,31 @@ REQUIRED_TRANSACITON_KEYS = ALLOWED_TRANSACTION_KEYS.difference(TRANSACTION_DEFA
 
 
 def assert_valid_fields(transaction_dict):
+    # check for missing keys, extra keys and invalid values in a single pass over the fields
+    required_present = 0
+    superfluous_keys = set()
+    invalid = {}
+    for key, val in transaction_dict.items():
+        is_valid = TRANSACTION_VALID_VALUES.get(key)
+        if is_valid is None:
+            superfluous_keys.add(key)
+            continue
+        if key in REQUIRED_TRANSACITON_KEYS:
+            required_present += 1
+        if not is_valid(val):
+            invalid[key] = val
+
     # check if any keys are missing
-    missing_keys = REQUIRED_TRANSACITON_KEYS.difference(transaction_dict.keys())
-    if missing_keys:
+    if required_present != len(REQUIRED_TRANSACITON_KEYS):
+        missing_keys = REQUIRED_TRANSACITON_KEYS.difference(transaction_dict.keys())
         raise TypeError("Transaction must include these fields: %r" % missing_keys)
 
     # check if any extra keys were specified
-    superfluous_keys = set(transaction_dict.keys()).difference(ALLOWED_TRANSACTION_KEYS)
     if superfluous_keys:
         raise TypeError("Transaction must not include unrecognized fields: %r" % superfluous_keys)
 
     # check for valid types in each field
-    valid_fields = apply_formatters_to_dict(TRANSACTION_VALID_VALUES, transaction_dict)
-    if not all(valid_fields.values()):
-        invalid = {key: transaction_dict[key] for key, valid in valid_fields.items() if not valid}
+    if invalid:
         raise TypeError("Transaction had invalid fields: %r" % invalid)
 
 
@@ -157,6 +280,66 @@ def fill_transaction_defaults(transaction):
     return merge(TRANSACTION_DEFAULTS, transaction)
 
 
+def format_int_field(val):
+    if type(val) is int:
+        return val
+    return hexstr_if_str(to_int, val)
+
+
+def format_bytes_field(val):
+    if type(val) is bytes:
+        return val
+    return hexstr_if_str(to_bytes, val)
+
+
+def format_to_field(val):
+    if type(val) is bytes:
+        return val
+    return TRANSACTION_FORMATTERS['to'](val)
+
+
+_REQUIRED = object()
+
+# (key, default, formatter) for each unsigned field, in serialization order
+NORMALIZED_TRANSACTION_FIELDS = tuple(
+    (key, TRANSACTION_DEFAULTS.get(key, _REQUIRED), formatter)
+    for key, formatter in (
+        ('nonce', format_int_field),
+        ('gasPrice', format_int_field),
+        ('gas', format_int_field),
+        ('to', format_to_field),
+        ('value', format_int_field),
+        ('data', format_bytes_field),
+    )
+)
+
+
+def normalize_transaction_fields(transaction_dict):
+    '''
+    Fill in defaults and convert a transaction dict into the values of its serialized
+    fields, in a single pass over the fields. Equivalent to merging in
+    :data:`TRANSACTION_DEFAULTS`, then applying :func:`chain_id_to_v` and
+    :data:`TRANSACTION_FORMATTERS`, without building the intermediate dicts.
+
+    The fields are assumed to have already passed :func:`assert_valid_fields`.
+
+    :returns: the values of the six unsigned fields, followed by ``(chainId, 0, 0)``
+        if the transaction has a chain ID (see EIP 155)
+    :rtype: tuple
+    '''
+    fields = []
+    for key, default, formatter in NORMALIZED_TRANSACTION_FIELDS:
+        val = transaction_dict.get(key, default)
+        if val is _REQUIRED:
+            raise TypeError("Transaction must include these fields: %r" % {key})
+        fields.append(formatter(val))
+
+    chain_id = transaction_dict.get('chainId')
+    if chain_id is not None:
+        fields.extend((format_int_field(chain_id), 0, 0))
+    return tuple(fields)
+
+
 UNSIGNED_TRANSACTION_FIELDS = (
     ('nonce', big_endian_int),
     ('gasPrice', big_endian_int),
@@ -167,12 +350,15 @@ UNSIGNED_TRANSACTION_FIELDS = (
 )
 
 
+SIGNED_TRANSACTION_FIELDS = UNSIGNED_TRANSACTION_FIELDS + (
+    ('v', big_endian_int),
+    ('r', big_endian_int),
+    ('s', big_endian_int),
+)
+
+
 class Transaction(HashableRLP):
-    fields = UNSIGNED_TRANSACTION_FIELDS + (
-        ('v', big_endian_int),
-        ('r', big_endian_int),
-        ('s', big_endian_int),
-    )
+    fields = SIGNED_TRANSACTION_FIELDS
 
 
 class UnsignedTransaction(HashableRLP):
@@ -182,6 +368,77 @@ class UnsignedTransaction(HashableRLP):
 ChainAwareUnsignedTransaction = Transaction
 
 
+def _field_deserialization_error(txn_bytes, field, message):
+    list_exception = ListDeserializationError(
+        serial=txn_bytes,
+        element_exception=DeserializationError(message, txn_bytes),
+        index=Transaction._meta.field_names.index(field),
+    )
+    return ObjectDeserializationError(
+        serial=txn_bytes,
+        sedes=Transaction,
+        list_exception=list_exception,
+    )
+
+
+def locate_signed_transaction_fields(txn_bytes):
+    '''
+    Find the fields of a serialized signed transaction, without decoding them. The
+    encoding is validated just like :meth:`Transaction.from_bytes` would do, and
+    invalid transactions raise the same exceptions, except that a list in an integer
+    field is always rejected.
+
+    :param txn_bytes: the serialized transaction, which may be a :class:`memoryview`
+    :returns: for each of the ``SIGNED_TRANSACTION_FIELDS``, the offset where its encoding
+        starts, and the offsets of the start and end of its value
+    :rtype: list((int, int, int))
+    :raises rlp.exceptions.DecodingError: if ``txn_bytes`` is not valid RLP
+    :raises rlp.exceptions.ObjectDeserializationError: if the RLP isn't a valid
+        transaction. Its ``field`` names the invalid field, if there is one.
+    '''
+    try:
+        items = decode_list(txn_bytes)
+        if len(items) != len(SIGNED_TRANSACTION_FIELDS):
+            raise ListDeserializationError(
+                "Deserializing list length (%d) does not match sedes (%d)" % (
+                    len(items),
+                    len(SIGNED_TRANSACTION_FIELDS),
+                ),
+                txn_bytes,
+            )
+    except ListDeserializationError as exc:
+        raise ObjectDeserializationError(
+            serial=txn_bytes,
+            sedes=Transaction,
+            list_exception=exc,
+        )
+
+    field_offsets = []
+    for (name, sedes), item in zip(SIGNED_TRANSACTION_FIELDS, items):
+        (is_list, start, value_start, value_end) = item
+        if is_list:
+            raise _field_deserialization_error(
+                txn_bytes,
+                name,
+                "Objects of type list cannot be deserialized",
+            )
+        elif sedes is big_endian_int:
+            if value_start < value_end and txn_bytes[value_start] == 0:
+                raise _field_deserialization_error(
+                    txn_bytes,
+                    name,
+                    "Invalid serialization (not minimal length)",
+                )
+        elif sedes is not binary and value_end - value_start not in (0, 20):
+            raise _field_deserialization_error(
+                txn_bytes,
+                name,
+                "%s has invalid length" % type(bytes()),
+            )
+        field_offsets.append((start, value_start, value_end))
+    return field_offsets
+
+
 def strip_signature(txn):
     unsigned_parts = itertools.islice(txn, len(UNSIGNED_TRANSACTION_FIELDS))
     return list(unsigned_parts)
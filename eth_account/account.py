@@ -1,15 +1,11 @@
 from collections import (
     Mapping,
 )
-import json
 import os
 
 from cytoolz import (
     dissoc,
-)
-from eth_keyfile import (
-    create_keyfile_json,
-    decode_keyfile_json,
+    partial,
 )
 from eth_keys import (
     KeyAPI,
@@ -19,9 +15,9 @@ from eth_keys.exceptions import (
     ValidationError,
 )
 from eth_utils.curried import (
+    big_endian_to_int,
     combomethod,
     hexstr_if_str,
-    is_dict,
     keccak,
     text_if_str,
     to_bytes,
@@ -31,19 +27,60 @@ from hexbytes import (
     HexBytes,
 )
 
+from eth_account._utils.addresses import (
+    public_key_bytes_to_address,
+    to_checksum_address,
+)
+from eth_account._utils.caching import (
+    DerivedKeyCache,
+    LRUCache,
+)
+from eth_account._utils.keyfile import (
+    create_keyfile_json,
+    decode_keyfile_json,
+    kdf_memory_cost,
+    load_kdf_profile,
+    pair_keyfiles_with_passwords,
+    parse_keyfile_json,
+    profile_engine,
+    profile_iterations,
+)
+from eth_account._utils.parallel import (
+    DEFAULT_BATCH_SIZE,
+    chunked,
+    create_key_batch,
+    decrypt_keyfile,
+    default_memory_budget,
+    imap_batches,
+    imap_within_budget,
+    map_capturing_exceptions,
+    process_pool,
+    raise_first_exception,
+    recover_transaction_batch,
+    restore_results,
+    sign_transaction_batch,
+)
+from eth_account._utils.secp256k1 import (
+    N,
+)
 from eth_account._utils.signing import (
-    hash_of_signed_transaction,
+    hash_and_vrs_of_serialized_transaction,
     sign_message_hash,
     sign_transaction_dict,
     to_standard_signature_bytes,
     to_standard_v,
 )
-from eth_account._utils.transactions import (
-    Transaction,
-    vrs_from,
+from eth_account.backends import (
+    ecdsa_raw_recover_many,
+    encode_public_key,
+    private_keys_to_public_keys,
+    recovers_in_batches,
 )
 from eth_account.datastructures import (
     AttributeDict,
+    KeyArray,
+    SignedMessage,
+    SignedTransaction,
 )
 from eth_account.signers.local import (
     LocalAccount,
@@ -58,6 +95,10 @@ class Account(object):
     '''
     _keys = keys
 
+    _derived_key_cache = None
+
+    _recovery_cache = None
+
     default_kdf = os.getenv('ETH_ACCOUNT_KDF', 'scrypt')
     '''
     The default key deriviation function (KDF) to use when encrypting a private key. If the
@@ -65,6 +106,52 @@ class Account(object):
     Otherwise, 'scrypt' will be used as the default.
     '''
 
+    kdf_profile = os.getenv('ETH_ACCOUNT_KDF_PROFILE')
+    '''
+    The work factors that :meth:`encrypt` uses when no ``iterations`` are given, as a
+    profile made by :mod:`eth_account.kdf_calibrate` to suit the hardware, or the path
+    of one. A profile file is read again only when it changes. Work factors from the
+    profile run on the KDF engine the profile was measured with, instead of
+    :attr:`kdf_engine`. If the environment variable :envvar:`ETH_ACCOUNT_KDF_PROFILE`
+    is set, its value is used as the default. Without a profile, the defaults of
+    eth-keyfile are used.
+    '''
+
+    kdf_engine = os.getenv('ETH_ACCOUNT_KDF_ENGINE', 'auto')
+    '''
+    Where :meth:`encrypt` and :meth:`decrypt` run scrypt:
+
+    - ``'auto'``, the default, means eth-keyfile. It never picks OpenSSL, because
+      eth-keyfile's scrypt measured faster, so it is no faster than plain eth-keyfile.
+    - ``'eth-keyfile'`` runs scrypt in eth-keyfile too.
+    - ``'openssl'`` runs scrypt in OpenSSL, through :func:`hashlib.scrypt`. OpenSSL
+      can't run ``n >= 2 ** (16 * r)``, which includes eth-keyfile's defaults
+      (``n = 2 ** 18`` with ``r = 1``), so it raises :class:`ValueError` for those
+      keyfiles, both to create and to decrypt them.
+
+    Pbkdf2 always runs in eth-keyfile, and the keyfiles are the same either way. If
+    the environment variable :envvar:`ETH_ACCOUNT_KDF_ENGINE` is set, its value is
+    used as the default.
+    '''
+
+    lightweight_results = False
+    '''
+    If set, signing returns :class:`~eth_account.datastructures.SignedMessage` and
+    :class:`~eth_account.datastructures.SignedTransaction` objects instead of an
+    :class:`~eth_account.datastructures.AttributeDict`. They have the same fields and
+    can also be read like a mapping, but are cheaper to create and smaller in memory,
+    which adds up when keeping many signed results around.
+    '''
+
+    raw_bytes = False
+    '''
+    If set, signing returns plain :class:`bytes` instead of
+    :class:`~hexbytes.main.HexBytes` for ``messageHash``, ``signature``,
+    ``rawTransaction`` and ``hash``, skipping a copy of each. It can be overridden
+    per call, with the ``raw_bytes`` argument of :meth:`signHash` and
+    :meth:`signTransaction`.
+    '''
+
     @combomethod
     def create(self, extra_entropy=''):
         '''
@@ -91,8 +178,58 @@ class Account(object):
         key_bytes = keccak(os.urandom(32) + extra_key_bytes)
         return self.privateKeyToAccount(key_bytes)
 
-    @staticmethod
-    def decrypt(keyfile_json, password):
+    @combomethod
+    def createMany(self, count, extra_entropy='', workers=None, batch_size=DEFAULT_BATCH_SIZE):
+        '''
+        Creates ``count`` new private keys, each made like the one of :meth:`create`,
+        and returns them with their addresses, packed in a
+        :class:`~eth_account.datastructures.KeyArray`.
+
+        Keys are made in batches of ``batch_size``. Each batch reads its randomness
+        from the OS at once, and shares one modular inversion to find all its
+        public keys. Pass ``workers`` to spread the batches over a pool of that many
+        processes.
+
+        :param int count: the number of keys to create
+        :param extra_entropy: Add extra randomness to whatever randomness your OS can provide
+        :type extra_entropy: str or bytes or int
+        :param int workers: number of worker processes to create keys with, or ``None``
+          to create them in the current process
+        :param int batch_size: number of keys created at a time
+        :returns: the private keys and their addresses, in matching order
+        :rtype: ~eth_account.datastructures.KeyArray
+
+        .. code-block:: python
+
+            >>> keys = Account.createMany(100000, workers=8)
+            >>> for private_key, address in keys:
+            ...     fund(address)
+        '''
+        if count < 0:
+            raise ValueError("Number of keys must not be negative, got %r" % count)
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1, got %r" % batch_size)
+        extra_key_bytes = text_if_str(to_bytes, extra_entropy)
+        (full_batches, remainder) = divmod(count, batch_size)
+        batch_counts = [batch_size] * full_batches + ([remainder] if remainder else [])
+
+        if workers is None:
+            return self._joinKeyBatches(
+                self._createKeyBatch(batch_count, extra_key_bytes)
+                for batch_count in batch_counts
+            )
+        else:
+            with process_pool(workers) as executor:
+                return self._joinKeyBatches(imap_batches(
+                    executor,
+                    create_key_batch,
+                    batch_counts,
+                    fn_args=(extra_key_bytes,),
+                    workers=workers,
+                ))
+
+    @combomethod
+    def decrypt(self, keyfile_json, password):
         '''
         Decrypts a private key that was encrypted using an Ethereum client or
         :meth:`~Account.encrypt`.
@@ -124,17 +261,103 @@ class Account(object):
             HexBytes('0xb25c7db31feed9122727bf0939dc769a96564b2de4c4726d035b36ecf1e5b364')
 
         '''
-        if isinstance(keyfile_json, str):
-            keyfile = json.loads(keyfile_json)
-        elif is_dict(keyfile_json):
-            keyfile = keyfile_json
-        else:
-            raise TypeError("The keyfile should be supplied as a JSON string, or a dictionary.")
+        keyfile = parse_keyfile_json(keyfile_json)
         password_bytes = text_if_str(to_bytes, password)
-        return HexBytes(decode_keyfile_json(keyfile, password_bytes))
+        return HexBytes(decode_keyfile_json(
+            keyfile,
+            password_bytes,
+            engine=self.kdf_engine,
+            cache=self._derived_key_cache,
+        ))
 
-    @classmethod
-    def encrypt(cls, private_key, password, kdf=None, iterations=None):
+    @combomethod
+    def decryptMany(
+            self,
+            keyfiles,
+            passwords,
+            workers=None,
+            max_memory=None,
+            return_exceptions=False):
+        '''
+        Decrypt several private keys, as in :meth:`~Account.decrypt`.
+
+        Deriving each key from its password is deliberately slow, so pass ``workers``
+        to decrypt over a pool of that many processes. Scrypt keyfiles also need
+        ``128 * r * n`` bytes of memory each (32 MB for those made by
+        :meth:`~Account.encrypt`, and 256 MB for geth's), so keyfiles are only handed
+        to the workers while the memory needed by those being decrypted stays within
+        ``max_memory``. A single keyfile that needs more than that is decrypted on
+        its own.
+
+        :param keyfiles: the encrypted keys
+        :type keyfiles: iterable of dict or str
+        :param passwords: one password for all the keys, or one password per key
+        :type passwords: str or bytes, or iterable of str or bytes
+        :param int workers: number of worker processes to decrypt with, or ``None``
+          to decrypt in the current process
+        :param int max_memory: the number of bytes that the workers may use for key
+          derivation at once. Defaults to half of the physical memory.
+        :param bool return_exceptions: if ``True``, a key that fails to decrypt, say
+          because of a wrong password, is reported by putting its exception in the
+          results, instead of raising it
+        :returns: the raw private keys, in the same order as ``keyfiles``
+        :rtype: list(~hexbytes.main.HexBytes)
+
+        .. code-block:: python
+
+            >>> keyfiles = [json.load(open(path)) for path in glob.glob('keystore/*')]
+            >>> keys = Account.decryptMany(
+                keyfiles,
+                getpass.getpass(),
+                workers=8,
+                return_exceptions=True,
+            )
+        '''
+        keyfiles_and_passwords = pair_keyfiles_with_passwords(keyfiles, passwords)
+
+        if workers is None:
+            results = map_capturing_exceptions(
+                lambda keyfile_and_password: self.decrypt(*keyfile_and_password),
+                keyfiles_and_passwords,
+            )
+        else:
+            if max_memory is None:
+                max_memory = default_memory_budget()
+            with process_pool(workers) as executor:
+                results = restore_results(imap_within_budget(
+                    executor,
+                    decrypt_keyfile,
+                    (
+                        (kdf_memory_cost(keyfile), (keyfile, password_bytes, self.kdf_engine))
+                        for keyfile, password_bytes in keyfiles_and_passwords
+                    ),
+                    max_memory,
+                    workers=workers,
+                ))
+
+        if return_exceptions:
+            return results
+        else:
+            return raise_first_exception(results)
+
+    def disableDerivedKeyCache(self):
+        '''
+        Stop caching derived keys, and wipe the cache enabled by
+        :meth:`enableDerivedKeyCache`.
+        '''
+        if self._derived_key_cache is not None:
+            self._derived_key_cache.clear()
+        self._derived_key_cache = None
+
+    def disableRecoveryCache(self):
+        '''
+        Stop caching recovered signers, and drop the cache enabled by
+        :meth:`enableRecoveryCache`.
+        '''
+        self._recovery_cache = None
+
+    @combomethod
+    def encrypt(self, private_key, password, kdf=None, iterations=None):
         '''
         Creates a dictionary with an encrypted version of your private key.
         To import this keyfile into Ethereum clients like geth and parity:
@@ -145,7 +368,8 @@ class Account(object):
         :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
         :param str password: The password which you will need to unlock the account in your client
         :param str kdf: The key derivation function to use when encrypting your private key
-        :param int iterations: The work factor for the key derivation function
+        :param int iterations: The work factor for the key derivation function. Defaults
+            to the one in :attr:`kdf_profile`, if any
         :returns: The data to use in your encrypted file
         :rtype: dict
 
@@ -188,12 +412,91 @@ class Account(object):
             key_bytes = HexBytes(private_key)
 
         if kdf is None:
-            kdf = cls.default_kdf
+            kdf = self.default_kdf
+        engine = self.kdf_engine
+        if iterations is None and self.kdf_profile is not None:
+            profile = load_kdf_profile(self.kdf_profile)
+            iterations = profile_iterations(profile, kdf)
+            if iterations is not None:
+                # the work factor is only sized right on the engine it was measured on
+                engine = profile_engine(profile, engine)
 
         password_bytes = text_if_str(to_bytes, password)
         assert len(key_bytes) == 32
 
-        return create_keyfile_json(key_bytes, password_bytes, kdf=kdf, iterations=iterations)
+        return create_keyfile_json(
+            key_bytes,
+            password_bytes,
+            kdf=kdf,
+            iterations=iterations,
+            engine=engine,
+        )
+
+    def enableDerivedKeyCache(self, size=64, ttl=600):
+        '''
+        Remember the keys that :meth:`decrypt` derives from passwords, so that
+        decrypting the same keyfile with the same password again skips the slow key
+        derivation function.
+
+        A cached key is only used if it checks out against the keyfile's MAC, as
+        usual. Entries are dropped ``ttl`` seconds after they were cached, whether or
+        not they are looked up again, and once ``size`` keys are cached, the least
+        recently used one is evicted. The cache holds neither passwords nor
+        private keys, and overwrites each derived key with zeros when it leaves the
+        cache. The cache is safe to share between threads, but worker processes of
+        :meth:`decryptMany` don't use it.
+
+        *(Caching is off by default)*
+
+        :param int size: the maximum number of cached keys
+        :param float ttl: the number of seconds to keep each key for
+        :returns: the cache, whose :meth:`info` method reports the number of hits,
+            misses and evictions
+        :rtype: ~eth_account._utils.caching.DerivedKeyCache
+
+        .. code-block:: python
+
+            >>> acct = Account()
+            >>> cache = acct.enableDerivedKeyCache(ttl=60)
+            >>> acct.decrypt(encrypted, password)  # slow
+            HexBytes('0xb25c7db31feed9122727bf0939dc769a96564b2de4c4726d035b36ecf1e5b364')
+            >>> acct.decrypt(encrypted, password)  # fast
+            HexBytes('0xb25c7db31feed9122727bf0939dc769a96564b2de4c4726d035b36ecf1e5b364')
+        '''
+        self.disableDerivedKeyCache()
+        self._derived_key_cache = DerivedKeyCache(size, ttl)
+        return self._derived_key_cache
+
+    def enableRecoveryCache(self, size=4096):
+        '''
+        Remember the signers recovered by :meth:`recoverHash`, :meth:`recoverHashes` and
+        :meth:`recoverTransaction`, so that recovering the same signature again only
+        costs a dictionary lookup.
+
+        Signatures are keyed by the message hash and signature, and transactions by
+        their serialized bytes. Once ``size`` entries are cached, the least recently
+        used one is evicted. The cache is safe to share between threads.
+
+        *(Caching is off by default)*
+
+        :param int size: the maximum number of cached signers
+        :returns: the cache, whose :meth:`info` method reports the number of hits,
+            misses and evictions
+        :rtype: ~eth_account._utils.caching.LRUCache
+
+        .. code-block:: python
+
+            >>> acct = Account()
+            >>> cache = acct.enableRecoveryCache(size=100000)
+            >>> acct.recoverTransaction(raw_transaction)
+            '0x2c7536E3605D9C16a7a3D7b1898e529396a65c23'
+            >>> acct.recoverTransaction(raw_transaction)
+            '0x2c7536E3605D9C16a7a3D7b1898e529396a65c23'
+            >>> cache.info()
+            CacheInfo(hits=1, misses=1, evictions=0, maxsize=100000, currsize=1)
+        '''
+        self._recovery_cache = LRUCache(size)
+        return self._recovery_cache
 
     @combomethod
     def privateKeyToAccount(self, private_key):
@@ -222,7 +525,7 @@ class Account(object):
         return LocalAccount(key, self)
 
     @combomethod
-    def recoverHash(self, message_hash, vrs=None, signature=None):
+    def recoverHash(self, message_hash, vrs=None, signature=None, raw_address=False):
         '''
         Get the address of the account that signed the message with the given hash.
         You must specify exactly one of: vrs or signature
@@ -233,8 +536,11 @@ class Account(object):
         :type vrs: tuple(v, r, s), each element is hex str, bytes or int
         :param signature: signature bytes concatenated as r+s+v
         :type signature: hex str or bytes or int
-        :returns: address of signer, hex-encoded & checksummed
-        :rtype: str
+        :param bool raw_address: return the canonical 20-byte address, which is
+            cheaper to compare in bulk, instead of the checksummed one
+        :returns: address of signer, hex-encoded & checksummed (or 20 bytes, if
+            ``raw_address`` is set)
+        :rtype: str, or bytes if ``raw_address`` is set
 
         .. code-block:: python
 
@@ -280,31 +586,112 @@ class Account(object):
             >>> signature = 0xe6ca9bba58c88611fad66a6ce8f996908195593807c4b38bd528d2cff09d4eb33e5bfbbf4d3e39b1a2fd816a7680c19ebebaf3a141b239934ad43cb33fcec8ce1c  # noqa: E501
             >>> Account.recoverHash(msghash, signature=signature)
         '''
-        hash_bytes = HexBytes(message_hash)
-        if len(hash_bytes) != 32:
-            raise ValueError("The message hash must be exactly 32-bytes")
-        if vrs is not None:
-            v, r, s = map(hexstr_if_str(to_int), vrs)
-            v_standard = to_standard_v(v)
-            signature_obj = self._keys.Signature(vrs=(v_standard, r, s))
-        elif signature is not None:
-            signature_bytes = HexBytes(signature)
-            signature_bytes_standard = to_standard_signature_bytes(signature_bytes)
-            signature_obj = self._keys.Signature(signature_bytes=signature_bytes_standard)
+        (hash_bytes, signature_obj) = self._parseRecoveryArguments(message_hash, vrs, signature)
+        cache = self._recovery_cache
+        if cache is None:
+            address = self._recoverSigner(hash_bytes, signature_obj)
         else:
-            raise TypeError("You must supply the vrs tuple or the signature bytes")
-        pubkey = signature_obj.recover_public_key_from_msg_hash(hash_bytes)
-        return pubkey.to_checksum_address()
+            cache_key = (bytes(hash_bytes), signature_obj.to_bytes())
+            address = cache.get(cache_key)
+            if address is None:
+                address = self._recoverSigner(hash_bytes, signature_obj)
+                cache.put(cache_key, address)
+
+        if raw_address:
+            return address
+        else:
+            return to_checksum_address(address)
+
+    @combomethod
+    def recoverHashes(self, pairs, raw_address=False):
+        '''
+        Get the address of the account that signed each message hash, like
+        :meth:`recoverHash` does for a single one.
+
+        With the default key backend, or
+        :class:`~eth_account.backends.FastPythonECCBackend`, all the signatures are
+        recovered together, sharing the expensive modular inversions across the whole
+        batch, which makes this several times faster than calling :meth:`recoverHash`
+        in a loop. Other backends (see :meth:`setKeyBackend`), like coincurve, recover
+        each signature on their own, which is faster for them.
+
+        :param pairs: each message hash, paired with its signature. The signature may
+            be a ``(v, r, s)`` tuple, or anything accepted by the ``signature``
+            argument of :meth:`recoverHash`
+        :type pairs: iterable of (hash, signature) pairs
+        :param bool raw_address: return 20-byte canonical addresses, instead of
+            checksummed ones, as in :meth:`recoverHash`
+        :returns: the address of each signer, hex-encoded & checksummed (or 20 bytes,
+            if ``raw_address`` is set), in the same order as ``pairs``
+        :rtype: list(str), or list(bytes) if ``raw_address`` is set
+
+        .. code-block:: python
+
+            >>> msghash = '0x1476abb745d423bf09273f1afd887d951181d25adc66c4834a70491911b7f750'
+            >>> vrs = (
+                  28,
+                  '0xe6ca9bba58c88611fad66a6ce8f996908195593807c4b38bd528d2cff09d4eb3',
+                  '0x3e5bfbbf4d3e39b1a2fd816a7680c19ebebaf3a141b239934ad43cb33fcec8ce')
+            >>> Account.recoverHashes([(msghash, vrs)])
+            ['0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E']
+        '''
+        cache = self._recovery_cache
+        addresses = []
+        # the index in addresses, cache key, hash and signature of each uncached pair
+        uncached = []
+        for message_hash, signature in pairs:
+            if isinstance(signature, (tuple, list)):
+                parsed = self._parseRecoveryArguments(message_hash, vrs=signature)
+            else:
+                parsed = self._parseRecoveryArguments(message_hash, signature=signature)
+            (hash_bytes, signature_obj) = parsed
+
+            if cache is None:
+                cache_key = address = None
+            else:
+                cache_key = (bytes(hash_bytes), signature_obj.to_bytes())
+                address = cache.get(cache_key)
+            if address is None:
+                uncached.append((len(addresses), cache_key, hash_bytes, signature_obj))
+            addresses.append(address)
+
+        if recovers_in_batches(self._keys.backend):
+            public_key_points = ecdsa_raw_recover_many(
+                (hash_bytes, signature_obj.vrs)
+                for (_, _, hash_bytes, signature_obj) in uncached
+            )
+            recovered = (
+                public_key_bytes_to_address(encode_public_key(public_key_point))
+                for public_key_point in public_key_points
+            )
+        else:
+            recovered = (
+                self._recoverSigner(hash_bytes, signature_obj)
+                for (_, _, hash_bytes, signature_obj) in uncached
+            )
+
+        for (index, cache_key, _, _), address in zip(uncached, recovered):
+            addresses[index] = address
+            if cache is not None:
+                cache.put(cache_key, address)
+
+        if raw_address:
+            return addresses
+        else:
+            return [to_checksum_address(address) for address in addresses]
 
     @combomethod
-    def recoverTransaction(self, serialized_transaction):
+    def recoverTransaction(self, serialized_transaction, raw_address=False):
         '''
         Get the address of the account that signed this transaction.
 
         :param serialized_transaction: the complete signed transaction
         :type serialized_transaction: hex str, bytes or int
-        :returns: address of signer, hex-encoded & checksummed
-        :rtype: str
+        :param bool raw_address: return the canonical 20-byte address, instead of the
+            checksummed one, as in :meth:`recoverHash`
+        :returns: address of signer, hex-encoded & checksummed (or 20 bytes, if
+            ``raw_address`` is set)
+        :rtype: str, or bytes if ``raw_address`` is set
 
         .. code-block:: python
 
@@ -312,10 +699,71 @@ class Account(object):
             >>> Account.recoverTransaction(raw_transaction)
             '0x2c7536E3605D9C16a7a3D7b1898e529396a65c23'
         '''
-        txn_bytes = HexBytes(serialized_transaction)
-        txn = Transaction.from_bytes(txn_bytes)
-        msg_hash = hash_of_signed_transaction(txn)
-        return self.recoverHash(msg_hash, vrs=vrs_from(txn))
+        txn_bytes = self._parseSerializedTransaction(serialized_transaction)
+        cache = self._recovery_cache
+        if cache is not None:
+            address = cache.get(bytes(txn_bytes))
+            if address is not None:
+                return address if raw_address else to_checksum_address(address)
+
+        (msg_hash, vrs) = hash_and_vrs_of_serialized_transaction(txn_bytes)
+        address = self._recoverSigner(*self._parseRecoveryArguments(msg_hash, vrs=vrs))
+        if cache is not None:
+            cache.put(bytes(txn_bytes), address)
+        return address if raw_address else to_checksum_address(address)
+
+    @combomethod
+    def recoverTransactions(
+            self,
+            serialized_transactions,
+            workers=None,
+            batch_size=DEFAULT_BATCH_SIZE,
+            return_exceptions=False):
+        '''
+        Get the address of the account that signed each transaction, as in
+        :meth:`recoverTransaction`, lazily and in order.
+
+        Transactions are recovered in batches of ``batch_size``, which share their
+        modular inversions as in :meth:`recoverHashes`. Pass ``workers`` to spread the
+        batches over a pool of that many processes. Only a few batches per worker are
+        in flight at a time, so ``serialized_transactions`` can be a lazy iterator
+        over more transactions than would fit in memory.
+
+        :param serialized_transactions: the complete signed transactions
+        :type serialized_transactions: iterable of hex str, bytes or int
+        :param int workers: number of worker processes to recover with, or ``None``
+          to recover in the current process
+        :param int batch_size: number of transactions recovered at a time
+        :param bool return_exceptions: if ``True``, a transaction that can't be
+          recovered is reported by yielding its exception, instead of raising it
+        :returns: the address of each signer, hex-encoded & checksummed, in the same
+          order as ``serialized_transactions``
+        :rtype: iterator of str
+
+        .. code-block:: python
+
+            >>> block = w3.eth.getBlock('latest', full_transactions=True)
+            >>> raw_transactions = (txn.raw for txn in block.transactions)
+            >>> for sender in Account.recoverTransactions(raw_transactions, workers=4):
+            ...     print(sender)
+        '''
+        batches = chunked(serialized_transactions, batch_size)
+        if workers is None:
+            batch_results = map(self._recoverTransactionBatch, batches)
+            yield from self._iterateResults(batch_results, return_exceptions)
+        else:
+            with process_pool(workers) as executor:
+                batch_results = imap_batches(
+                    executor,
+                    recover_transaction_batch,
+                    batches,
+                    fn_args=(self._keys.backend,),
+                    workers=workers,
+                )
+                yield from self._iterateResults(
+                    map(restore_results, batch_results),
+                    return_exceptions,
+                )
 
     def setKeyBackend(self, backend):
         '''
@@ -330,7 +778,7 @@ class Account(object):
         self._keys = KeyAPI(backend)
 
     @combomethod
-    def signHash(self, message_hash, private_key):
+    def signHash(self, message_hash, private_key, raw_bytes=None):
         '''
         Sign the hash provided.
 
@@ -349,6 +797,8 @@ class Account(object):
         :type message_hash: hex str, bytes or int
         :param private_key: the key to sign the message with
         :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
+        :param bool raw_bytes: return ``messageHash`` and ``signature`` as plain bytes,
+          instead of :class:`~hexbytes.main.HexBytes`. Defaults to :attr:`raw_bytes`
         :returns: Various details about the signature - most
           importantly the fields: v, r, and s
         :rtype: ~eth_account.datastructures.AttributeDict
@@ -377,23 +827,26 @@ class Account(object):
                 key
             )
         '''
-        msg_hash_bytes = HexBytes(message_hash)
-        if len(msg_hash_bytes) != 32:
-            raise ValueError("The message hash must be exactly 32-bytes")
-
+        msg_hash_bytes = self._parseMessageHash(message_hash)
         key = self._parsePrivateKey(private_key)
 
         (v, r, s, eth_signature_bytes) = sign_message_hash(key, msg_hash_bytes)
+        if raw_bytes is None:
+            raw_bytes = self.raw_bytes
+        msg_hash_bytes = self._bytesResult(msg_hash_bytes, raw_bytes)
+        signature_bytes = self._bytesResult(eth_signature_bytes, raw_bytes)
+        if self.lightweight_results:
+            return SignedMessage(msg_hash_bytes, r, s, v, signature_bytes)
         return AttributeDict({
             'messageHash': msg_hash_bytes,
             'r': r,
             's': s,
             'v': v,
-            'signature': HexBytes(eth_signature_bytes),
+            'signature': signature_bytes,
         })
 
     @combomethod
-    def signTransaction(self, transaction_dict, private_key):
+    def signTransaction(self, transaction_dict, private_key, raw_bytes=None):
         '''
         Sign a transaction using a local private key. Produces signature details
         and the hex-encoded transaction suitable for broadcast using
@@ -407,6 +860,8 @@ class Account(object):
           nonce, chainId, to, data, value, gas, and gasPrice.
         :param private_key: the private key to sign the data with
         :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
+        :param bool raw_bytes: return ``rawTransaction`` and ``hash`` as plain bytes,
+          instead of :class:`~hexbytes.main.HexBytes`. Defaults to :attr:`raw_bytes`
         :returns: Various details about the signature - most
           importantly the fields: v, r, and s
         :rtype: AttributeDict
@@ -431,10 +886,123 @@ class Account(object):
              'v': 37}
             >>> w3.eth.sendRawTransaction(signed.rawTransaction)
         '''
-        if not isinstance(transaction_dict, Mapping):
-            raise TypeError("transaction_dict must be dict-like, got %r" % transaction_dict)
+        account = self.privateKeyToAccount(private_key)
+        return self._signTransactionWithAccount(account, transaction_dict, raw_bytes)
 
+    @combomethod
+    def signTransactions(
+            self,
+            transaction_dicts,
+            private_key,
+            workers=None,
+            batch_size=DEFAULT_BATCH_SIZE,
+            return_exceptions=False,
+            raw_bytes=None):
+        '''
+        Sign several transactions with the same local private key, as in
+        :meth:`~Account.signTransaction`. The private key is parsed once for the
+        whole batch, rather than once per transaction.
+
+        Signing is CPU-bound, so a single process uses a single core. Pass ``workers``
+        to spread the transactions, in batches of ``batch_size``, over a pool of that
+        many processes. Each worker loads the private key only once.
+
+        :param transaction_dicts: the transactions to sign, each with the same keys
+          accepted by :meth:`~Account.signTransaction`
+        :type transaction_dicts: iterable of dict
+        :param private_key: the private key to sign the data with
+        :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
+        :param int workers: number of worker processes to sign with, or ``None``
+          to sign in the current process
+        :param int batch_size: number of transactions sent to a worker at a time
+        :param bool return_exceptions: if ``True``, a transaction that fails to sign
+          is reported by putting its exception in the results, instead of raising it
+        :param bool raw_bytes: as in :meth:`~Account.signTransaction`, for every
+          transaction
+        :returns: the signed transactions, in the same order as ``transaction_dicts``
+        :rtype: list(AttributeDict)
+
+        .. code-block:: python
+
+            >>> transactions = [dict(transaction, nonce=nonce) for nonce in range(3)]
+            >>> signed = Account.signTransactions(transactions, key)
+            >>> [w3.eth.sendRawTransaction(txn.rawTransaction) for txn in signed]
+
+            # sign on 4 cores, keeping going past invalid transactions
+            >>> signed = Account.signTransactions(
+                transactions,
+                key,
+                workers=4,
+                return_exceptions=True,
+            )
+        '''
         account = self.privateKeyToAccount(private_key)
+        return self._signTransactionsWithAccount(
+            account,
+            transaction_dicts,
+            workers=workers,
+            batch_size=batch_size,
+            return_exceptions=return_exceptions,
+            raw_bytes=raw_bytes,
+        )
+
+    @combomethod
+    def _signTransactionsWithAccount(
+            self,
+            account,
+            transaction_dicts,
+            workers=None,
+            batch_size=DEFAULT_BATCH_SIZE,
+            return_exceptions=False,
+            raw_bytes=None):
+        '''
+        Sign several transactions with the key of an already-parsed account,
+        as in :meth:`~Account.signTransactions`.
+        '''
+        if raw_bytes is None:
+            raw_bytes = self.raw_bytes
+        if workers is None:
+            sign = partial(self._signTransactionWithAccount, account, raw_bytes=raw_bytes)
+            if return_exceptions:
+                return map_capturing_exceptions(sign, transaction_dicts)
+            else:
+                return [sign(transaction_dict) for transaction_dict in transaction_dicts]
+
+        results = []
+        with process_pool(workers) as executor:
+            batch_results = imap_batches(
+                executor,
+                sign_transaction_batch,
+                chunked(transaction_dicts, batch_size),
+                fn_args=(self._keys.backend, account.privateKey, raw_bytes),
+                workers=workers,
+            )
+            for batch in batch_results:
+                results.extend(
+                    result if isinstance(result, Exception) else (
+                        self._signedTransactionResult(**result, raw_bytes=raw_bytes)
+                    )
+                    for result in restore_results(batch)
+                )
+
+        if return_exceptions:
+            return results
+        else:
+            return raise_first_exception(results)
+
+    @combomethod
+    def _signTransactionWithAccount(self, account, transaction_dict, raw_bytes=None):
+        '''
+        Sign a transaction with the key of an already-parsed account.
+
+        :param LocalAccount account: the account whose key signs the transaction
+        :param dict transaction_dict: the transaction, as in :meth:`~Account.signTransaction`
+        :param bool raw_bytes: as in :meth:`~Account.signTransaction`
+        :returns: the signature details and the encoded transaction
+        :rtype: AttributeDict
+        '''
+        if not isinstance(transaction_dict, Mapping):
+            raise TypeError("transaction_dict must be dict-like, got %r" % transaction_dict)
 
         # allow from field, *only* if it matches the private key
         if 'from' in transaction_dict:
@@ -456,16 +1024,158 @@ class Account(object):
             rlp_encoded,
         ) = sign_transaction_dict(account._key_obj, sanitized_transaction)
 
-        transaction_hash = keccak(rlp_encoded)
+        return self._signedTransactionResult(
+            rlp_encoded,
+            keccak(rlp_encoded),
+            r,
+            s,
+            v,
+            raw_bytes=raw_bytes,
+        )
 
+    @combomethod
+    def _signedTransactionResult(self, rawTransaction, hash, r, s, v, raw_bytes=None):
+        '''
+        Package a signed transaction in the result type selected by
+        :attr:`lightweight_results`, with bytes fields as selected by ``raw_bytes``
+        (or :attr:`raw_bytes`, if it's ``None``).
+        '''
+        if raw_bytes is None:
+            raw_bytes = self.raw_bytes
+        rawTransaction = self._bytesResult(rawTransaction, raw_bytes)
+        hash = self._bytesResult(hash, raw_bytes)
+        if self.lightweight_results:
+            return SignedTransaction(rawTransaction, hash, r, s, v)
         return AttributeDict({
-            'rawTransaction': HexBytes(rlp_encoded),
-            'hash': HexBytes(transaction_hash),
+            'rawTransaction': rawTransaction,
+            'hash': hash,
             'r': r,
             's': s,
             'v': v,
         })
 
+    @staticmethod
+    def _bytesResult(value, raw_bytes):
+        if not raw_bytes:
+            return HexBytes(value)
+        elif type(value) is bytes:
+            return value
+        else:
+            return bytes(value)
+
+    @staticmethod
+    def _createKeyBatch(count, extra_key_bytes):
+        '''
+        Create ``count`` new private keys, as in :meth:`create`.
+
+        :returns: the packed keys and the packed canonical addresses
+        :rtype: tuple(bytes, bytes)
+        '''
+        entropy = os.urandom(32 * count)
+        key_ints = []
+        for offset in range(0, len(entropy), 32):
+            key_int = big_endian_to_int(keccak(entropy[offset:offset + 32] + extra_key_bytes))
+            # as likely as guessing a key, but privateKeyToAccount would reject it
+            while not 0 < key_int < N:
+                key_int = big_endian_to_int(keccak(os.urandom(32) + extra_key_bytes))
+            key_ints.append(key_int)
+
+        public_key_points = private_keys_to_public_keys(key_ints)
+        return (
+            b''.join(key_int.to_bytes(32, 'big') for key_int in key_ints),
+            b''.join(
+                public_key_bytes_to_address(encode_public_key(public_key_point))
+                for public_key_point in public_key_points
+            ),
+        )
+
+    @staticmethod
+    def _joinKeyBatches(batches):
+        key_array = KeyArray()
+        for packed_keys, packed_addresses in batches:
+            key_array.extend(KeyArray(packed_keys, packed_addresses))
+        return key_array
+
+    @staticmethod
+    def _iterateResults(batch_results, return_exceptions):
+        for batch in batch_results:
+            for result in batch:
+                if isinstance(result, Exception) and not return_exceptions:
+                    raise result
+                yield result
+
+    @combomethod
+    def _recoverTransactionBatch(self, serialized_transactions):
+        '''
+        Recover the sender of each transaction, as in :meth:`recoverHashes`.
+
+        :returns: the address, or the exception raised, for each transaction
+        :rtype: list
+        '''
+        parsed = map_capturing_exceptions(
+            lambda serialized_transaction: hash_and_vrs_of_serialized_transaction(
+                self._parseSerializedTransaction(serialized_transaction),
+            ),
+            serialized_transactions,
+        )
+        valid = [item for item in parsed if not isinstance(item, Exception)]
+        try:
+            addresses = self.recoverHashes(valid)
+        except Exception:
+            # at least one signature is invalid, so recover them one by one to find out which
+            addresses = map_capturing_exceptions(
+                lambda hash_and_vrs: self.recoverHash(hash_and_vrs[0], vrs=hash_and_vrs[1]),
+                valid,
+            )
+
+        address_iter = iter(addresses)
+        return [item if isinstance(item, Exception) else next(address_iter) for item in parsed]
+
+    @combomethod
+    def _recoverSigner(self, hash_bytes, signature_obj):
+        pubkey = signature_obj.recover_public_key_from_msg_hash(hash_bytes)
+        return public_key_bytes_to_address(pubkey.to_bytes())
+
+    @combomethod
+    def _parseRecoveryArguments(self, message_hash, vrs=None, signature=None):
+        hash_bytes = self._parseMessageHash(message_hash)
+        if vrs is not None:
+            v, r, s = map(hexstr_if_str(to_int), vrs)
+            v_standard = to_standard_v(v)
+            signature_obj = self._keys.Signature(
+                vrs=(v_standard, r, s),
+                backend=self._keys.backend,
+            )
+        elif signature is not None:
+            if isinstance(signature, bytes) and len(signature) == 65:
+                signature_bytes = signature
+            else:
+                signature_bytes = HexBytes(signature)
+            signature_bytes_standard = to_standard_signature_bytes(signature_bytes)
+            signature_obj = self._keys.Signature(
+                signature_bytes=signature_bytes_standard,
+                backend=self._keys.backend,
+            )
+        else:
+            raise TypeError("You must supply the vrs tuple or the signature bytes")
+        return (hash_bytes, signature_obj)
+
+    @staticmethod
+    def _parseMessageHash(message_hash):
+        # bytes of the right length are used as-is, skipping the conversion
+        if isinstance(message_hash, bytes) and len(message_hash) == 32:
+            return message_hash
+        hash_bytes = HexBytes(message_hash)
+        if len(hash_bytes) != 32:
+            raise ValueError("The message hash must be exactly 32-bytes")
+        return hash_bytes
+
+    @staticmethod
+    def _parseSerializedTransaction(serialized_transaction):
+        if isinstance(serialized_transaction, bytes):
+            return serialized_transaction
+        return HexBytes(serialized_transaction)
+
     @combomethod
     def _parsePrivateKey(self, key):
         '''
@@ -481,7 +1191,16 @@ class Account(object):
             return key
 
         try:
-            return self._keys.PrivateKey(HexBytes(key))
+            if isinstance(key, bytes) and len(key) == 32:
+                key_bytes = key
+            else:
+                key_bytes = HexBytes(key)
+            # eth-keys derives the public key before it stores the backend, so
+            # attach the backend first, or the default one does the derivation
+            key_obj = self._keys.PrivateKey.__new__(self._keys.PrivateKey)
+            key_obj.backend = self._keys.backend
+            key_obj.__init__(key_bytes, backend=key_obj.backend)
+            return key_obj
         except ValidationError as original_exception:
             raise ValueError(
                 "The private key must be exactly 32 bytes long, instead of "
@@ -0,0 +1,125 @@
+import asyncio
+from functools import (
+    partial,
+)
+
+from eth_account._utils.parallel import (
+    call_account_method,
+    restore_results,
+)
+from eth_account.account import (
+    Account,
+)
+
+
+class AsyncAccount(object):
+    '''
+    Awaitable versions of the slow :class:`~eth_account.account.Account` methods, for
+    use in an :mod:`asyncio` event loop.
+
+    Each call runs on an executor, so that key derivation and signing don't block the
+    event loop. By default, that is the loop's default thread pool. Key derivation
+    releases the GIL, so threads suit :meth:`encrypt` and :meth:`decrypt`, but signing
+    with a pure-Python backend holds it. A
+    :class:`~concurrent.futures.ProcessPoolExecutor` takes signing off the event loop's
+    core too, as long as the account API is picklable (the
+    :class:`~eth_account.account.Account` class is).
+
+    With ``max_concurrency``, at most that many calls run at once, and the others
+    wait their turn in the event loop. Cancelling a call that is still waiting drops
+    it. A call that already started can't be interrupted: it runs to completion on
+    the executor, and its result is discarded. It keeps counting against
+    ``max_concurrency`` until it finishes, so cancelling calls never lets more work
+    run at once.
+
+    .. code-block:: python
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from eth_account.async_account import AsyncAccount
+        >>> async_account = AsyncAccount(executor=ThreadPoolExecutor(4), max_concurrency=4)
+        >>> private_key = await async_account.decrypt(keyfile_json, password)
+        >>> signed = await async_account.signTransaction(transaction, private_key)
+
+        # give up on unlocking after a second
+        >>> private_key = await asyncio.wait_for(
+                async_account.decrypt(keyfile_json, password),
+                timeout=1,
+            )
+    '''
+    def __init__(self, account=Account, executor=None, max_concurrency=None):
+        '''
+        :param ~eth_account.account.Account account: the API whose methods are run
+        :param executor: where to run the methods, or ``None`` for the event loop's
+            default executor
+        :type executor: ~concurrent.futures.Executor
+        :param int max_concurrency: the most calls to run at once, or ``None`` for
+            no limit beyond the executor's own
+        '''
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Concurrency must be at least 1, got %r" % max_concurrency)
+        self._publicapi = account
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        # semaphores are bound to an event loop, so one is made for each loop in use
+        self._semaphores = {}
+
+    async def decrypt(self, keyfile_json, password):
+        '''
+        Awaitable :meth:`~eth_account.account.Account.decrypt`.
+        '''
+        return await self._call('decrypt', keyfile_json, password)
+
+    async def encrypt(self, private_key, password, kdf=None, iterations=None):
+        '''
+        Awaitable :meth:`~eth_account.account.Account.encrypt`.
+        '''
+        return await self._call('encrypt', private_key, password, kdf=kdf, iterations=iterations)
+
+    async def signHash(self, message_hash, private_key):
+        '''
+        Awaitable :meth:`~eth_account.account.Account.signHash`.
+        '''
+        return await self._call('signHash', message_hash, private_key)
+
+    async def signTransaction(self, transaction_dict, private_key):
+        '''
+        Awaitable :meth:`~eth_account.account.Account.signTransaction`.
+        '''
+        return await self._call('signTransaction', transaction_dict, private_key)
+
+    async def _call(self, method_name, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        call = partial(call_account_method, self._publicapi, method_name, args, kwargs)
+        if self.max_concurrency is None:
+            results = await loop.run_in_executor(self.executor, call)
+        else:
+            semaphore = self._semaphore(loop)
+            await semaphore.acquire()
+            try:
+                future = loop.run_in_executor(self.executor, call)
+            except BaseException:
+                semaphore.release()
+                raise
+            # released when the work is done, rather than when this call is cancelled
+            future.add_done_callback(lambda _: semaphore.release())
+            results = await asyncio.shield(future)
+
+        (result,) = restore_results(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _semaphore(self, loop):
+        try:
+            return self._semaphores[loop]
+        except KeyError:
+            # made from within the loop, which the semaphore binds to on older Pythons
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores = {
+                # drop the semaphores of closed loops, which can't be used again
+                other_loop: other_semaphore
+                for other_loop, other_semaphore in self._semaphores.items()
+                if not other_loop.is_closed()
+            }
+            self._semaphores[loop] = semaphore
+            return semaphore
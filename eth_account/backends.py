@@ -0,0 +1,212 @@
+from eth_keys.backends.base import (
+    BaseECCBackend,
+)
+from eth_keys.backends.native import (
+    NativeECCBackend,
+)
+from eth_keys.backends.native.ecdsa import (
+    deterministic_generate_k,
+)
+from eth_keys.datatypes import (
+    NonRecoverableSignature,
+    PublicKey,
+    Signature,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+)
+
+from eth_account._utils import (
+    secp256k1,
+)
+from eth_account._utils.secp256k1 import (
+    N,
+    P,
+)
+
+
+def encode_public_key(affine):
+    (x, y) = affine
+    return x.to_bytes(32, 'big') + y.to_bytes(32, 'big')
+
+
+def decode_public_key(public_key_bytes):
+    return (
+        int.from_bytes(public_key_bytes[:32], 'big'),
+        int.from_bytes(public_key_bytes[32:], 'big'),
+    )
+
+
+def ecdsa_raw_sign(msg_hash, private_key_bytes):
+    '''
+    Deterministic (RFC 6979) ECDSA signature, returning ``(v, r, s)`` with a low ``s``,
+    exactly like the native backend of eth-keys.
+    '''
+    z = int.from_bytes(msg_hash, 'big')
+    private_key = int.from_bytes(private_key_bytes, 'big')
+    k = deterministic_generate_k(msg_hash, private_key_bytes)
+
+    (x, y) = secp256k1.to_affine(secp256k1.multiply_generator(k))
+    r = x % N
+    s_raw = secp256k1.inverse_mod(k, N) * (z + r * private_key) % N
+
+    if s_raw * 2 < N:
+        return ((y & 1), r, s_raw)
+    else:
+        return ((y & 1) ^ 1, r, N - s_raw)
+
+
+def _recovery_inputs(msg_hash, vrs):
+    (v, r, s) = vrs
+    if v not in (0, 1):
+        raise BadSignature("v must be 0 or 1, got %r" % v)
+    if not (0 < r < N) or not (0 < s < N):
+        raise BadSignature("Invalid signature")
+
+    signature_point = secp256k1.lift_x(r, v)
+    if signature_point is None:
+        raise BadSignature("Invalid signature")
+    return (int.from_bytes(msg_hash, 'big'), r, s, signature_point)
+
+
+def _recovered_point(z, r_inverse, s, signature_point):
+    # Q = r^-1 * (s * R - z * G), computed as u1 * G + u2 * R in one pass
+    public_key_point = secp256k1.multiply_two(
+        -z * r_inverse % N,
+        signature_point,
+        s * r_inverse % N,
+    )
+    if not public_key_point[2]:
+        raise BadSignature("Invalid signature")
+    return public_key_point
+
+
+def ecdsa_raw_recover(msg_hash, vrs):
+    '''
+    Recover the affine public key point from a message hash and a signature with
+    ``v`` in ``{0, 1}``.
+    '''
+    (z, r, s, signature_point) = _recovery_inputs(msg_hash, vrs)
+    r_inverse = secp256k1.inverse_mod(r, N)
+    return secp256k1.to_affine(_recovered_point(z, r_inverse, s, signature_point))
+
+
+def ecdsa_raw_recover_many(hashes_and_vrs):
+    '''
+    Recover the affine public key points for many ``(msg_hash, vrs)`` pairs, like
+    :func:`ecdsa_raw_recover`. The inversions of ``r`` modulo the group order, and
+    the conversions of the results to affine coordinates, each share a single
+    modular inversion across the whole batch.
+
+    :raises BadSignature: on the first invalid signature
+    '''
+    recovery_inputs = [_recovery_inputs(msg_hash, vrs) for msg_hash, vrs in hashes_and_vrs]
+    r_inverses = secp256k1.batch_inverse([r for (_, r, _, _) in recovery_inputs], N)
+    public_key_points = [
+        _recovered_point(z, r_inverse, s, signature_point)
+        for (z, _, s, signature_point), r_inverse in zip(recovery_inputs, r_inverses)
+    ]
+    return secp256k1.batch_to_affine(public_key_points)
+
+
+def recovers_in_batches(backend):
+    '''
+    Whether :func:`ecdsa_raw_recover_many` beats recovering each signature one by one
+    with ``backend``. It does for the pure Python backends: the default native one and
+    :class:`FastPythonECCBackend`. C backends, like coincurve, are faster on their own.
+    '''
+    return type(backend) in (NativeECCBackend, FastPythonECCBackend)
+
+
+def private_keys_to_public_keys(private_keys):
+    '''
+    The affine public key point of each private key, given as an int. The conversions
+    of the points to affine coordinates share a single modular inversion across the
+    whole batch.
+    '''
+    return secp256k1.batch_to_affine([
+        secp256k1.multiply_generator(private_key) for private_key in private_keys
+    ])
+
+
+def ecdsa_raw_verify(msg_hash, rs, public_key_bytes):
+    (r, s) = rs
+    if not (0 < r < N) or not (0 < s < N):
+        return False
+
+    public_key_point = decode_public_key(public_key_bytes)
+    if not secp256k1.is_on_curve(public_key_point):
+        return False
+
+    z = int.from_bytes(msg_hash, 'big')
+    s_inverse = secp256k1.inverse_mod(s, N)
+    point = secp256k1.multiply_two(z * s_inverse % N, public_key_point, r * s_inverse % N)
+    if not point[2]:
+        return False
+    (x, _) = secp256k1.to_affine(point)
+    return x % N == r
+
+
+class FastPythonECCBackend(BaseECCBackend):
+    '''
+    An eth-keys backend written in pure Python (so it needs no C extensions), that
+    is several times faster than the default native backend. It produces exactly the
+    same signatures and keys.
+
+    Multiples of the generator point come from a precomputed comb table, other
+    multiplications use wNAF with the GLV endomorphism, signature recovery and
+    verification run both multiplications in one doubling chain (Shamir's trick),
+    and all of it is done in Jacobian coordinates. See
+    :mod:`eth_account._utils.secp256k1` for the details.
+
+    The precomputed tables for the generator are built on first use, which takes a
+    fraction of a second.
+
+    .. code-block:: python
+
+        >>> from eth_account import Account
+        >>> from eth_account.backends import FastPythonECCBackend
+        >>> acct = Account()
+        >>> acct.setKeyBackend(FastPythonECCBackend)
+        >>> acct.signHash(msghash, key)
+    '''
+    def ecdsa_sign(self, msg_hash, private_key):
+        signature_vrs = ecdsa_raw_sign(msg_hash, private_key.to_bytes())
+        return Signature(vrs=signature_vrs, backend=self)
+
+    def ecdsa_sign_non_recoverable(self, msg_hash, private_key):
+        (_, r, s) = ecdsa_raw_sign(msg_hash, private_key.to_bytes())
+        return NonRecoverableSignature(rs=(r, s), backend=self)
+
+    def ecdsa_verify(self, msg_hash, signature, public_key):
+        return ecdsa_raw_verify(msg_hash, signature.rs, public_key.to_bytes())
+
+    def ecdsa_recover(self, msg_hash, signature):
+        public_key_point = ecdsa_raw_recover(msg_hash, signature.vrs)
+        return PublicKey(encode_public_key(public_key_point), backend=self)
+
+    def private_key_to_public_key(self, private_key):
+        scalar = int.from_bytes(private_key.to_bytes(), 'big')
+        if not (0 < scalar < N):
+            raise ValueError("Invalid private key")
+        public_key_point = secp256k1.to_affine(secp256k1.multiply_generator(scalar))
+        return PublicKey(encode_public_key(public_key_point), backend=self)
+
+    def decompress_public_key_bytes(self, compressed_public_key_bytes):
+        if len(compressed_public_key_bytes) != 33:
+            raise ValueError("Invalid compressed public key")
+        prefix = compressed_public_key_bytes[0]
+        if prefix not in (2, 3):
+            raise ValueError("Invalid compressed public key")
+        x = int.from_bytes(compressed_public_key_bytes[1:], 'big')
+        if x >= P:
+            raise ValueError("Invalid compressed public key")
+        point = secp256k1.lift_x(x, prefix == 3)
+        if point is None:
+            raise ValueError("Invalid compressed public key")
+        return encode_public_key(point)
+
+    def compress_public_key_bytes(self, uncompressed_public_key_bytes):
+        (x, y) = decode_public_key(uncompressed_public_key_bytes)
+        prefix = b'\x03' if y & 1 else b'\x02'
+        return prefix + x.to_bytes(32, 'big')
@@ -1,6 +1,38 @@
+from collections.abc import (
+    Mapping,
+)
+
 from attrdict import (
     AttrDict,
 )
+from eth_utils import (
+    to_checksum_address,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from eth_account._utils.signing import (
+    extract_chain_id,
+)
+
+SIGNATURE_LENGTH = 65
+KEY_LENGTH = 32
+ADDRESS_LENGTH = 20
+
+# maps each v byte to the standard v, or to 0xff if it isn't a valid v
+_INVALID_V = 0xff
+
+
+def _standard_v_or_invalid(v):
+    try:
+        (_chain_id, chain_naive_v) = extract_chain_id(v)
+    except ValueError:
+        return _INVALID_V
+    return chain_naive_v - 27
+
+
+_STANDARD_V_TABLE = bytes(_standard_v_or_invalid(v) for v in range(256))
 
 
 class AttributeDict(AttrDict):
@@ -16,6 +48,10 @@ class AttributeDict(AttrDict):
             'For example, AttributeDict(old, replace_key=replace_val).'
         )
 
+    def __reduce__(self):
+        # unpickling would otherwise fill the dict through __setitem__, which is blocked
+        return (type(self), (dict(self),))
+
     def _repr_pretty_(self, builder, cycle):
         """
         Custom pretty output for the IPython console
@@ -26,3 +62,334 @@ class AttributeDict(AttrDict):
         else:
             builder.pretty(dict(self))
         builder.text(")")
+
+
+class _SlottedResult(Mapping):
+    '''
+    An immutable record with a fixed set of fields, that can be read both as
+    attributes and as a read-only mapping, just like an :class:`AttributeDict`.
+    '''
+    __slots__ = ()
+
+    def __init__(self, *values):
+        if len(values) != len(self.__slots__):
+            raise TypeError("%s takes %d fields, got %d" % (
+                type(self).__name__,
+                len(self.__slots__),
+                len(values),
+            ))
+        for field, value in zip(self.__slots__, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, attr, val):
+        raise TypeError(
+            '%s is immutable -- create a copy instead of modifying. '
+            'For example, AttributeDict(old, replace_key=replace_val).' % type(self).__name__
+        )
+
+    def __delattr__(self, attr):
+        self.__setattr__(attr, None)
+
+    def __getitem__(self, key):
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, field) for field in self.__slots__))
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, dict(self))
+
+
+class SignedMessage(_SlottedResult):
+    '''
+    The result of :meth:`~eth_account.account.Account.signHash`, when
+    :attr:`~eth_account.account.Account.lightweight_results` is set.
+
+    It has the same fields as the default :class:`AttributeDict` result, but takes
+    less memory and is faster to create and to read.
+    '''
+    __slots__ = ('messageHash', 'r', 's', 'v', 'signature')
+
+
+class SignedTransaction(_SlottedResult):
+    '''
+    The result of :meth:`~eth_account.account.Account.signTransaction`, when
+    :attr:`~eth_account.account.Account.lightweight_results` is set.
+
+    It has the same fields as the default :class:`AttributeDict` result, but takes
+    less memory and is faster to create and to read.
+    '''
+    __slots__ = ('rawTransaction', 'hash', 'r', 's', 'v')
+
+
+class SignatureArray(object):
+    '''
+    Many 65-byte signatures, stored back to back in a single :class:`bytearray`.
+
+    Each signature is laid out like the ``signature`` returned by
+    :meth:`~eth_account.account.Account.signHash`: 32 bytes of ``r``, 32 bytes of
+    ``s`` and one byte of ``v``. Storing them this way takes 65
+    bytes per signature, instead of a separate object for each one, and lets
+    :attr:`v` and :meth:`standardized` work on all the signatures at once.
+
+    .. code-block:: python
+
+        >>> signatures = SignatureArray.fromSignatures(
+                signed.signature for signed in signed_messages)
+        >>> signatures.v
+        b'\\x1b\\x1c\\x1c'
+        >>> Account.recoverHashes(zip(message_hashes, signatures.vrs))
+    '''
+    def __init__(self, packed_signatures=b''):
+        '''
+        :param packed_signatures: signatures concatenated back to back
+        :type packed_signatures: bytes-like object
+        '''
+        if len(packed_signatures) % SIGNATURE_LENGTH:
+            raise ValueError(
+                "Packed signatures must be a multiple of %d bytes long, got %d bytes" % (
+                    SIGNATURE_LENGTH,
+                    len(packed_signatures),
+                )
+            )
+        self._packed = bytearray(packed_signatures)
+
+    @classmethod
+    def fromSignatures(cls, signatures):
+        '''
+        :param signatures: the signatures to pack
+        :type signatures: iterable of hex str, bytes or int
+        '''
+        signature_array = cls()
+        signature_array.extend(signatures)
+        return signature_array
+
+    def append(self, signature):
+        signature_bytes = HexBytes(signature)
+        if len(signature_bytes) != SIGNATURE_LENGTH:
+            raise ValueError(
+                "Signatures must be %d bytes long, got %d bytes" % (
+                    SIGNATURE_LENGTH,
+                    len(signature_bytes),
+                )
+            )
+        self._packed += signature_bytes
+
+    def extend(self, signatures):
+        for signature in signatures:
+            self.append(signature)
+
+    @property
+    def packed(self):
+        '''
+        A :class:`memoryview` of all the signatures, back to back, without copying them.
+        Release it before appending more signatures.
+        '''
+        return memoryview(self._packed)
+
+    @property
+    def r(self):
+        return [
+            int.from_bytes(self._packed[offset:offset + 32], 'big')
+            for offset in range(0, len(self._packed), SIGNATURE_LENGTH)
+        ]
+
+    @property
+    def s(self):
+        return [
+            int.from_bytes(self._packed[offset:offset + 32], 'big')
+            for offset in range(32, len(self._packed), SIGNATURE_LENGTH)
+        ]
+
+    @property
+    def v(self):
+        '''
+        The ``v`` of every signature, one per byte.
+        '''
+        return bytes(self._packed[SIGNATURE_LENGTH - 1::SIGNATURE_LENGTH])
+
+    @property
+    def vrs(self):
+        '''
+        The ``(v, r, s)`` of every signature, ready for
+        :meth:`~eth_account.account.Account.recoverHashes`.
+        '''
+        return list(zip(self.v, self.r, self.s))
+
+    def standardized(self):
+        '''
+        Convert every ``v`` to a standard ``v`` of 0 or 1 in a single pass, like
+        :func:`~eth_account._utils.signing.to_standard_signature_bytes` does for
+        one signature.
+
+        :returns: a new array with the standardized signatures
+        :rtype: SignatureArray
+        :raises ValueError: if any ``v`` is invalid
+        '''
+        standard_vs = self.v.translate(_STANDARD_V_TABLE)
+        invalid_index = standard_vs.find(_INVALID_V)
+        if invalid_index != -1:
+            raise ValueError(
+                "Signature %d has an invalid v: %d" % (invalid_index, self.v[invalid_index])
+            )
+        standardized = type(self)()
+        standardized._packed = bytearray(self._packed)
+        standardized._packed[SIGNATURE_LENGTH - 1::SIGNATURE_LENGTH] = standard_vs
+        return standardized
+
+    def __len__(self):
+        return len(self._packed) // SIGNATURE_LENGTH
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            (start, stop, step) = index.indices(len(self))
+            if step != 1:
+                raise ValueError("Slices of a SignatureArray must be contiguous")
+            return type(self)(self._packed[start * SIGNATURE_LENGTH:stop * SIGNATURE_LENGTH])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SignatureArray index out of range")
+        offset = index * SIGNATURE_LENGTH
+        return HexBytes(self._packed[offset:offset + SIGNATURE_LENGTH])
+
+    def __iter__(self):
+        for offset in range(0, len(self._packed), SIGNATURE_LENGTH):
+            yield HexBytes(self._packed[offset:offset + SIGNATURE_LENGTH])
+
+    def __eq__(self, other):
+        if not isinstance(other, SignatureArray):
+            return NotImplemented
+        return self._packed == other._packed
+
+    def __repr__(self):
+        return '%s(<%d signatures>)' % (type(self).__name__, len(self))
+
+
+class KeyArray(object):
+    '''
+    Many private keys and their addresses, as returned by
+    :meth:`~eth_account.account.Account.createMany`.
+
+    The 32-byte keys are stored back to back in one :class:`bytearray`, and the
+    20-byte canonical addresses in another, in the same order. That takes 52 bytes
+    per account, instead of a :class:`~eth_account.signers.local.LocalAccount` and its
+    key objects for each one.
+
+    .. code-block:: python
+
+        >>> keys = Account.createMany(3)
+        >>> len(keys)
+        3
+        >>> private_key, address = keys[0]
+        >>> Account.privateKeyToAccount(private_key).address == address
+        True
+        >>> with open('addresses.bin', 'wb') as addresses_file:
+        ...     addresses_file.write(keys.packedAddresses)
+    '''
+    def __init__(self, packed_keys=b'', packed_addresses=b''):
+        '''
+        :param packed_keys: private keys concatenated back to back
+        :type packed_keys: bytes-like object
+        :param packed_addresses: the canonical address of each key, back to back
+        :type packed_addresses: bytes-like object
+        '''
+        if len(packed_keys) % KEY_LENGTH or len(packed_addresses) % ADDRESS_LENGTH:
+            raise ValueError(
+                "Packed keys and addresses must be multiples of %d and %d bytes long, "
+                "got %d and %d bytes" % (
+                    KEY_LENGTH,
+                    ADDRESS_LENGTH,
+                    len(packed_keys),
+                    len(packed_addresses),
+                )
+            )
+        if len(packed_keys) // KEY_LENGTH != len(packed_addresses) // ADDRESS_LENGTH:
+            raise ValueError("There must be exactly one address per key")
+        self._packed_keys = bytearray(packed_keys)
+        self._packed_addresses = bytearray(packed_addresses)
+
+    def extend(self, other):
+        self._packed_keys += other._packed_keys
+        self._packed_addresses += other._packed_addresses
+
+    @property
+    def packedKeys(self):
+        '''
+        A :class:`memoryview` of all the keys, back to back, without copying them.
+        Release it before extending the array.
+        '''
+        return memoryview(self._packed_keys)
+
+    @property
+    def packedAddresses(self):
+        '''
+        A :class:`memoryview` of all the canonical addresses, back to back, without
+        copying them. Release it before extending the array.
+        '''
+        return memoryview(self._packed_addresses)
+
+    def privateKey(self, index):
+        '''
+        :rtype: ~hexbytes.main.HexBytes
+        '''
+        offset = self._offset(index) * KEY_LENGTH
+        return HexBytes(self._packed_keys[offset:offset + KEY_LENGTH])
+
+    def address(self, index):
+        '''
+        :returns: the address, hex-encoded & checksummed
+        :rtype: str
+        '''
+        offset = self._offset(index) * ADDRESS_LENGTH
+        # new addresses are seen once, so they would only churn the cache of
+        # eth_account._utils.addresses.to_checksum_address
+        return to_checksum_address(bytes(self._packed_addresses[offset:offset + ADDRESS_LENGTH]))
+
+    def _offset(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("KeyArray index out of range")
+        return index
+
+    def __len__(self):
+        return len(self._packed_keys) // KEY_LENGTH
+
+    def __getitem__(self, index):
+        '''
+        :returns: the private key and checksummed address at the index
+        '''
+        if isinstance(index, slice):
+            (start, stop, step) = index.indices(len(self))
+            if step != 1:
+                raise ValueError("Slices of a KeyArray must be contiguous")
+            return type(self)(
+                self._packed_keys[start * KEY_LENGTH:stop * KEY_LENGTH],
+                self._packed_addresses[start * ADDRESS_LENGTH:stop * ADDRESS_LENGTH],
+            )
+        return (self.privateKey(index), self.address(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, KeyArray):
+            return NotImplemented
+        return (
+            self._packed_keys == other._packed_keys and
+            self._packed_addresses == other._packed_addresses
+        )
+
+    def __repr__(self):
+        return '%s(<%d keys>)' % (type(self).__name__, len(self))
@@ -0,0 +1,195 @@
+'''
+Pick the work factors of the key derivation functions, so that unlocking a keyfile
+takes a chosen amount of time on this machine.
+
+Run it as a script, and point :attr:`~eth_account.account.Account.kdf_profile` (or
+the environment variable :envvar:`ETH_ACCOUNT_KDF_PROFILE`) at the profile it writes,
+so that :meth:`~eth_account.account.Account.encrypt` uses those work factors:
+
+.. code-block:: shell
+
+    $ python -m eth_account.kdf_calibrate --target-ms 250 --max-memory-mb 64 \\
+        --output ~/.eth_account_kdf.json
+    scrypt: n=65536 (8 MB), 146 ms
+    pbkdf2: c=235000, 249 ms
+    $ export ETH_ACCOUNT_KDF_PROFILE=~/.eth_account_kdf.json
+
+Only the work factor is calibrated: ``n`` for scrypt, whose ``r`` and ``p`` stay
+those of eth-keyfile, and ``c`` for pbkdf2. Scrypt's ``n`` must be a power of two,
+so its unlock time lands between half the target and the target.
+'''
+import argparse
+import json
+import sys
+import time
+
+from eth_keyfile.keyfile import (
+    DKLEN,
+    SCRYPT_P,
+    SCRYPT_R,
+)
+
+from eth_account._utils.keyfile import (
+    KDF_ENGINES,
+    derive_key,
+    openssl_supports_scrypt,
+)
+
+KDFS = ('scrypt', 'pbkdf2')
+
+# Starting work factors, small enough to measure in a few milliseconds
+_SCRYPT_PROBE_N = 2 ** 12
+_PBKDF2_PROBE_C = 10000
+# pbkdf2 work factors are rounded down to a multiple of this
+_PBKDF2_STEP = 1000
+
+_SALT = '00' * 16
+_PASSWORD = b'calibration'
+
+
+def _kdfparams(kdf, iterations):
+    if kdf == 'scrypt':
+        return {'dklen': DKLEN, 'n': iterations, 'r': SCRYPT_R, 'p': SCRYPT_P, 'salt': _SALT}
+    else:
+        return {'c': iterations, 'dklen': DKLEN, 'prf': 'hmac-sha256', 'salt': _SALT}
+
+
+def measure_ms(kdf, iterations, engine='auto', repeat=3):
+    '''
+    :returns: the fastest of ``repeat`` runs of the key derivation function, in
+        milliseconds
+    :rtype: float
+    '''
+    kdfparams = _kdfparams(kdf, iterations)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        derive_key(kdf, kdfparams, _PASSWORD, engine)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def scrypt_memory(n):
+    '''
+    :returns: the bytes of memory that scrypt needs with work factor ``n``
+    '''
+    return 128 * SCRYPT_R * n
+
+
+def _scrypt_fits(n, max_memory, engine):
+    if max_memory is not None and scrypt_memory(n) > max_memory:
+        return False
+    # the 'openssl' engine refuses the parameters that OpenSSL can't run
+    return engine != 'openssl' or openssl_supports_scrypt(n, SCRYPT_R)
+
+
+def _calibrate_scrypt(target_ms, max_memory, engine, repeat):
+    n = _SCRYPT_PROBE_N
+    ms = measure_ms('scrypt', n, engine, repeat)
+    # the time grows linearly with n, so double it while the next step fits
+    while ms * 2 <= target_ms and _scrypt_fits(n * 2, max_memory, engine):
+        n *= 2
+        ms = measure_ms('scrypt', n, engine, repeat)
+    while n > 2 and (ms > target_ms or (max_memory is not None and scrypt_memory(n) > max_memory)):
+        n //= 2
+        ms = measure_ms('scrypt', n, engine, repeat)
+    return {'iterations': n, 'ms': round(ms, 1), 'memory': scrypt_memory(n)}
+
+
+def _calibrate_pbkdf2(target_ms, engine, repeat):
+    probe_ms = measure_ms('pbkdf2', _PBKDF2_PROBE_C, engine, repeat)
+    c = _PBKDF2_PROBE_C * target_ms / probe_ms
+    c = max(_PBKDF2_STEP, int(c) // _PBKDF2_STEP * _PBKDF2_STEP)
+    ms = measure_ms('pbkdf2', c, engine, repeat)
+    # correct the estimate, if measuring at full size shows it was off
+    if ms > target_ms:
+        c = max(_PBKDF2_STEP, int(c * target_ms / ms) // _PBKDF2_STEP * _PBKDF2_STEP)
+        ms = measure_ms('pbkdf2', c, engine, repeat)
+    return {'iterations': c, 'ms': round(ms, 1)}
+
+
+def calibrate(target_ms, max_memory=None, kdfs=KDFS, engine='auto', repeat=3):
+    '''
+    Find the largest work factors whose key derivation takes at most ``target_ms``
+    milliseconds on this machine, and for scrypt, needs at most ``max_memory`` bytes.
+
+    :param float target_ms: the time that unlocking a keyfile should take
+    :param int max_memory: the most memory that scrypt may use, or ``None`` for no limit
+    :param kdfs: the key derivation functions to calibrate
+    :param str engine: where to run the key derivation functions, as in
+        :attr:`~eth_account.account.Account.kdf_engine`
+    :param int repeat: how many times to run each measurement, keeping the fastest
+    :returns: the profile, which maps each key derivation function to its work factor
+        (``iterations``), measured time (``ms``) and, for scrypt, memory (``memory``)
+    :rtype: dict
+    '''
+    if target_ms <= 0:
+        raise ValueError("The target time must be positive, got %r" % target_ms)
+    profile = {'target_ms': target_ms, 'engine': engine}
+    for kdf in kdfs:
+        if kdf == 'scrypt':
+            profile[kdf] = _calibrate_scrypt(target_ms, max_memory, engine, repeat)
+        elif kdf == 'pbkdf2':
+            profile[kdf] = _calibrate_pbkdf2(target_ms, engine, repeat)
+        else:
+            raise ValueError("Unsupported key derivation function: %r" % kdf)
+    return profile
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m eth_account.kdf_calibrate',
+        description="Pick key derivation work factors that take a given time to unlock.",
+    )
+    parser.add_argument(
+        '--target-ms',
+        type=float,
+        required=True,
+        help="how long unlocking a keyfile should take, in milliseconds",
+    )
+    parser.add_argument(
+        '--max-memory-mb',
+        type=float,
+        help="the most memory that scrypt may use, in megabytes",
+    )
+    parser.add_argument('--kdf', choices=KDFS, action='append', help="default: all of them")
+    parser.add_argument('--engine', choices=KDF_ENGINES, default='auto')
+    parser.add_argument('--repeat', type=int, default=3, help="runs per measurement")
+    parser.add_argument('--output', help="where to write the profile, instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.max_memory_mb is None:
+        max_memory = None
+    else:
+        max_memory = int(args.max_memory_mb * 1024 ** 2)
+    profile = calibrate(
+        args.target_ms,
+        max_memory=max_memory,
+        kdfs=args.kdf or KDFS,
+        engine=args.engine,
+        repeat=args.repeat,
+    )
+
+    for kdf in KDFS:
+        if kdf == 'scrypt' and kdf in profile:
+            print("scrypt: n=%d (%d MB), %d ms" % (
+                profile[kdf]['iterations'],
+                profile[kdf]['memory'] // 1024 ** 2,
+                profile[kdf]['ms'],
+            ), file=sys.stderr)
+        elif kdf in profile:
+            print("pbkdf2: c=%d, %d ms" % (
+                profile[kdf]['iterations'],
+                profile[kdf]['ms'],
+            ), file=sys.stderr)
+
+    if args.output is None:
+        json.dump(profile, sys.stdout, indent=2, sort_keys=True)
+        print()
+    else:
+        with open(args.output, 'w') as output:
+            json.dump(profile, output, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
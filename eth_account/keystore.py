@@ -0,0 +1,240 @@
+from collections import (
+    namedtuple,
+)
+import hashlib
+import hmac
+import json
+import os
+import threading
+
+from eth_utils import (
+    is_hex_address,
+    text_if_str,
+    to_bytes,
+    to_canonical_address,
+)
+
+from eth_account._utils.addresses import (
+    to_checksum_address,
+)
+from eth_account.account import (
+    Account,
+)
+
+# What a scan remembers about each keyfile, to tell whether it changed since
+_FileState = namedtuple('_FileState', ['mtime_ns', 'size', 'address'])
+
+
+class KeystoreDirectory(object):
+    '''
+    An index of the keyfiles in a keystore directory, like the ones kept by geth and
+    parity, by address.
+
+    Scanning only reads the plaintext ``address`` field of each keyfile, so it is fast
+    even for very large directories. A key is decrypted the first time its address
+    is unlocked, and kept for later. :meth:`scan` again to pick up changes: only the
+    files that were added, or whose modification time or size changed, are read.
+
+    Files that aren't JSON objects with a valid ``address`` are skipped. If several
+    keyfiles have the same address, the most recently modified one is used.
+
+    .. code-block:: python
+
+        >>> keystore = KeystoreDirectory('~/.ethereum/keystore')
+        >>> len(keystore)
+        100000
+        >>> '0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E' in keystore
+        True
+        >>> acct = keystore.unlock('0x5ce9454909639D2D17A3F753ce7d93fa0b9aB12E', password)
+        >>> acct.signTransaction(transaction)
+    '''
+    def __init__(self, path, account=Account):
+        '''
+        :param str path: the keystore directory, which is scanned right away
+        :param ~eth_account.account.Account account: the API used to decrypt keys
+        '''
+        self.path = os.path.expanduser(path)
+        self._publicapi = account
+        # keyfile name -> _FileState
+        self._files = {}
+        # canonical address -> keyfile name
+        self._index = {}
+        # canonical address -> (file state, password MAC, unlocked LocalAccount)
+        self._unlocked = {}
+        # keys the MACs of the passwords of unlocked accounts
+        self._password_secret = os.urandom(32)
+        self._lock = threading.Lock()
+        self.scan()
+
+    def scan(self):
+        '''
+        Bring the index up to date with the directory.
+
+        :returns: the number of keyfiles that were added, changed or removed
+        :rtype: int
+        '''
+        with self._lock:
+            files = {}
+            changes = 0
+            # not used as a context manager, which needs Python 3.6
+            for entry in os.scandir(self.path):
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                state = self._files.get(entry.name)
+                if state is None or (state.mtime_ns, state.size) != (
+                        stat.st_mtime_ns, stat.st_size):
+                    state = _FileState(
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        _read_address(entry.path),
+                    )
+                    changes += 1
+                files[entry.name] = state
+            changes += len(self._files.keys() - files.keys())
+
+            if changes:
+                self._files = files
+                self._reindex()
+            return changes
+
+    def _reindex(self):
+        index = {}
+        for name, state in sorted(self._files.items()):
+            if state.address is None:
+                continue
+            current = index.get(state.address)
+            if current is None or self._files[current].mtime_ns < state.mtime_ns:
+                index[state.address] = name
+        self._index = index
+
+        # forget unlocked keys whose keyfile was changed or removed
+        self._unlocked = {
+            address: unlocked
+            for address, unlocked in self._unlocked.items()
+            if address in index and self._files[index[address]] == unlocked[0]
+        }
+
+    @property
+    def addresses(self):
+        '''
+        The checksummed address of every keyfile, in no particular order.
+        '''
+        return [to_checksum_address(address) for address in self._index]
+
+    def keyfilePath(self, address):
+        '''
+        :param address: the account address, in any format accepted by
+          :func:`eth_utils.to_canonical_address`
+        :returns: the path of the keyfile for the address
+        :rtype: str
+        :raises KeyError: if no keyfile has the address
+        '''
+        return os.path.join(self.path, self._index[_canonical_address(address)])
+
+    def loadKeyfile(self, address):
+        '''
+        :returns: the encrypted keyfile for the address, ready for
+          :meth:`~eth_account.account.Account.decrypt`
+        :rtype: dict
+        :raises KeyError: if no keyfile has the address
+        '''
+        with open(self.keyfilePath(address)) as keyfile:
+            return json.load(keyfile)
+
+    def unlock(self, address, password):
+        '''
+        Decrypt the key for the address, unless it was already unlocked with the same
+        password.
+
+        The password is checked on every call. A password other than the one that
+        unlocked the key goes through the full key derivation again, so a wrong
+        password is rejected no faster than it would be without the unlocked key.
+
+        :param str password: the password of the keyfile
+        :returns: the account, which can sign
+        :rtype: ~eth_account.signers.local.LocalAccount
+        :raises KeyError: if no keyfile has the address
+        :raises ValueError: if the password is wrong
+        '''
+        canonical_address = _canonical_address(address)
+        password_mac = hmac.new(
+            self._password_secret,
+            text_if_str(to_bytes, password),
+            hashlib.sha256,
+        ).digest()
+        with self._lock:
+            name = self._index[canonical_address]
+            state = self._files[name]
+            unlocked = self._unlocked.get(canonical_address)
+        if unlocked is not None:
+            (unlocked_state, unlocked_password_mac, unlocked_account) = unlocked
+            if unlocked_state == state and hmac.compare_digest(
+                    unlocked_password_mac, password_mac):
+                return unlocked_account
+
+        with open(os.path.join(self.path, name)) as keyfile:
+            keyfile_json = json.load(keyfile)
+        private_key = self._publicapi.decrypt(keyfile_json, password)
+        account = self._publicapi.privateKeyToAccount(private_key)
+        if account.address != to_checksum_address(canonical_address):
+            raise ValueError(
+                "Keyfile %s claims address %s, but its key belongs to %s" % (
+                    name,
+                    to_checksum_address(canonical_address),
+                    account.address,
+                )
+            )
+
+        with self._lock:
+            self._unlocked[canonical_address] = (state, password_mac, account)
+        return account
+
+    def isUnlocked(self, address):
+        '''
+        :returns: whether the key for the address was unlocked, and not locked since
+        :rtype: bool
+        '''
+        return _canonical_address(address) in self._unlocked
+
+    def lock(self, address=None):
+        '''
+        Forget the unlocked key for the address, or all unlocked keys if it's ``None``.
+        '''
+        with self._lock:
+            if address is None:
+                self._unlocked.clear()
+            else:
+                self._unlocked.pop(_canonical_address(address), None)
+
+    def __contains__(self, address):
+        try:
+            return _canonical_address(address) in self._index
+        except (TypeError, ValueError):
+            return False
+
+    def __iter__(self):
+        return iter(self.addresses)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.path)
+
+
+def _canonical_address(address):
+    if isinstance(address, bytes) and len(address) == 20:
+        return address
+    return to_canonical_address(address)
+
+
+def _read_address(path):
+    try:
+        with open(path) as keyfile:
+            address = json.load(keyfile).get('address')
+    except (OSError, ValueError, AttributeError):
+        return None
+    if not isinstance(address, str) or not is_hex_address(address):
+        return None
+    return to_canonical_address(address)
@@ -44,6 +44,18 @@ class BaseAccount(ABC):
         '''
         pass
 
+    def signTransactions(self, transaction_dicts):
+        '''
+        Sign several transactions, as in :meth:`~eth_account.account.Account.signTransactions`
+        but without specifying the private key.
+
+        Subclasses may override this to share per-key setup across the batch.
+
+        :var transaction_dicts: iterable of transactions with all fields specified
+        :returns: the signed transactions, in order
+        '''
+        return [self.signTransaction(transaction_dict) for transaction_dict in transaction_dicts]
+
     def __eq__(self, other):
         '''
         Equality test between two accounts.
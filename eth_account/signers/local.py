@@ -1,3 +1,6 @@
+from eth_account._utils.addresses import (
+    to_checksum_address,
+)
 from eth_account.signers.base import (
     BaseAccount,
 )
@@ -30,7 +33,7 @@ class LocalAccount(BaseAccount):
         '''
         self._publicapi = account
 
-        self._address = key.public_key.to_checksum_address()
+        self._address = to_checksum_address(key.public_key.to_canonical_address())
 
         key_raw = key.to_bytes()
         self._privateKey = key_raw
@@ -55,14 +58,26 @@ class LocalAccount(BaseAccount):
         '''
         return self._publicapi.encrypt(self.privateKey, password, kdf=kdf, iterations=iterations)
 
-    def signHash(self, message_hash):
+    # The signing methods below hand the already-parsed key object (or this account)
+    # back to the API, so the public key isn't derived again on every signature.
+
+    def signHash(self, message_hash, raw_bytes=None):
         return self._publicapi.signHash(
             message_hash,
-            private_key=self.privateKey,
+            private_key=self._key_obj,
+            raw_bytes=raw_bytes,
         )
 
-    def signTransaction(self, transaction_dict):
-        return self._publicapi.signTransaction(transaction_dict, self.privateKey)
+    def signTransaction(self, transaction_dict, raw_bytes=None):
+        return self._publicapi._signTransactionWithAccount(self, transaction_dict, raw_bytes)
+
+    def signTransactions(self, transaction_dicts, **kwargs):
+        '''
+        Sign several transactions, as in
+        :meth:`~eth_account.account.Account.signTransactions`, but without a private key
+        argument. Accepts the same keyword arguments, like ``workers``.
+        '''
+        return self._publicapi._signTransactionsWithAccount(self, transaction_dicts, **kwargs)
 
     def __bytes__(self):
         return self.privateKey
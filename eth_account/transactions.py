@@ -0,0 +1,323 @@
+from collections.abc import (
+    Mapping,
+)
+import itertools
+
+from eth_utils import (
+    keccak,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from eth_account._utils.raw_rlp import (
+    EMPTY_STRING,
+    encode_bytes,
+    encode_int,
+    encode_list,
+)
+from eth_account._utils.signing import (
+    extract_chain_id,
+    sign_transaction_hash,
+)
+from eth_account._utils.transactions import (
+    SIGNED_TRANSACTION_FIELDS,
+    TRANSACTION_VALID_VALUES,
+    UNSIGNED_TRANSACTION_FIELDS,
+    assert_valid_fields,
+    encode_int_field,
+    encode_unsigned_fields,
+    format_int_field,
+    locate_signed_transaction_fields,
+    normalize_transaction_fields,
+)
+from eth_account.account import (
+    Account,
+)
+
+_MISSING = object()
+
+
+class TransactionTemplate(object):
+    '''
+    A transaction where every field is fixed, except for the nonce and optionally the value.
+
+    The fixed fields are validated and RLP-encoded once, when the template is created.
+    Each signature only has to encode the nonce (and value, if it changes) and splice
+    it in with the pre-encoded fields, which makes this much cheaper than calling
+    :meth:`~eth_account.account.Account.signTransaction` over and over.
+
+    .. code-block:: python
+
+        >>> template = TransactionTemplate({
+                'to': '0xF0109fC8DF283027b6285cc889F5aA624EaC1F55',
+                'value': 1000000000,
+                'gas': 2000000,
+                'gasPrice': 234567897654321,
+                'chainId': 1,
+            })
+        >>> key = Account._parsePrivateKey(
+                '0x4c0883a69102937d6231471b5dbb6204fe5129617082792ae468d01a3f362318')
+        >>> template.signTransaction(0, key)
+        {'hash': HexBytes('0x6893a6ee8df79b0f5d64a180cd1ef35d030f3e296a5361cf04d02ce720d32ec5'),
+         'r': 4487286261793418179817841024889747115779324305375823110249149479905075174044,
+         'rawTransaction': HexBytes('0xf86a8086d55698372431831e848094f0109fc8df283027b6285cc889f5aa624eac1f55843b9aca008025a009ebb6ca057a0535d6186462bc0b465b561c94a295bdb0621fc19208ab149a9ca0440ffd775ce91a833ab410777204d5341a6f9fa91216a6f3ee2c051fea6a0428'),  # noqa: E501
+         's': 30785525769477805655994251009256770582792548537338581640010273753578382951464,
+         'v': 37}
+
+        # override the template's value for a single transaction
+        >>> template.signTransaction(1, key, value=5)
+    '''
+    def __init__(self, transaction_dict, account=Account):
+        '''
+        :param dict transaction_dict: the fixed fields, as accepted by
+          :meth:`~eth_account.account.Account.signTransaction`, but without a nonce
+        :param ~eth_account.account.Account account: the API used to parse private keys
+        '''
+        if not isinstance(transaction_dict, Mapping):
+            raise TypeError("transaction_dict must be dict-like, got %r" % transaction_dict)
+        if 'nonce' in transaction_dict:
+            raise TypeError(
+                "A transaction template must not include a nonce, supply it when signing"
+            )
+
+        template = dict(transaction_dict, nonce=0)
+        assert_valid_fields(template)
+        fields = normalize_transaction_fields(template)
+        (_nonce, gas_price, gas, to, value, data) = fields[:len(UNSIGNED_TRANSACTION_FIELDS)]
+
+        # fail on unserializable fields now, like Account.signTransaction would
+        encode_unsigned_fields(*fields[:len(UNSIGNED_TRANSACTION_FIELDS)])
+
+        self._publicapi = account
+        self._template = template
+
+        # RLP items of the fields between the nonce and the value, which never change
+        self._encoded_gas_price_gas_to = b''.join((
+            encode_int(gas_price),
+            encode_int(gas),
+            encode_bytes(to),
+        ))
+        self._encoded_value = encode_int(value)
+        self._encoded_data = encode_bytes(data)
+
+        if len(fields) == len(UNSIGNED_TRANSACTION_FIELDS):
+            self._chain_id = None
+            self._encoded_chain_suffix = b''
+        else:
+            self._chain_id = fields[len(UNSIGNED_TRANSACTION_FIELDS)]
+            self._encoded_chain_suffix = b''.join((
+                encode_int_field('v', self._chain_id),
+                EMPTY_STRING,
+                EMPTY_STRING,
+            ))
+
+    @property
+    def chainId(self):
+        '''
+        The chain ID that transactions from this template are bound to, or ``None``.
+        '''
+        return self._chain_id
+
+    def signTransaction(self, nonce, private_key, *, value=None):
+        '''
+        Sign the template with the given nonce, producing the same result as
+        :meth:`~eth_account.account.Account.signTransaction` on the full transaction.
+
+        Passing a parsed :class:`eth_keys.datatypes.PrivateKey` avoids deriving the public
+        key on each call. See :meth:`signTransactions` to sign many nonces at once.
+
+        :param nonce: the transaction nonce
+        :type nonce: int or hex str
+        :param private_key: the private key to sign the data with
+        :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
+        :param value: the value to send, or ``None`` to use the template's value
+        :type value: int or hex str
+        :returns: Various details about the signature - most
+          importantly the fields: v, r, and s
+        :rtype: AttributeDict
+        '''
+        key = self._publicapi._parsePrivateKey(private_key)
+        return self._sign(key, nonce, value)
+
+    def signTransactions(self, nonces, private_key, *, values=None):
+        '''
+        Sign the template once for each nonce, parsing the private key only once.
+
+        :param nonces: the nonce of each transaction
+        :type nonces: iterable of int
+        :param private_key: the private key to sign the data with
+        :type private_key: hex str, bytes, int or :class:`eth_keys.datatypes.PrivateKey`
+        :param values: the value of each transaction, paired up with ``nonces``,
+          or ``None`` to use the template's value for all of them
+        :type values: iterable of int
+        :returns: the signed transactions, in the same order as ``nonces``
+        :rtype: list(AttributeDict)
+        :raises ValueError: if ``values`` and ``nonces`` differ in length
+        '''
+        key = self._publicapi._parsePrivateKey(private_key)
+        if values is None:
+            pairs = zip(nonces, itertools.repeat(None))
+        else:
+            pairs = itertools.zip_longest(nonces, values, fillvalue=_MISSING)
+
+        signed = []
+        for nonce, value in pairs:
+            if nonce is _MISSING or value is _MISSING:
+                raise ValueError("There must be exactly one value per nonce")
+            signed.append(self._sign(key, nonce, value))
+        return signed
+
+    def _encode_varying_field(self, key, val):
+        if not TRANSACTION_VALID_VALUES[key](val):
+            raise TypeError("Transaction had invalid fields: %r" % {key: val})
+        return encode_int_field(key, format_int_field(val))
+
+    def _sign(self, key, nonce, value):
+        encoded_nonce = self._encode_varying_field('nonce', nonce)
+        if value is None:
+            encoded_value = self._encoded_value
+        else:
+            encoded_value = self._encode_varying_field('value', value)
+
+        transaction_hash = keccak(encode_list(
+            encoded_nonce,
+            self._encoded_gas_price_gas_to,
+            encoded_value,
+            self._encoded_data,
+            self._encoded_chain_suffix,
+        ))
+        (v, r, s) = sign_transaction_hash(key, transaction_hash, self._chain_id)
+        rlp_encoded = encode_list(
+            encoded_nonce,
+            self._encoded_gas_price_gas_to,
+            encoded_value,
+            self._encoded_data,
+            encode_int(v),
+            encode_int(r),
+            encode_int(s),
+        )
+
+        return self._publicapi._signedTransactionResult(rlp_encoded, keccak(rlp_encoded), r, s, v)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, {
+            key: val for key, val in self._template.items() if key != 'nonce'
+        })
+
+
+class SignedTransactionView(object):
+    '''
+    A read-only view of a serialized signed transaction, that decodes each field
+    only when it is accessed.
+
+    The RLP structure is validated and indexed once, when the view is created.
+    ``bytes``, ``bytearray`` and ``memoryview`` transactions are not copied, and the
+    :attr:`data` field is returned as a :class:`memoryview` into them, so large call
+    data is never copied unless you ask for it. Don't modify a ``bytearray`` while a
+    view of it is in use.
+
+    .. code-block:: python
+
+        >>> txn = SignedTransactionView(raw_transaction)
+        >>> txn.nonce, txn.value, txn.chainId
+        (0, 1000000000, 1)
+        >>> txn.to.hex()
+        'f0109fc8df283027b6285cc889f5aa624eac1f55'
+        >>> len(txn.data)
+        0
+    '''
+    __slots__ = ('_raw', '_field_offsets')
+
+    def __init__(self, serialized_transaction):
+        '''
+        :param serialized_transaction: the complete signed transaction
+        :type serialized_transaction: hex str, bytes, bytearray, memoryview or int
+        :raises rlp.exceptions.DecodingError: if the transaction is not valid RLP
+        :raises rlp.exceptions.ObjectDeserializationError: if the RLP isn't a valid
+          transaction
+        '''
+        if isinstance(serialized_transaction, (bytes, bytearray, memoryview)):
+            raw = memoryview(serialized_transaction)
+        else:
+            raw = memoryview(HexBytes(serialized_transaction))
+        self._field_offsets = locate_signed_transaction_fields(raw)
+        self._raw = raw
+
+    def _value(self, index):
+        (_, value_start, value_end) = self._field_offsets[index]
+        return self._raw[value_start:value_end]
+
+    def _int(self, index):
+        return int.from_bytes(self._value(index), 'big')
+
+    @property
+    def nonce(self):
+        return self._int(0)
+
+    @property
+    def gasPrice(self):
+        return self._int(1)
+
+    @property
+    def gas(self):
+        return self._int(2)
+
+    @property
+    def to(self):
+        '''
+        The recipient address, or ``b\'\'`` for contract creation.
+        '''
+        return bytes(self._value(3))
+
+    @property
+    def value(self):
+        return self._int(4)
+
+    @property
+    def data(self):
+        '''
+        The call data, as a :class:`memoryview` into the serialized transaction.
+        '''
+        return self._value(5)
+
+    @property
+    def v(self):
+        return self._int(6)
+
+    @property
+    def r(self):
+        return self._int(7)
+
+    @property
+    def s(self):
+        return self._int(8)
+
+    @property
+    def chainId(self):
+        '''
+        The chain ID that the signature is bound to (see EIP 155), or ``None``.
+        '''
+        (chain_id, _v) = extract_chain_id(self.v)
+        return chain_id
+
+    @property
+    def hash(self):
+        '''
+        The transaction hash.
+        '''
+        return HexBytes(keccak(bytes(self._raw)))
+
+    @property
+    def rawTransaction(self):
+        return HexBytes(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, ', '.join(
+            '%s=%r' % (name, getattr(self, name))
+            for name, _ in SIGNED_TRANSACTION_FIELDS
+            if name != 'data'
+        ))
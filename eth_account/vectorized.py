@@ -0,0 +1,140 @@
+'''
+Array versions of the EIP-155 ``v`` helpers in :mod:`eth_account._utils.signing`, for
+working on many signatures at once.
+
+NumPy is used when it is installed, and the results are NumPy arrays. Otherwise, the
+same results are computed in pure Python and returned as :class:`array.array`.
+Values are stored as signed 64-bit integers, so chain IDs must be below ``2 ** 62``.
+Transactions without a chain ID get a chain ID of ``-1`` (:data:`NO_CHAIN_ID`).
+'''
+from array import (
+    array,
+)
+
+from eth_account._utils.signing import (
+    CHAIN_ID_OFFSET,
+    V_OFFSET,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NO_CHAIN_ID = -1
+
+
+def _as_int64(values):
+    # bytes-like values hold one unsigned integer per byte, like SignatureArray.v,
+    # which np.asarray would reject
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        return np.frombuffer(values, dtype=np.uint8).astype(np.int64)
+    return np.asarray(values, dtype=np.int64)
+
+
+def extract_chain_ids(raw_vs):
+    '''
+    Split each ``v`` into its chain ID and standard ``v``, like
+    :func:`~eth_account._utils.signing.extract_chain_id` followed by
+    :func:`~eth_account._utils.signing.to_standard_v`.
+
+    ``v`` values other than 0, 1, 27, 28 or 35 and up make the scalar functions
+    raise. Here, they are marked invalid in the returned mask instead, with a chain
+    ID of :data:`NO_CHAIN_ID` and a standard ``v`` of 0.
+
+    :param raw_vs: the ``v`` of each signature
+    :type raw_vs: sequence of int, bytes with one ``v`` per byte (like
+        :attr:`~eth_account.datastructures.SignatureArray.v`), or a NumPy integer array
+    :returns: the chain IDs, the standard ``v`` values (0 or 1) and the validity mask
+    :rtype: tuple of three arrays
+    '''
+    if np is None:
+        return _extract_chain_ids_array(raw_vs)
+
+    raw_vs = _as_int64(raw_vs)
+    above_id_offset = raw_vs - CHAIN_ID_OFFSET
+    has_chain_id = above_id_offset >= 0
+    is_chain_naive = (raw_vs == V_OFFSET) | (raw_vs == V_OFFSET + 1)
+    is_standard = (raw_vs == 0) | (raw_vs == 1)
+
+    chain_ids = np.where(has_chain_id, above_id_offset // 2, NO_CHAIN_ID)
+    standard_vs = np.select(
+        (has_chain_id, is_chain_naive, is_standard),
+        (above_id_offset % 2, raw_vs - V_OFFSET, raw_vs),
+        0,
+    )
+    return (chain_ids, standard_vs, has_chain_id | is_chain_naive | is_standard)
+
+
+def _extract_chain_ids_array(raw_vs):
+    chain_ids = array('q')
+    standard_vs = array('q')
+    valid = array('b')
+    for raw_v in raw_vs:
+        if raw_v >= CHAIN_ID_OFFSET:
+            (chain_id, standard_v) = divmod(raw_v - CHAIN_ID_OFFSET, 2)
+        elif raw_v in (V_OFFSET, V_OFFSET + 1):
+            (chain_id, standard_v) = (NO_CHAIN_ID, raw_v - V_OFFSET)
+        elif raw_v in (0, 1):
+            (chain_id, standard_v) = (NO_CHAIN_ID, raw_v)
+        else:
+            chain_ids.append(NO_CHAIN_ID)
+            standard_vs.append(0)
+            valid.append(False)
+            continue
+        chain_ids.append(chain_id)
+        standard_vs.append(standard_v)
+        valid.append(True)
+    return (chain_ids, standard_vs, valid)
+
+
+def to_standard_vs(raw_vs):
+    '''
+    Convert each ``v`` to a standard ``v`` of 0 or 1, like
+    :func:`~eth_account._utils.signing.to_standard_v`.
+
+    :returns: the standard ``v`` values, and the validity mask described in
+        :func:`extract_chain_ids`
+    :rtype: tuple of two arrays
+    '''
+    (_chain_ids, standard_vs, valid) = extract_chain_ids(raw_vs)
+    return (standard_vs, valid)
+
+
+def to_eth_vs(standard_vs, chain_ids=None):
+    '''
+    Convert each standard ``v`` to the ``v`` of an Ethereum signature, like
+    :func:`~eth_account._utils.signing.to_eth_v`.
+
+    :param standard_vs: the standard ``v`` (0 or 1) of each signature
+    :param chain_ids: ``None`` if the signatures aren't bound to a chain. Otherwise,
+        a single chain ID for all of them, or one chain ID per signature where
+        :data:`NO_CHAIN_ID` means no chain.
+    :returns: the Ethereum ``v`` values
+    '''
+    if np is None:
+        return _to_eth_vs_array(standard_vs, chain_ids)
+
+    standard_vs = _as_int64(standard_vs)
+    if chain_ids is None:
+        return standard_vs + V_OFFSET
+    chain_ids = _as_int64(chain_ids)
+    return np.where(
+        chain_ids == NO_CHAIN_ID,
+        standard_vs + V_OFFSET,
+        standard_vs + CHAIN_ID_OFFSET + 2 * chain_ids,
+    )
+
+
+def _to_eth_vs_array(standard_vs, chain_ids):
+    if chain_ids is None or isinstance(chain_ids, int):
+        chain_ids = [NO_CHAIN_ID if chain_ids is None else chain_ids] * len(standard_vs)
+    elif len(chain_ids) != len(standard_vs):
+        raise ValueError(
+            "Got %d chain IDs for %d signatures" % (len(chain_ids), len(standard_vs))
+        )
+    return array('q', (
+        standard_v + V_OFFSET if chain_id == NO_CHAIN_ID
+        else standard_v + CHAIN_ID_OFFSET + 2 * chain_id
+        for standard_v, chain_id in zip(standard_vs, chain_ids)
+    ))
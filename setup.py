@@ -6,7 +6,11 @@ from setuptools import (
 )
 
 extras_require={
+    'numpy': [
+        "numpy",
+    ],
     'test': [
+        "numpy",
         "pytest>=3.6.0",
         "tox>=2.9.1,<3",
     ],
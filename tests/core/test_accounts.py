@@ -1,5 +1,7 @@
 # coding=utf-8
 
+import itertools
+import json
 import os
 import pytest
 
@@ -12,19 +14,35 @@ from eth_keyfile.keyfile import (
 from eth_keys import (
     keys,
 )
+from eth_keys.backends import (
+    NativeECCBackend,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+    ValidationError,
+)
 from eth_utils import (
     is_checksum_address,
+    keccak,
     to_bytes,
+    to_canonical_address,
     to_hex,
     to_int,
 )
 from hexbytes import (
     HexBytes,
 )
+import rlp
 
 from eth_account import (
     Account,
 )
+from eth_account._utils.addresses import (
+    to_checksum_address,
+)
+from eth_account._utils.transactions import (
+    Transaction,
+)
 from eth_account.messages import (
     defunct_hash_message,
 )
@@ -174,6 +192,23 @@ def test_eth_account_create_properties(acct):
     assert isinstance(account.privateKey, bytes) and len(account.privateKey) == 32
 
 
+@pytest.mark.parametrize('workers', (None, 2))
+def test_eth_account_create_many(acct, workers):
+    keys = acct.createMany(7, extra_entropy='KEYSMASH', workers=workers, batch_size=3)
+    assert len(keys) == 7
+    assert len(set(private_key for private_key, _ in keys)) == 7
+    for private_key, address in keys:
+        assert acct.privateKeyToAccount(private_key).address == address
+    assert len(acct.createMany(0)) == 0
+
+
+def test_eth_account_create_many_invalid(acct):
+    with pytest.raises(ValueError):
+        acct.createMany(-1)
+    with pytest.raises(ValueError):
+        acct.createMany(1, batch_size=0)
+
+
 def test_eth_account_recover_transaction_example(acct):
     raw_tx_hex = '0xf8640d843b9aca00830e57e0945b2063246f2191f18f2675cedb8b28102e957458018025a00c753084e5a8290219324c1a3a86d4064ded2d15979b1ea790734aaa2ceaafc1a0229ca4538106819fd3a5509dd383e8fe4b731c6870339556a5c06feb9cf330bb'  # noqa: E501
     from_account = acct.recoverTransaction(raw_tx_hex)
@@ -239,6 +274,109 @@ def test_eth_account_recover_vrs_standard_v(acct):
     assert from_account == '0xFeC2079e80465cc8C687fFF9EE6386ca447aFec4'
 
 
+def test_eth_account_recover_hashes(acct):
+    private_keys = [bytes([index + 1]) * 32 for index in range(10)]
+    msg_hashes = [keccak(private_key) for private_key in private_keys]
+    signed = [acct.signHash(msg_hash, key) for msg_hash, key in zip(msg_hashes, private_keys)]
+    # alternate between signature bytes and vrs tuples
+    pairs = [
+        (msg_hash, sig.signature if index % 2 else (sig.v, sig.r, sig.s))
+        for index, (msg_hash, sig) in enumerate(zip(msg_hashes, signed))
+    ]
+    expected = [acct.recoverHash(msg_hash, signature=sig.signature)
+                for msg_hash, sig in zip(msg_hashes, signed)]
+
+    assert expected == [acct.privateKeyToAccount(key).address for key in private_keys]
+    assert acct.recoverHashes(pairs) == expected
+    assert acct.recoverHashes(iter(pairs)) == expected
+    assert acct.recoverHashes([]) == []
+
+
+class CountingECCBackend(NativeECCBackend):
+    recover_calls = 0
+
+    def ecdsa_recover(self, msg_hash, signature):
+        type(self).recover_calls += 1
+        return super().ecdsa_recover(msg_hash, signature)
+
+
+def test_eth_account_recover_hashes_with_other_backend(acct):
+    msg_hashes = [keccak(bytes([index])) for index in range(5)]
+    pairs = [(msg_hash, acct.signHash(msg_hash, PRIVATE_KEY_AS_BYTES).signature)
+             for msg_hash in msg_hashes]
+
+    account = Account()
+    account.setKeyBackend(CountingECCBackend())
+    CountingECCBackend.recover_calls = 0
+    # a backend other than the pure Python ones recovers each signature itself
+    assert account.recoverHashes(pairs) == [ACCT_ADDRESS] * len(pairs)
+    assert CountingECCBackend.recover_calls == len(pairs)
+
+
+def test_eth_account_recover_hashes_signature_variations(acct):
+    msg_hash = b'\xbb\r\x8a\xba\x9f\xf7\xa1<N,s{i\x81\x86r\x83{\xba\x9f\xe2\x1d\xaa\xdd\xb3\xd6\x01\xda\x00\xb7)\xa1'  # noqa: E501
+    v, r, s = (
+        27,
+        5634810156301565519126305729385531885322755941350706789683031279718535704513,
+        15655399131600894366408541311673616702363115109327707006109616887384920764603,
+    )
+    signature = to_bytes(r).rjust(32, b'\0') + to_bytes(s).rjust(32, b'\0') + to_bytes(v)
+    pairs = [
+        (msg_hash, (v, r, s)),
+        (msg_hash, [0, r, s]),
+        (to_hex(msg_hash), tuple(map(to_hex, (v, r, s)))),
+        (msg_hash, signature),
+        (msg_hash, to_hex(signature)),
+    ]
+    assert acct.recoverHashes(pairs) == ['0xFeC2079e80465cc8C687fFF9EE6386ca447aFec4'] * 5
+
+
+def test_eth_account_recover_raw_address(acct):
+    msg_hash = b'\x01' * 32
+    signed = acct.signHash(msg_hash, PRIVATE_KEY_AS_BYTES)
+    raw_address = to_canonical_address(ACCT_ADDRESS)
+
+    assert acct.recoverHash(msg_hash, signature=signed.signature, raw_address=True) == raw_address
+    assert acct.recoverHashes([(msg_hash, signed.signature)], raw_address=True) == [raw_address]
+
+    signed_transaction = acct.signTransaction(
+        {'to': b'', 'value': 0, 'gas': 53000, 'gasPrice': 1, 'nonce': 0},
+        PRIVATE_KEY_AS_BYTES,
+    )
+    assert acct.recoverTransaction(signed_transaction.rawTransaction, raw_address=True) == (
+        raw_address
+    )
+
+
+def test_checksum_address_cache_is_shared(acct):
+    to_checksum_address.cache_clear()
+    acct.privateKeyToAccount(PRIVATE_KEY_AS_BYTES)
+    assert to_checksum_address.cache_info().misses == 1
+
+    msg_hash = b'\x01' * 32
+    signed = acct.signHash(msg_hash, PRIVATE_KEY_AS_BYTES)
+    assert acct.recoverHash(msg_hash, signature=signed.signature) == ACCT_ADDRESS
+    assert acct.recoverHashes([(msg_hash, signed.signature)]) == [ACCT_ADDRESS]
+    assert to_checksum_address.cache_info().misses == 1
+    assert to_checksum_address.cache_info().hits >= 2
+
+
+@pytest.mark.parametrize(
+    'msg_hash, signature_kwargs, error',
+    (
+        (b'\x01' * 31, {'vrs': (27, 1, 1)}, ValueError),
+        (b'\x01' * 32, {'vrs': (27, 0, 1)}, BadSignature),
+        (b'\x01' * 32, {'vrs': (27, 5, 1)}, BadSignature),
+        (b'\x01' * 32, {'signature': b'\x01' * 64}, ValidationError),
+    ),
+)
+def test_eth_account_recover_hashes_invalid(acct, msg_hash, signature_kwargs, error):
+    with pytest.raises(error):
+        acct.recoverHash(msg_hash, **signature_kwargs)
+    with pytest.raises(error):
+        acct.recoverHashes([(msg_hash, *signature_kwargs.values())])
+
+
 @pytest.mark.parametrize(
     'message, expected',
     [
@@ -438,6 +576,152 @@ def test_eth_account_sign_transaction(acct, txn, private_key, expected_raw_tx, t
     assert account.signTransaction(txn) == signed
 
 
+def test_eth_account_sign_transactions(acct, PRIVATE_KEY):
+    transactions = [
+        {
+            'to': '0xF0109fC8DF283027b6285cc889F5aA624EaC1F55',
+            'value': value,
+            'gas': 2000000,
+            'gasPrice': 234567897654321,
+            'nonce': nonce,
+            'chainId': 1,
+        }
+        for nonce, value in enumerate((0, 1, 1000000000))
+    ]
+    # from is accepted in batches too, if it matches the key
+    transactions.append(dict(transactions[0], nonce=3, **{'from': ACCT_ADDRESS}))
+
+    signed = acct.signTransactions(iter(transactions), PRIVATE_KEY)
+    assert signed == [acct.signTransaction(txn, PRIVATE_KEY) for txn in transactions]
+
+    account = acct.privateKeyToAccount(PRIVATE_KEY)
+    assert account.signTransactions(transactions) == signed
+    assert acct.signTransactions([], PRIVATE_KEY) == []
+
+
+@pytest.mark.parametrize(
+    'field, value, reported_field',
+    (
+        ('nonce', -1, 'nonce'),
+        ('gasPrice', -1, 'gasPrice'),
+        ('gas', -1, 'gas'),
+        ('value', -1, 'value'),
+        ('chainId', -1, 'v'),
+    ),
+)
+def test_eth_account_sign_transaction_unserializable_field(acct, field, value, reported_field):
+    transaction = {'to': b'', 'value': 0, 'gas': 21000, 'gasPrice': 1, 'nonce': 0, 'chainId': 1}
+    with pytest.raises(rlp.exceptions.ObjectSerializationError) as excinfo:
+        acct.signTransaction(dict(transaction, **{field: value}), PRIVATE_KEY_AS_BYTES)
+    assert excinfo.value.field == reported_field
+
+
+def test_eth_account_sign_transactions_rejects_invalid_item(acct):
+    transactions = [
+        {'to': b'', 'value': 0, 'gas': 21000, 'gasPrice': 1, 'nonce': 0},
+        {'to': b'', 'value': 0, 'gas': 21000, 'gasPrice': 1},
+    ]
+    with pytest.raises(TypeError):
+        acct.signTransactions(transactions, PRIVATE_KEY_AS_BYTES)
+
+
+@pytest.mark.parametrize('workers', (None, 2))
+def test_eth_account_sign_transactions_return_exceptions(acct, workers):
+    good_txn = {'to': b'', 'value': 0, 'gas': 21000, 'gasPrice': 1, 'nonce': 0}
+    transactions = [good_txn, dissoc(good_txn, 'nonce'), dict(good_txn, nonce=1)]
+
+    results = acct.signTransactions(
+        transactions,
+        PRIVATE_KEY_AS_BYTES,
+        workers=workers,
+        batch_size=2,
+        return_exceptions=True,
+    )
+    assert len(results) == 3
+    assert results[0] == acct.signTransaction(transactions[0], PRIVATE_KEY_AS_BYTES)
+    assert isinstance(results[1], TypeError)
+    assert results[2] == acct.signTransaction(transactions[2], PRIVATE_KEY_AS_BYTES)
+
+
+def test_eth_account_sign_transactions_in_worker_processes(acct, PRIVATE_KEY):
+    transactions = [
+        {'to': b'', 'value': nonce, 'gas': 21000, 'gasPrice': 1, 'nonce': nonce, 'chainId': 1}
+        for nonce in range(10)
+    ]
+    signed = acct.signTransactions(transactions, PRIVATE_KEY, workers=2, batch_size=3)
+    assert signed == acct.signTransactions(transactions, PRIVATE_KEY)
+    assert signed[3].rawTransaction == acct.signTransaction(transactions[3], PRIVATE_KEY).rawTransaction  # noqa: E501
+
+    with pytest.raises(TypeError):
+        acct.signTransactions(
+            transactions + [dissoc(transactions[0], 'gas')],
+            PRIVATE_KEY,
+            workers=2,
+        )
+
+
+def test_local_account_signing_reuses_key_object(acct, monkeypatch):
+    account = acct.privateKeyToAccount(PRIVATE_KEY_AS_BYTES)
+    transaction = {'to': b'', 'value': 0, 'gas': 21000, 'gasPrice': 1, 'nonce': 0}
+    expected_hash_signature = acct.signHash(b'\x01' * 32, PRIVATE_KEY_AS_BYTES)
+    expected_transaction = acct.signTransaction(transaction, PRIVATE_KEY_AS_BYTES)
+
+    def fail_to_derive(*args):
+        raise AssertionError("The public key should not be derived again")
+
+    monkeypatch.setattr(account._key_obj.backend, 'private_key_to_public_key', fail_to_derive)
+    assert account.signHash(b'\x01' * 32) == expected_hash_signature
+    assert account.signTransaction(transaction) == expected_transaction
+    assert account.signTransactions([transaction]) == [expected_transaction]
+
+
+def test_eth_account_raw_bytes(acct):
+    transaction = {'to': b'', 'value': 0, 'gas': 21000, 'gasPrice': 1, 'nonce': 0}
+    msg_hash = b'\x01' * 32
+    expected_message = acct.signHash(msg_hash, PRIVATE_KEY_AS_BYTES)
+    expected_transaction = acct.signTransaction(transaction, PRIVATE_KEY_AS_BYTES)
+
+    signed_message = acct.signHash(msg_hash, PRIVATE_KEY_AS_BYTES, raw_bytes=True)
+    assert type(signed_message.messageHash) is bytes
+    assert type(signed_message.signature) is bytes
+    assert signed_message == expected_message
+    signed_transaction = acct.signTransaction(transaction, PRIVATE_KEY_AS_BYTES, raw_bytes=True)
+    assert type(signed_transaction.rawTransaction) is bytes
+    assert type(signed_transaction.hash) is bytes
+    assert signed_transaction == expected_transaction
+
+    raw_acct = Account()
+    raw_acct.raw_bytes = True
+    account = raw_acct.privateKeyToAccount(PRIVATE_KEY_AS_BYTES)
+    assert type(account.signHash(msg_hash).signature) is bytes
+    assert type(account.signTransactions([transaction])[0].hash) is bytes
+    # a per-call argument overrides the account setting
+    assert type(account.signTransaction(transaction, raw_bytes=False).hash) is HexBytes
+    assert type(Account.signHash(msg_hash, PRIVATE_KEY_AS_BYTES).signature) is HexBytes
+
+    for workers in (None, 2):
+        signed_transactions = acct.signTransactions(
+            [transaction] * 3,
+            PRIVATE_KEY_AS_BYTES,
+            workers=workers,
+            raw_bytes=True,
+        )
+        assert signed_transactions == [expected_transaction] * 3
+        assert all(type(signed.rawTransaction) is bytes for signed in signed_transactions)
+        # the per-call argument overrides the account setting in workers, too
+        signed_transactions = account.signTransactions(
+            [transaction],
+            workers=workers,
+            raw_bytes=False,
+        )
+        assert type(signed_transactions[0].hash) is HexBytes
+
+    assert acct.recoverHash(msg_hash, signature=signed_message.signature) == ACCT_ADDRESS
+    assert acct.recoverTransaction(signed_transaction.rawTransaction) == ACCT_ADDRESS
+    with pytest.raises(ValueError):
+        acct.signHash(msg_hash[1:], PRIVATE_KEY_AS_BYTES)
+
+
 @pytest.mark.parametrize(
     'transaction',
     ETH_TEST_TRANSACTIONS,
@@ -472,6 +756,83 @@ def test_eth_account_recover_transaction_from_eth_test(acct, transaction):
     assert acct.recoverTransaction(raw_txn) == expected_sender
 
 
+def test_eth_account_recovery_cache(monkeypatch):
+    acct = Account()
+    cache = acct.enableRecoveryCache(size=2)
+    raw_txn = ETH_TEST_TRANSACTIONS[0]['signed']
+    expected_sender = acct.privateKeyToAccount(ETH_TEST_TRANSACTIONS[0]['key']).address
+    msg_hash = b'\x01' * 32
+    signed = acct.signHash(msg_hash, PRIVATE_KEY_AS_BYTES)
+
+    assert acct.recoverTransaction(raw_txn) == expected_sender
+    assert acct.recoverHash(msg_hash, signature=signed.signature) == ACCT_ADDRESS
+    assert cache.info().misses == 2
+
+    # cached entries are served without recovering again
+    monkeypatch.setattr(Account, '_recoverSigner', None)
+    assert acct.recoverTransaction(HexBytes(raw_txn)) == expected_sender
+    assert acct.recoverHash(to_hex(msg_hash), vrs=(signed.v, signed.r, signed.s)) == ACCT_ADDRESS
+    assert acct.recoverHashes([(msg_hash, signed.signature)]) == [ACCT_ADDRESS]
+    assert cache.info().hits == 3
+    monkeypatch.undo()
+
+    # a third entry evicts the least recently used one, the transaction
+    assert acct.recoverHashes([(b'\x02' * 32, signed.signature)]) != [ACCT_ADDRESS]
+    assert cache.info().evictions == 1
+    assert len(cache) == 2
+
+    acct.disableRecoveryCache()
+    assert acct.recoverTransaction(raw_txn) == expected_sender
+    assert cache.info().misses == 3
+
+
+@pytest.mark.parametrize('workers', (None, 2))
+def test_eth_account_recover_transactions(acct, workers):
+    raw_transactions = [transaction['signed'] for transaction in ETH_TEST_TRANSACTIONS] * 3
+    expected = [acct.recoverTransaction(raw_txn) for raw_txn in raw_transactions]
+
+    senders = acct.recoverTransactions(iter(raw_transactions), workers=workers, batch_size=4)
+    assert not isinstance(senders, list)
+    assert list(senders) == expected
+
+
+@pytest.mark.parametrize('workers', (None, 2))
+def test_eth_account_recover_transactions_invalid(acct, workers):
+    raw_txn = HexBytes(ETH_TEST_TRANSACTIONS[0]['signed'])
+    txn = Transaction.from_bytes(raw_txn)
+    bad_signature_txn = rlp.encode(txn.copy(r=5))
+    raw_transactions = [raw_txn, b'\x01\x02', bad_signature_txn, raw_txn]
+    sender = acct.recoverTransaction(raw_txn)
+
+    results = list(acct.recoverTransactions(
+        raw_transactions,
+        workers=workers,
+        batch_size=3,
+        return_exceptions=True,
+    ))
+    assert results[0] == results[3] == sender
+    assert isinstance(results[1], rlp.exceptions.DecodingError)
+    assert isinstance(results[2], BadSignature)
+
+    senders = acct.recoverTransactions(raw_transactions, workers=workers)
+    assert next(senders) == sender
+    with pytest.raises(rlp.exceptions.DecodingError):
+        next(senders)
+
+
+def test_eth_account_recover_transactions_is_lazy(acct):
+    raw_transactions = itertools.cycle([ETH_TEST_TRANSACTIONS[0]['signed']])
+    senders = acct.recoverTransactions(raw_transactions, workers=2, batch_size=2)
+    assert len(set(itertools.islice(senders, 9))) == 1
+    senders.close()
+
+
+def test_eth_account_recovery_cache_is_per_instance():
+    acct = Account()
+    acct.enableRecoveryCache()
+    assert Account._recovery_cache is None
+
+
 def get_encrypt_test_params():
     """
     Params for testing Account#encrypt. Due to not being able to provide fixtures to
@@ -629,3 +990,40 @@ def test_eth_account_prepared_encrypt(
 
     assert isinstance(decrypted_key, HexBytes)
     assert decrypted_key == expected_decrypted_key
+
+
+@pytest.mark.parametrize('workers', (None, 2))
+def test_eth_account_decrypt_many(acct, workers):
+    keys_and_passwords = [
+        (PRIVATE_KEY_AS_BYTES, 'unicorns', 'scrypt', 16),
+        (PRIVATE_KEY_AS_BYTES_ALT, b'rainbows', 'pbkdf2', 10),
+        (PRIVATE_KEY_AS_BYTES_ALT, 'rainbows', 'scrypt', 32),
+    ]
+    keyfiles = [
+        acct.encrypt(key, password, kdf=kdf, iterations=iterations)
+        for key, password, kdf, iterations in keys_and_passwords
+    ]
+    keyfiles[2] = json.dumps(keyfiles[2])
+    passwords = [password for (_, password, _, _) in keys_and_passwords]
+    expected = [key for (key, _, _, _) in keys_and_passwords]
+
+    # a budget smaller than any single scrypt keyfile decrypts them one at a time
+    decrypted = acct.decryptMany(iter(keyfiles), iter(passwords), workers=workers, max_memory=1)
+    assert decrypted == expected
+    assert all(isinstance(key, HexBytes) for key in decrypted)
+    assert acct.decryptMany(keyfiles[:1], 'unicorns', workers=workers) == expected[:1]
+
+    with pytest.raises(ValueError):
+        acct.decryptMany(keyfiles, 'unicorns', workers=workers)
+    results = acct.decryptMany(
+        keyfiles + ['not json'],
+        'rainbows',
+        workers=workers,
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], ValueError)
+    assert results[1:3] == expected[1:]
+    assert isinstance(results[3], ValueError)
+
+    with pytest.raises(ValueError):
+        acct.decryptMany(keyfiles, passwords[:2], workers=workers)
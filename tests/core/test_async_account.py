@@ -0,0 +1,157 @@
+import asyncio
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import pickle
+import pytest
+import threading
+import time
+
+from eth_account import (
+    Account,
+    account as account_module,
+)
+from eth_account.async_account import (
+    AsyncAccount,
+)
+from eth_account.datastructures import (
+    AttributeDict,
+)
+
+PRIVATE_KEY = b'unicorns' * 4
+TRANSACTION = {'to': b'', 'value': 0, 'gas': 21000, 'gasPrice': 1, 'nonce': 0, 'chainId': 1}
+
+
+@pytest.fixture
+def run():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+class SlowAccount(object):
+    '''
+    Stands in for the account API, recording how many calls run at once.
+    '''
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def decrypt(self, keyfile_json, password):
+        # runs until released
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.calls.append(keyfile_json)
+        self.started.set()
+        self.release.wait(5)
+        with self.lock:
+            self.running -= 1
+        return keyfile_json
+
+    def signHash(self, message_hash, private_key):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.calls.append(message_hash)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        return message_hash
+
+
+def test_async_account_matches_account(run):
+    async_account = AsyncAccount()
+    keyfile = run(async_account.encrypt(PRIVATE_KEY, 'pw', kdf='pbkdf2', iterations=10))
+    assert run(async_account.decrypt(keyfile, 'pw')) == PRIVATE_KEY
+    with pytest.raises(ValueError):
+        run(async_account.decrypt(keyfile, 'wrong'))
+
+    signed = run(async_account.signTransaction(TRANSACTION, PRIVATE_KEY))
+    assert signed == Account.signTransaction(TRANSACTION, PRIVATE_KEY)
+    signed_hash = run(async_account.signHash(b'\x01' * 32, PRIVATE_KEY))
+    assert signed_hash == Account.signHash(b'\x01' * 32, PRIVATE_KEY)
+
+
+def test_async_account_in_processes(run):
+    with ProcessPoolExecutor(1) as executor:
+        # looked up now, because another test reloads the module, and only the
+        # current class can be pickled
+        async_account = AsyncAccount(account_module.Account, executor=executor)
+        signed = run(async_account.signTransaction(TRANSACTION, PRIVATE_KEY))
+        assert isinstance(signed, AttributeDict)
+        assert signed == Account.signTransaction(TRANSACTION, PRIVATE_KEY)
+        with pytest.raises(TypeError):
+            run(async_account.signTransaction({}, PRIVATE_KEY))
+
+
+def test_attribute_dict_pickles():
+    signed = Account.signTransaction(TRANSACTION, PRIVATE_KEY)
+    assert pickle.loads(pickle.dumps(signed)) == signed
+
+
+def test_async_account_limits_concurrency(run):
+    account = SlowAccount()
+    with ThreadPoolExecutor(8) as executor:
+        async_account = AsyncAccount(account, executor=executor, max_concurrency=2)
+
+        async def sign_all():
+            return await asyncio.gather(*(
+                async_account.signHash(index, None) for index in range(6)
+            ))
+
+        results = run(sign_all())
+    assert results == list(range(6))
+    assert account.peak == 2
+
+
+def test_async_account_cancels_waiting_calls(run):
+    account = SlowAccount()
+    async_account = AsyncAccount(account, max_concurrency=1)
+
+    async def cancel_second():
+        first = asyncio.ensure_future(async_account.signHash('first', None))
+        second = asyncio.ensure_future(async_account.signHash('second', None))
+        await asyncio.sleep(0.01)
+        second.cancel()
+        assert await first == 'first'
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+    run(cancel_second())
+    assert account.calls == ['first']
+
+    with pytest.raises(ValueError):
+        AsyncAccount(max_concurrency=0)
+
+
+def test_async_account_cancelled_calls_keep_their_slot(run):
+    account = SlowAccount()
+    with ThreadPoolExecutor(4) as executor:
+        async_account = AsyncAccount(account, executor=executor, max_concurrency=1)
+
+        async def cancel_running():
+            loop = asyncio.get_event_loop()
+            first = asyncio.ensure_future(async_account.decrypt('first', None))
+            await loop.run_in_executor(None, account.started.wait, 5)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+            # the cancelled call is still running, so the next one has to wait for it
+            second = asyncio.ensure_future(async_account.decrypt('second', None))
+            await asyncio.sleep(0.05)
+            assert not second.done()
+            assert account.calls == ['first']
+
+            account.release.set()
+            return await second
+
+        assert run(cancel_running()) == 'second'
+    assert account.calls == ['first', 'second']
+    assert account.peak == 1
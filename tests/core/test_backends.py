@@ -0,0 +1,157 @@
+import pytest
+from random import (
+    Random,
+)
+
+from eth_keys import (
+    KeyAPI,
+)
+from eth_keys.backends import (
+    NativeECCBackend,
+)
+from eth_keys.exceptions import (
+    BadSignature,
+)
+
+from eth_account import (
+    Account,
+)
+from eth_account._utils import (
+    secp256k1,
+)
+from eth_account.backends import (
+    FastPythonECCBackend,
+    recovers_in_batches,
+)
+
+NATIVE_KEYS = KeyAPI(NativeECCBackend)
+
+SECP256K1_N = secp256k1.N
+
+EDGE_CASE_SCALARS = (1, 2, 3, 2 ** 128, SECP256K1_N - 2, SECP256K1_N - 1, secp256k1.LAMBDA)
+
+
+def random_scalars(seed, count):
+    random = Random(seed)
+    return [random.randrange(1, SECP256K1_N) for _ in range(count)]
+
+
+def random_hashes(seed, count):
+    random = Random(seed)
+    return [bytes(random.randrange(256) for _ in range(32)) for _ in range(count)]
+
+
+@pytest.fixture
+def fast_account():
+    account = Account()
+    account.setKeyBackend(FastPythonECCBackend)
+    return account
+
+
+@pytest.mark.parametrize('scalar', EDGE_CASE_SCALARS + tuple(random_scalars(0, 20)), ids=str)
+def test_public_key_matches_native(scalar):
+    key_bytes = scalar.to_bytes(32, 'big')
+    native_key = NATIVE_KEYS.PrivateKey(key_bytes)
+    public_key = FastPythonECCBackend().private_key_to_public_key(native_key)
+    assert public_key == native_key.public_key
+
+
+@pytest.mark.parametrize(
+    'scalar, message_hash',
+    tuple(zip(random_scalars(1, 20), random_hashes(1, 20))) + (
+        (1, b'\x00' * 32),
+        (SECP256K1_N - 1, b'\xff' * 32),
+    ),
+    ids=lambda value: hex(value)[:10] if isinstance(value, int) else value.hex()[:8],
+)
+def test_sign_recover_verify_match_native(scalar, message_hash):
+    native = NativeECCBackend()
+    fast = FastPythonECCBackend()
+    key = NATIVE_KEYS.PrivateKey(scalar.to_bytes(32, 'big'))
+
+    signature = fast.ecdsa_sign(message_hash, key)
+    assert signature == native.ecdsa_sign(message_hash, key)
+    assert fast.ecdsa_sign_non_recoverable(message_hash, key) == (
+        native.ecdsa_sign_non_recoverable(message_hash, key)
+    )
+    assert fast.ecdsa_recover(message_hash, signature) == key.public_key
+    assert fast.ecdsa_verify(message_hash, signature, key.public_key)
+    other_hash = bytes([message_hash[0] ^ 1]) + message_hash[1:]
+    assert not fast.ecdsa_verify(other_hash, signature, key.public_key)
+
+
+@pytest.mark.parametrize('scalar', random_scalars(2, 10), ids=hex)
+def test_compression_round_trip(scalar):
+    fast = FastPythonECCBackend()
+    public_key_bytes = NATIVE_KEYS.PrivateKey(scalar.to_bytes(32, 'big')).public_key.to_bytes()
+    compressed = fast.compress_public_key_bytes(public_key_bytes)
+    assert compressed == NativeECCBackend().compress_public_key_bytes(public_key_bytes)
+    assert fast.decompress_public_key_bytes(compressed) == public_key_bytes
+
+
+@pytest.mark.parametrize(
+    'compressed',
+    (
+        b'\x04' + b'\x01' * 32,
+        b'\x02' + b'\x01' * 31,
+        b'\x02' + secp256k1.P.to_bytes(32, 'big'),
+        # x = 5 has no point on the curve
+        b'\x02' + (5).to_bytes(32, 'big'),
+    ),
+)
+def test_decompress_invalid(compressed):
+    with pytest.raises(ValueError):
+        FastPythonECCBackend().decompress_public_key_bytes(compressed)
+
+
+@pytest.mark.parametrize('vrs', ((2, 1, 1), (0, 0, 1), (0, 1, SECP256K1_N), (0, 5, 1)))
+def test_recover_invalid_signature(vrs):
+    with pytest.raises(BadSignature):
+        FastPythonECCBackend().ecdsa_recover(b'\x01' * 32, NATIVE_KEYS.Signature(vrs=vrs))
+
+
+def test_multiply_matches_generator_multiplication():
+    point = secp256k1.to_affine(secp256k1.multiply_generator(12345))
+    for scalar in (0, SECP256K1_N):
+        assert secp256k1.multiply(point, scalar)[2] == 0
+    for scalar in EDGE_CASE_SCALARS:
+        expected = secp256k1.multiply_generator(12345 * scalar % SECP256K1_N)
+        assert secp256k1.to_affine(secp256k1.multiply(point, scalar)) == (
+            secp256k1.to_affine(expected)
+        )
+
+
+def test_recovers_in_batches():
+    assert recovers_in_batches(NativeECCBackend())
+    assert recovers_in_batches(FastPythonECCBackend())
+    assert not recovers_in_batches(type('OtherECCBackend', (NativeECCBackend,), {})())
+
+
+def test_account_uses_fast_backend(fast_account):
+    key_bytes = b'unicorns' * 4
+    key = fast_account._parsePrivateKey(key_bytes)
+    assert isinstance(key.backend, FastPythonECCBackend)
+    assert isinstance(key.public_key.backend, FastPythonECCBackend)
+
+
+def test_account_with_fast_backend_matches_default(fast_account):
+    key_bytes = b'unicorns' * 4
+    transaction = {
+        'to': '0xF0109fC8DF283027b6285cc889F5aA624EaC1F55',
+        'value': 1000000000,
+        'gas': 2000000,
+        'gasPrice': 234567897654321,
+        'nonce': 0,
+        'chainId': 1,
+    }
+    message_hash = b'\x42' * 32
+
+    signed = fast_account.signTransaction(transaction, key_bytes)
+    assert signed == Account.signTransaction(transaction, key_bytes)
+    signed_hash = fast_account.signHash(message_hash, key_bytes)
+    assert signed_hash == Account.signHash(message_hash, key_bytes)
+
+    address = fast_account.privateKeyToAccount(key_bytes).address
+    assert address == Account.privateKeyToAccount(key_bytes).address
+    assert fast_account.recoverTransaction(signed.rawTransaction) == address
+    assert fast_account.recoverHash(message_hash, signature=signed_hash.signature) == address
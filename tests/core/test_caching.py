@@ -0,0 +1,151 @@
+import pytest
+import threading
+
+from eth_account._utils.caching import (
+    CacheInfo,
+    DerivedKeyCache,
+    LRUCache,
+)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.info() == CacheInfo(hits=2, misses=1, evictions=1, maxsize=2, currsize=2)
+
+
+def test_lru_cache_overwrite_does_not_evict():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.put('a', 3)
+    assert len(cache) == 2
+    assert cache.evictions == 0
+    assert cache.get('a') == 3
+
+
+def test_lru_cache_clear_resets_counters():
+    cache = LRUCache(1)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.clear()
+    assert cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=1, currsize=0)
+
+
+@pytest.mark.parametrize('size', (0, -1))
+def test_lru_cache_invalid_size(size):
+    with pytest.raises(ValueError):
+        LRUCache(size)
+
+
+def test_lru_cache_threaded_access_keeps_counts():
+    cache = LRUCache(50)
+
+    def worker(offset):
+        for index in range(1000):
+            key = (offset + index) % 100
+            if cache.get(key) is None:
+                cache.put(key, index)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = cache.info()
+    assert info.hits + info.misses == 8000
+    assert info.currsize == 50
+    assert info.evictions <= info.misses - info.currsize
+
+
+def test_derived_key_cache_expires_and_zeroizes(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('eth_account._utils.caching.time.monotonic', lambda: now[0])
+    cache = DerivedKeyCache(2, ttl=10)
+    key = cache.key('scrypt', {'n': 2, 'salt': '00'}, b'password')
+    cache.put(key, b'\x07' * 32)
+    (_, stored) = cache._entries[key]
+
+    now[0] += 9
+    assert cache.get(key) == b'\x07' * 32
+    now[0] += 1
+    assert cache.get(key) is None
+    assert stored == bytearray(32)
+    assert len(cache) == 0
+
+    cache.put(key, b'\x07' * 32)
+    (_, stored) = cache._entries[key]
+    cache.clear()
+    assert stored == bytearray(32)
+
+
+def test_derived_key_cache_purges_expired_entries_on_access(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('eth_account._utils.caching.time.monotonic', lambda: now[0])
+    cache = DerivedKeyCache(4, ttl=10)
+    cache.put('a', b'\x01' * 32)
+    (_, stored) = cache._entries['a']
+    now[0] += 5
+    cache.put('b', b'\x02' * 32)
+    # replacing an entry restarts its time to live
+    cache.put('b', b'\x03' * 32)
+
+    now[0] += 5
+    assert 'a' not in cache
+    assert len(cache) == 1
+    assert stored == bytearray(32)
+    assert cache.info().currsize == 1
+
+    now[0] += 5
+    cache.put('c', b'\x04' * 32)
+    assert list(cache._entries) == ['c']
+    cache.clear()
+
+
+def test_derived_key_cache_timer_purges_idle_entries():
+    cache = DerivedKeyCache(4, ttl=0.05)
+    cache.put('a', b'\x01' * 32)
+    (_, stored) = cache._entries['a']
+    # nothing touches the cache, so only the timer can drop the entry
+    for _ in range(100):
+        if not cache._entries:
+            break
+        threading.Event().wait(0.01)
+    assert not cache._entries
+    assert stored == bytearray(32)
+    assert cache._timer is None
+
+
+def test_derived_key_cache_zeroizes_evicted_and_replaced():
+    cache = DerivedKeyCache(1, ttl=10)
+    cache.put('a', b'\x01' * 32)
+    (_, first) = cache._entries['a']
+    cache.put('a', b'\x02' * 32)
+    assert first == bytearray(32)
+    (_, second) = cache._entries['a']
+    cache.put('b', b'\x03' * 32)
+    assert second == bytearray(32)
+    assert cache.info().evictions == 1
+
+
+def test_derived_key_cache_keys():
+    cache = DerivedKeyCache(1, ttl=10)
+    kdfparams = {'n': 2, 'salt': '00'}
+    key = cache.key('scrypt', kdfparams, b'password')
+    assert key == cache.key('scrypt', dict(kdfparams), b'password')
+    assert key != cache.key('scrypt', dict(kdfparams, salt='01'), b'password')
+    assert key != cache.key('scrypt', kdfparams, b'passwore')
+    # keys depend on a secret, so they can't be compared with a guessed password's
+    assert key != DerivedKeyCache(1, ttl=10).key('scrypt', kdfparams, b'password')
+
+    with pytest.raises(ValueError):
+        DerivedKeyCache(1, ttl=0)
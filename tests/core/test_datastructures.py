@@ -0,0 +1,203 @@
+import pickle
+import pytest
+import sys
+
+from cytoolz import (
+    dissoc,
+)
+from eth_keys import (
+    keys,
+)
+from eth_utils import (
+    keccak,
+)
+from hexbytes import (
+    HexBytes,
+)
+
+from eth_account import (
+    Account,
+)
+from eth_account._utils.signing import (
+    to_standard_signature_bytes,
+)
+from eth_account.datastructures import (
+    AttributeDict,
+    KeyArray,
+    SignatureArray,
+    SignedMessage,
+    SignedTransaction,
+)
+from eth_account.transactions import (
+    TransactionTemplate,
+)
+
+KEY = keys.PrivateKey(b'unicorns' * 4)
+MESSAGE_HASHES = [keccak(bytes([index])) for index in range(6)]
+SIGNED = [Account.signHash(message_hash, KEY) for message_hash in MESSAGE_HASHES]
+
+
+@pytest.fixture
+def signatures():
+    return SignatureArray.fromSignatures(signed.signature for signed in SIGNED)
+
+
+def test_signature_array_fields(signatures):
+    assert len(signatures) == len(SIGNED)
+    assert list(signatures) == [signed.signature for signed in SIGNED]
+    assert signatures[-1] == SIGNED[-1].signature
+    assert isinstance(signatures[0], HexBytes)
+    assert signatures.r == [signed.r for signed in SIGNED]
+    assert signatures.s == [signed.s for signed in SIGNED]
+    assert list(signatures.v) == [signed.v for signed in SIGNED]
+    assert signatures.vrs == [(signed.v, signed.r, signed.s) for signed in SIGNED]
+    assert bytes(signatures.packed) == b''.join(signed.signature for signed in SIGNED)
+
+
+def test_signature_array_slicing(signatures):
+    assert signatures[1:3] == SignatureArray.fromSignatures(
+        signed.signature for signed in SIGNED[1:3]
+    )
+    assert len(signatures[10:]) == 0
+    with pytest.raises(ValueError):
+        signatures[::2]
+    with pytest.raises(IndexError):
+        signatures[len(SIGNED)]
+
+
+def test_signature_array_standardized(signatures):
+    chain_v_signature = SIGNED[0].signature[:64] + bytes([37])
+    signatures.append(chain_v_signature)
+    standardized = signatures.standardized()
+    assert list(standardized) == [
+        to_standard_signature_bytes(signature) for signature in signatures
+    ]
+    # the original is left alone
+    assert signatures[0] == SIGNED[0].signature
+
+
+def test_signature_array_standardized_invalid_v(signatures):
+    signatures.append(SIGNED[0].signature[:64] + b'\x05')
+    with pytest.raises(ValueError, match='Signature 6'):
+        signatures.standardized()
+
+
+def test_signature_array_feeds_recovery(signatures):
+    assert Account.recoverHashes(zip(MESSAGE_HASHES, signatures.vrs)) == (
+        [KEY.public_key.to_checksum_address()] * len(SIGNED)
+    )
+    assert Account.recoverHashes(zip(MESSAGE_HASHES, signatures)) == (
+        Account.recoverHashes(zip(MESSAGE_HASHES, signatures.standardized().vrs))
+    )
+
+
+@pytest.mark.parametrize('packed', (b'\x00' * 64, b'\x00' * 66))
+def test_signature_array_invalid_length(packed):
+    with pytest.raises(ValueError):
+        SignatureArray(packed)
+    with pytest.raises(ValueError):
+        SignatureArray().append(packed)
+
+
+def test_key_array():
+    keys = KeyArray(KEY.to_bytes() * 2, KEY.public_key.to_canonical_address() * 2)
+    assert len(keys) == 2
+    assert keys[-1] == (HexBytes(KEY.to_bytes()), KEY.public_key.to_checksum_address())
+    assert keys.privateKey(0) == KEY.to_bytes()
+    assert keys[1:] == KeyArray(KEY.to_bytes(), KEY.public_key.to_canonical_address())
+    assert bytes(keys.packedAddresses) == KEY.public_key.to_canonical_address() * 2
+    with pytest.raises(IndexError):
+        keys[2]
+
+    keys.extend(keys[:1])
+    assert list(keys) == [keys[0]] * 3
+
+
+@pytest.mark.parametrize('packed_keys, packed_addresses', (
+    (b'\x00' * 31, b'\x00' * 20),
+    (b'\x00' * 32, b'\x00' * 21),
+    (b'\x00' * 64, b'\x00' * 20),
+))
+def test_key_array_invalid_length(packed_keys, packed_addresses):
+    with pytest.raises(ValueError):
+        KeyArray(packed_keys, packed_addresses)
+
+
+TRANSACTION = {
+    'to': '0xF0109fC8DF283027b6285cc889F5aA624EaC1F55',
+    'value': 1000000000,
+    'gas': 2000000,
+    'gasPrice': 234567897654321,
+    'nonce': 0,
+    'chainId': 1,
+}
+
+
+@pytest.fixture
+def lightweight_account():
+    account = Account()
+    account.lightweight_results = True
+    return account
+
+
+def test_lightweight_signed_message(lightweight_account):
+    signed = lightweight_account.signHash(MESSAGE_HASHES[0], KEY)
+    expected = SIGNED[0]
+    assert isinstance(signed, SignedMessage)
+    assert signed == expected
+    assert expected == signed
+    assert dict(signed) == dict(expected)
+    assert signed.signature == expected.signature
+    assert signed['v'] == expected['v']
+    assert set(signed.keys()) == set(expected.keys())
+
+
+def test_lightweight_signed_transaction(lightweight_account):
+    signed = lightweight_account.signTransaction(TRANSACTION, KEY)
+    assert isinstance(signed, SignedTransaction)
+    assert signed == Account.signTransaction(TRANSACTION, KEY)
+
+    local_account = lightweight_account.privateKeyToAccount(KEY)
+    assert isinstance(local_account.signTransaction(TRANSACTION), SignedTransaction)
+
+    template = TransactionTemplate(dissoc(TRANSACTION, 'nonce'), lightweight_account)
+    assert isinstance(template.signTransaction(0, KEY), SignedTransaction)
+
+    in_workers = lightweight_account.signTransactions([TRANSACTION] * 2, KEY, workers=1)
+    assert all(isinstance(result, SignedTransaction) for result in in_workers)
+    assert in_workers[0] == signed
+
+
+def test_lightweight_results_are_off_by_default():
+    assert isinstance(Account.signHash(MESSAGE_HASHES[0], KEY), AttributeDict)
+
+
+def test_lightweight_result_is_immutable(lightweight_account):
+    signed = lightweight_account.signHash(MESSAGE_HASHES[0], KEY)
+    with pytest.raises(TypeError, match="^SignedMessage is immutable"):
+        signed.v = 27
+    with pytest.raises(TypeError, match="^SignedMessage is immutable"):
+        del signed.v
+    with pytest.raises(TypeError):
+        signed['v'] = 27
+    with pytest.raises(KeyError):
+        signed['missing']
+    with pytest.raises(TypeError):
+        SignedMessage(1, 2)
+
+
+def test_lightweight_transaction_result_names_its_class(lightweight_account):
+    signed = lightweight_account.signTransaction(TRANSACTION, KEY)
+    with pytest.raises(TypeError, match="^SignedTransaction is immutable"):
+        signed.hash = b''
+
+
+def test_lightweight_result_pickles(lightweight_account):
+    signed = lightweight_account.signTransaction(TRANSACTION, KEY)
+    assert pickle.loads(pickle.dumps(signed)) == signed
+
+
+def test_lightweight_result_is_smaller(lightweight_account):
+    signed = lightweight_account.signHash(MESSAGE_HASHES[0], KEY)
+    assert sys.getsizeof(signed) < sys.getsizeof(SIGNED[0])
+    assert not hasattr(signed, '__dict__')
@@ -0,0 +1,90 @@
+import json
+
+from eth_account import (
+    Account,
+    account as account_module,
+)
+from eth_account._utils.keyfile import (
+    load_kdf_profile,
+    profile_iterations,
+)
+from eth_account.kdf_calibrate import (
+    calibrate,
+    main,
+    scrypt_memory,
+)
+
+PRIVATE_KEY = b'\x01' * 32
+
+
+def test_calibrate_within_target_and_memory():
+    profile = calibrate(20, max_memory=scrypt_memory(2 ** 10), repeat=1)
+    assert profile['target_ms'] == 20
+    assert profile['scrypt']['iterations'] <= 2 ** 10
+    assert profile['scrypt']['memory'] == scrypt_memory(profile['scrypt']['iterations'])
+    assert profile['pbkdf2']['iterations'] % 1000 == 0
+    assert profile['pbkdf2']['iterations'] >= 1000
+
+
+def test_encrypt_uses_profile():
+    account = Account()
+    account.kdf_profile = {'scrypt': {'iterations': 1024}, 'pbkdf2': {'iterations': 2000}}
+    assert account.encrypt(PRIVATE_KEY, 'pw')['crypto']['kdfparams']['n'] == 1024
+    assert account.encrypt(PRIVATE_KEY, 'pw', kdf='pbkdf2')['crypto']['kdfparams']['c'] == 2000
+    # explicit iterations win over the profile
+    assert account.encrypt(PRIVATE_KEY, 'pw', iterations=2048)['crypto']['kdfparams']['n'] == 2048
+
+    # a kdf missing from the profile keeps the default of eth-keyfile
+    assert profile_iterations({'pbkdf2': {'iterations': 2000}}, 'scrypt') is None
+
+
+def test_encrypt_uses_profile_engine(monkeypatch):
+    engines = []
+    original_create = account_module.create_keyfile_json
+
+    def recording_create(*args, engine, **kwargs):
+        engines.append(engine)
+        return original_create(*args, engine=engine, **kwargs)
+
+    monkeypatch.setattr(account_module, 'create_keyfile_json', recording_create)
+    account = Account()
+    account.kdf_engine = 'eth-keyfile'
+    account.kdf_profile = {'engine': 'auto', 'pbkdf2': {'iterations': 2000}}
+    account.encrypt(PRIVATE_KEY, 'pw', kdf='pbkdf2')
+    # explicit iterations don't come from the profile, so neither does the engine
+    account.encrypt(PRIVATE_KEY, 'pw', kdf='pbkdf2', iterations=1000)
+    assert engines == ['auto', 'eth-keyfile']
+
+
+def test_profile_file_is_parsed_once(tmpdir, monkeypatch):
+    path = tmpdir.join('kdf.json')
+    path.write(json.dumps({'pbkdf2': {'iterations': 2000}}))
+    loads = []
+    original_load = json.load
+    monkeypatch.setattr(
+        'eth_account._utils.keyfile.json.load',
+        lambda profile_file: loads.append(profile_file.name) or original_load(profile_file),
+    )
+    assert load_kdf_profile(str(path)) == {'pbkdf2': {'iterations': 2000}}
+    assert load_kdf_profile(str(path)) == {'pbkdf2': {'iterations': 2000}}
+    assert len(loads) == 1
+
+    # a changed file is read again
+    path.write(json.dumps({'pbkdf2': {'iterations': 30000}}))
+    assert profile_iterations(str(path), 'pbkdf2') == 30000
+    assert len(loads) == 2
+
+
+def test_main_writes_profile(tmpdir, capsys):
+    output = tmpdir.join('kdf.json')
+    main(['--target-ms', '5', '--kdf', 'pbkdf2', '--repeat', '1', '--output', str(output)])
+    assert 'pbkdf2: c=' in capsys.readouterr().err
+
+    profile = json.loads(output.read())
+    assert set(profile) == {'target_ms', 'engine', 'pbkdf2'}
+
+    account = Account()
+    account.kdf_profile = str(output)
+    keyfile = account.encrypt(PRIVATE_KEY, 'pw', kdf='pbkdf2')
+    assert keyfile['crypto']['kdfparams']['c'] == profile['pbkdf2']['iterations']
+    assert account.decrypt(keyfile, 'pw') == PRIVATE_KEY
@@ -0,0 +1,215 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import pytest
+
+import eth_keyfile
+
+from eth_account import (
+    Account,
+)
+from eth_account._utils.keyfile import (
+    HAS_OPENSSL_SCRYPT,
+    KDF_ENGINES,
+    derive_key,
+    openssl_supports_scrypt,
+)
+
+# from https://github.com/ethereum/wiki/wiki/Web3-Secret-Storage-Definition#test-vectors
+WEB3_TEST_PASSWORD = 'testpassword'
+WEB3_TEST_PRIVATE_KEY = bytes.fromhex(
+    '7a28b5ba57c53603b0b07b56bba752f7784bf506fa95edc395f5cf6c7514fe9d'
+)
+WEB3_TEST_KEYFILES = {
+    'pbkdf2': {
+        'crypto': {
+            'cipher': 'aes-128-ctr',
+            'cipherparams': {'iv': '6087dab2f9fdbbfaddc31a909735c1e6'},
+            'ciphertext': '5318b4d5bcd28de64ee5559e671353e16f075ecae9f99c7a79a38af5f869aa46',
+            'kdf': 'pbkdf2',
+            'kdfparams': {
+                'c': 262144,
+                'dklen': 32,
+                'prf': 'hmac-sha256',
+                'salt': 'ae3cd4e7013836a3df6bd7241b12db061dbe2c6785853cce422d148a624ce0bd',
+            },
+            'mac': '517ead924a9d0dc3124507e3393d175ce3ff7c1e96529c6c555ce9e51205e9b2',
+        },
+        'id': '3198bc9c-6672-5ab3-d995-4942343ae5b6',
+        'version': 3,
+    },
+    'scrypt': {
+        'crypto': {
+            'cipher': 'aes-128-ctr',
+            'cipherparams': {'iv': '83dbcc02d8ccb40e466191a123791e0e'},
+            'ciphertext': 'd172bf743a674da9cdad04534d56926ef8358534d458fffccd4e6ad2fbde479c',
+            'kdf': 'scrypt',
+            'kdfparams': {
+                'dklen': 32,
+                'n': 262144,
+                'r': 1,
+                'p': 8,
+                'salt': 'ab0c7876052600dd703518d6fc3fe8984592145b591fc8fb5c6d43190334ba19',
+            },
+            'mac': '2103ac29920d71da29f15d75b4a16dbe95cfd7ff8faea1056c33131d846e3097',
+        },
+        'id': '3198bc9c-6672-5ab3-d995-4942343ae5b6',
+        'version': 3,
+    },
+}
+
+
+@pytest.fixture(params=KDF_ENGINES)
+def engine_account(request):
+    account = Account()
+    account.kdf_engine = request.param
+    return account
+
+
+@pytest.mark.parametrize('kdf', sorted(WEB3_TEST_KEYFILES))
+def test_decrypt_web3_test_vectors(engine_account, kdf):
+    keyfile = WEB3_TEST_KEYFILES[kdf]
+    if kdf == 'scrypt' and engine_account.kdf_engine == 'openssl':
+        # OpenSSL rejects n = 2 ** 18 with r = 1, rather than falling back silently
+        with pytest.raises(ValueError, match="scrypt"):
+            engine_account.decrypt(keyfile, WEB3_TEST_PASSWORD)
+        return
+    assert engine_account.decrypt(keyfile, WEB3_TEST_PASSWORD) == WEB3_TEST_PRIVATE_KEY
+    with pytest.raises(ValueError, match="MAC mismatch"):
+        engine_account.decrypt(keyfile, 'wrongpassword')
+
+
+@pytest.mark.parametrize('kdf, iterations', (('pbkdf2', 100), ('scrypt', 1024)))
+def test_keyfiles_compatible_with_eth_keyfile(engine_account, kdf, iterations):
+    if kdf == 'scrypt' and engine_account.kdf_engine == 'openssl' and not HAS_OPENSSL_SCRYPT:
+        with pytest.raises(ValueError, match="hashlib.scrypt"):
+            engine_account.encrypt(WEB3_TEST_PRIVATE_KEY, 'pw', kdf=kdf, iterations=iterations)
+        return
+    encrypted = engine_account.encrypt(WEB3_TEST_PRIVATE_KEY, 'pw', kdf=kdf, iterations=iterations)
+    expected = eth_keyfile.create_keyfile_json(
+        WEB3_TEST_PRIVATE_KEY,
+        b'pw',
+        kdf=kdf,
+        iterations=iterations,
+    )
+    assert encrypted.keys() == expected.keys()
+    assert encrypted['crypto'].keys() == expected['crypto'].keys()
+    assert encrypted['crypto']['kdfparams'].keys() == expected['crypto']['kdfparams'].keys()
+    assert encrypted['address'] == expected['address']
+
+    assert eth_keyfile.decode_keyfile_json(encrypted, b'pw') == WEB3_TEST_PRIVATE_KEY
+    assert engine_account.decrypt(expected, 'pw') == WEB3_TEST_PRIVATE_KEY
+
+
+@pytest.mark.skipif(not HAS_OPENSSL_SCRYPT, reason="hashlib.scrypt is not available")
+@pytest.mark.parametrize('n, r, p', ((1024, 8, 1), (4096, 8, 6), (1024, 1, 8)))
+def test_openssl_scrypt_matches_eth_keyfile(n, r, p):
+    kdfparams = {'dklen': 32, 'n': n, 'r': r, 'p': p, 'salt': '00' * 16}
+    assert openssl_supports_scrypt(n, r)
+    assert derive_key('scrypt', kdfparams, b'pw', engine='openssl') == (
+        derive_key('scrypt', kdfparams, b'pw', engine='eth-keyfile')
+    )
+
+
+def test_openssl_scrypt_limits():
+    assert not openssl_supports_scrypt(2 ** 18, 1)
+    assert openssl_supports_scrypt(2 ** 18, 8) == HAS_OPENSSL_SCRYPT
+
+
+def test_pbkdf2_requires_hmac():
+    keyfile = WEB3_TEST_KEYFILES['pbkdf2']
+    crypto = keyfile['crypto']
+    unsupported = dict(keyfile, crypto=dict(
+        crypto,
+        kdfparams=dict(crypto['kdfparams'], prf='sha256'),
+    ))
+    with pytest.raises(ValueError, match="pseudo-random function"):
+        Account.decrypt(unsupported, WEB3_TEST_PASSWORD)
+
+
+def test_eth_keyfile_unchanged_outside_account():
+    scrypt_hash = eth_keyfile.keyfile._scrypt_hash
+    pbkdf2_hash = eth_keyfile.keyfile._pbkdf2_hash
+    account = Account()
+    account.enableDerivedKeyCache()
+    keyfile = account.encrypt(WEB3_TEST_PRIVATE_KEY, 'pw', kdf='scrypt', iterations=1024)
+    assert account.decrypt(keyfile, 'pw') == WEB3_TEST_PRIVATE_KEY
+
+    # the KDF hooks are only in place during Account calls
+    assert eth_keyfile.keyfile._scrypt_hash is scrypt_hash
+    assert eth_keyfile.keyfile._pbkdf2_hash is pbkdf2_hash
+    assert eth_keyfile.decode_keyfile_json(keyfile, b'pw') == WEB3_TEST_PRIVATE_KEY
+
+
+def test_kdf_hooks_across_threads():
+    scrypt_hash = eth_keyfile.keyfile._scrypt_hash
+    account = Account()
+    account.enableDerivedKeyCache()
+    keyfile = account.encrypt(WEB3_TEST_PRIVATE_KEY, 'pw', kdf='scrypt', iterations=1024)
+
+    def decrypt(index):
+        if index % 2:
+            return eth_keyfile.decode_keyfile_json(keyfile, b'pw')
+        return account.decrypt(keyfile, 'pw')
+
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(decrypt, range(16))) == [WEB3_TEST_PRIVATE_KEY] * 16
+    assert eth_keyfile.keyfile._scrypt_hash is scrypt_hash
+
+
+def test_eth_keyfile_without_kdf_functions(monkeypatch):
+    # a release of eth-keyfile that derives keys some other way
+    monkeypatch.delattr(eth_keyfile.keyfile, '_scrypt_hash')
+    monkeypatch.setattr(
+        eth_keyfile.keyfile,
+        '_derive_scrypt_key',
+        lambda crypto, password: derive_key('scrypt', crypto['kdfparams'], password),
+    )
+    keyfile = WEB3_TEST_KEYFILES['pbkdf2']
+    assert Account.decrypt(keyfile, WEB3_TEST_PASSWORD) == WEB3_TEST_PRIVATE_KEY
+
+    account = Account()
+    cache = account.enableDerivedKeyCache()
+    assert account.decrypt(keyfile, WEB3_TEST_PASSWORD) == WEB3_TEST_PRIVATE_KEY
+    assert len(cache) == 0
+
+    account.kdf_engine = 'openssl'
+    with pytest.raises(ValueError, match="'auto' KDF engine"):
+        account.decrypt(keyfile, WEB3_TEST_PASSWORD)
+    assert not hasattr(eth_keyfile.keyfile, '_scrypt_hash')
+
+
+def test_unknown_kdf_engine():
+    account = Account()
+    account.kdf_engine = 'fastest'
+    with pytest.raises(ValueError):
+        account.decrypt(WEB3_TEST_KEYFILES['scrypt'], WEB3_TEST_PASSWORD)
+
+
+def test_derived_key_cache(monkeypatch):
+    account = Account()
+    cache = account.enableDerivedKeyCache(size=4, ttl=60)
+    keyfile = account.encrypt(WEB3_TEST_PRIVATE_KEY, 'pw', kdf='scrypt', iterations=1024)
+    assert account.decrypt(keyfile, 'pw') == WEB3_TEST_PRIVATE_KEY
+    with pytest.raises(ValueError):
+        account.decrypt(keyfile, 'wrong')
+
+    def fail_to_derive(*args, **kwargs):
+        raise AssertionError("The key should come from the cache")
+
+    monkeypatch.setattr('eth_account._utils.keyfile._scrypt', fail_to_derive)
+    assert account.decrypt(keyfile, 'pw') == WEB3_TEST_PRIVATE_KEY
+    assert account.decryptMany([keyfile, keyfile], 'pw') == [WEB3_TEST_PRIVATE_KEY] * 2
+    # the MAC is still checked on a hit
+    tampered = dict(keyfile, crypto=dict(keyfile['crypto'], ciphertext='00' * 32))
+    with pytest.raises(ValueError, match="MAC mismatch"):
+        account.decrypt(tampered, 'pw')
+    # only keys that passed the MAC check are cached
+    assert len(cache) == 1
+
+    account.disableDerivedKeyCache()
+    assert len(cache) == 0
+    # without a cache, eth-keyfile derives the key itself
+    monkeypatch.setattr(eth_keyfile.keyfile, '_scrypt_hash', fail_to_derive)
+    with pytest.raises(AssertionError):
+        account.decrypt(keyfile, 'pw')
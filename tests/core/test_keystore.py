@@ -0,0 +1,128 @@
+import json
+import os
+import pytest
+
+from eth_account import (
+    Account,
+)
+from eth_account.keystore import (
+    KeystoreDirectory,
+)
+
+KEYS = (b'unicorns' * 4, b'rainbows' * 4)
+ADDRESSES = tuple(Account.privateKeyToAccount(key).address for key in KEYS)
+PASSWORD = 'password'
+
+
+def write_keyfile(directory, name, private_key, mtime=None, **overrides):
+    keyfile = Account.encrypt(private_key, PASSWORD, kdf='pbkdf2', iterations=10)
+    keyfile.update(overrides)
+    path = directory.join(name)
+    path.write(json.dumps(keyfile))
+    if mtime is not None:
+        os.utime(str(path), (mtime, mtime))
+    return keyfile
+
+
+@pytest.fixture
+def keystore_dir(tmpdir):
+    write_keyfile(tmpdir, 'UTC--first', KEYS[0])
+    write_keyfile(tmpdir, 'UTC--second', KEYS[1])
+    tmpdir.join('not-a-keyfile').write('hello')
+    tmpdir.join('no-address').write(json.dumps({'version': 3}))
+    tmpdir.join('.hidden').write(json.dumps({'address': '00' * 20}))
+    tmpdir.mkdir('subdirectory')
+    return tmpdir
+
+
+def test_keystore_indexes_addresses_without_decrypting(keystore_dir, monkeypatch):
+    def fail_to_decrypt(*args):
+        raise AssertionError("Scanning must not decrypt")
+
+    monkeypatch.setattr(Account, 'decrypt', fail_to_decrypt)
+    keystore = KeystoreDirectory(str(keystore_dir))
+    assert len(keystore) == 2
+    assert set(keystore) == set(ADDRESSES)
+    assert ADDRESSES[0] in keystore
+    assert ADDRESSES[0].lower() in keystore
+    assert 'not an address' not in keystore
+    assert keystore.keyfilePath(ADDRESSES[1]) == str(keystore_dir.join('UTC--second'))
+    assert keystore.loadKeyfile(ADDRESSES[1])['address'] == ADDRESSES[1][2:].lower()
+    with pytest.raises(KeyError):
+        keystore.keyfilePath('0x' + '00' * 20)
+
+
+def test_keystore_unlocks_lazily(keystore_dir, monkeypatch):
+    keystore = KeystoreDirectory(str(keystore_dir))
+    assert not keystore.isUnlocked(ADDRESSES[0])
+    account = keystore.unlock(ADDRESSES[0], PASSWORD)
+    assert account.address == ADDRESSES[0]
+    assert account.privateKey == KEYS[0]
+    assert keystore.isUnlocked(ADDRESSES[0])
+    assert not keystore.isUnlocked(ADDRESSES[1])
+
+    decrypted = []
+    monkeypatch.setattr(Account, 'decrypt', lambda *args: decrypted.append(args))
+    assert keystore.unlock(ADDRESSES[0], PASSWORD) is account
+    assert decrypted == []
+
+    keystore.lock(ADDRESSES[0])
+    assert not keystore.isUnlocked(ADDRESSES[0])
+
+
+def test_keystore_wrong_password(keystore_dir):
+    keystore = KeystoreDirectory(str(keystore_dir))
+    with pytest.raises(ValueError):
+        keystore.unlock(ADDRESSES[0], 'wrong')
+    assert not keystore.isUnlocked(ADDRESSES[0])
+
+    # the password is still checked once the key is unlocked
+    account = keystore.unlock(ADDRESSES[0], PASSWORD)
+    with pytest.raises(ValueError):
+        keystore.unlock(ADDRESSES[0], 'wrong')
+    assert keystore.unlock(ADDRESSES[0], PASSWORD.encode('utf-8')) is account
+
+
+def test_keystore_rejects_keyfile_with_wrong_address(tmpdir):
+    write_keyfile(tmpdir, 'liar', KEYS[0], address=ADDRESSES[1][2:].lower())
+    keystore = KeystoreDirectory(str(tmpdir))
+    with pytest.raises(ValueError):
+        keystore.unlock(ADDRESSES[1], PASSWORD)
+
+
+def test_keystore_rescans_incrementally(keystore_dir, monkeypatch):
+    keystore = KeystoreDirectory(str(keystore_dir))
+    keystore.unlock(ADDRESSES[0], PASSWORD)
+    assert keystore.scan() == 0
+
+    read = []
+    original_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        read.append(os.path.basename(path))
+        return original_open(path, *args, **kwargs)
+
+    keystore_dir.join('UTC--second').remove()
+    write_keyfile(keystore_dir, 'UTC--third', KEYS[1])
+    monkeypatch.setattr('builtins.open', tracking_open)
+    assert keystore.scan() == 2
+    assert read == ['UTC--third']
+    assert set(keystore) == set(ADDRESSES)
+    assert keystore.isUnlocked(ADDRESSES[0])
+
+    # a changed keyfile is read again, and its key must be unlocked again
+    write_keyfile(keystore_dir, 'UTC--first', KEYS[0], mtime=1)
+    assert keystore.scan() == 1
+    assert not keystore.isUnlocked(ADDRESSES[0])
+
+    keystore_dir.join('UTC--first').remove()
+    assert keystore.scan() == 1
+    assert ADDRESSES[0] not in keystore
+
+
+def test_keystore_prefers_newest_duplicate(tmpdir):
+    write_keyfile(tmpdir, 'a', KEYS[0], mtime=2000, id='newest')
+    write_keyfile(tmpdir, 'b', KEYS[0], mtime=1000, id='oldest')
+    keystore = KeystoreDirectory(str(tmpdir))
+    assert len(keystore) == 1
+    assert keystore.loadKeyfile(ADDRESSES[0])['id'] == 'newest'
@@ -0,0 +1,93 @@
+from concurrent.futures import (
+    ThreadPoolExecutor,
+)
+import threading
+import time
+
+from eth_account._utils.keyfile import (
+    kdf_memory_cost,
+)
+from eth_account._utils.parallel import (
+    executor_workers,
+    imap_batches,
+    imap_within_budget,
+)
+
+
+class WrappedExecutor(object):
+    '''
+    An executor that isn't from concurrent.futures, so it has no ``_max_workers``.
+    '''
+    def __init__(self, executor):
+        self._executor = executor
+
+    def submit(self, fn, *args):
+        return self._executor.submit(fn, *args)
+
+
+def test_executor_workers():
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        assert executor_workers(executor) == 3
+        assert executor_workers(executor, workers=5) == 5
+        assert executor_workers(WrappedExecutor(executor), workers=5) == 5
+        assert executor_workers(WrappedExecutor(executor)) >= 1
+
+
+def test_imap_batches_uses_given_workers():
+    lock = threading.Lock()
+    in_flight = []
+    peaks = []
+    release = threading.Event()
+
+    def run(batch):
+        with lock:
+            in_flight.append(batch)
+            peaks.append(len(in_flight))
+        if len(peaks) >= 4:
+            release.set()
+        release.wait(1)
+        with lock:
+            in_flight.remove(batch)
+        return batch
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(imap_batches(WrappedExecutor(executor), run, range(12), workers=4))
+
+    assert results == list(range(12))
+    # four batches ran at once, not one at a time
+    assert max(peaks) == 4
+
+
+def test_imap_within_budget_bounds_cost_in_flight():
+    lock = threading.Lock()
+    in_flight = []
+    peaks = []
+
+    def run(cost, value):
+        with lock:
+            in_flight.append(cost)
+            peaks.append(sum(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(cost)
+        return value
+
+    costs = [3, 3, 3, 1, 1, 1, 1, 10, 2, 2]
+    jobs = ((cost, (cost, index)) for index, cost in enumerate(costs))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(imap_within_budget(executor, run, jobs, budget=6))
+
+    assert results == list(range(len(costs)))
+    # the job that costs more than the budget runs, alone
+    assert max(peaks) == 10
+    assert all(peak <= 6 for peak in peaks if peak != 10)
+
+
+def test_kdf_memory_cost():
+    scrypt_keyfile = {
+        'Crypto': {'kdf': 'scrypt', 'kdfparams': {'n': 262144, 'r': 8, 'p': 1}},
+    }
+    assert kdf_memory_cost(scrypt_keyfile) == 256 * 1024 ** 2
+    assert kdf_memory_cost({'crypto': {'kdf': 'pbkdf2', 'kdfparams': {'c': 10}}}) == 0
+    assert kdf_memory_cost('not json') == 0
+    assert kdf_memory_cost({'crypto': {'kdf': 'scrypt'}}) == 0
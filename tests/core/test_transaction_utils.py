@@ -0,0 +1,268 @@
+import pytest
+from random import (
+    Random,
+)
+
+from cytoolz import (
+    merge,
+    pipe,
+)
+from eth_utils.curried import (
+    apply_formatters_to_dict,
+)
+from hexbytes import (
+    HexBytes,
+)
+import rlp
+from rlp.exceptions import (
+    DecodingError,
+    ObjectDeserializationError,
+    ObjectSerializationError,
+    SerializationError,
+)
+
+from eth_account._utils.raw_rlp import (
+    decode_list,
+    encode_bytes,
+    encode_int,
+)
+from eth_account._utils.signing import (
+    hash_and_vrs_of_serialized_transaction,
+    hash_of_signed_transaction,
+)
+from eth_account._utils.transactions import (
+    TRANSACTION_DEFAULTS,
+    TRANSACTION_FORMATTERS,
+    Transaction,
+    UnsignedTransaction,
+    chain_id_to_v,
+    encode_signed_transaction,
+    encode_signing_payload,
+    encode_transaction,
+    encode_unsigned_fields,
+    locate_signed_transaction_fields,
+    normalize_transaction_fields,
+    serializable_unsigned_transaction_from_dict,
+)
+
+BASE_TXN = {
+    'nonce': 0,
+    'gasPrice': 234567897654321,
+    'gas': 2000000,
+}
+
+
+def legacy_serializable_transaction(transaction_dict):
+    filled_transaction = pipe(
+        transaction_dict,
+        dict,
+        lambda txn: merge(TRANSACTION_DEFAULTS, txn),
+        chain_id_to_v,
+        apply_formatters_to_dict(TRANSACTION_FORMATTERS),
+    )
+    if 'v' in filled_transaction:
+        return Transaction.from_dict(filled_transaction)
+    else:
+        return UnsignedTransaction.from_dict(filled_transaction)
+
+
+@pytest.mark.parametrize(
+    'txn',
+    (
+        BASE_TXN,
+        dict(BASE_TXN, chainId=1),
+        dict(BASE_TXN, chainId='0x1'),
+        dict(BASE_TXN, chainId=None),
+        dict(BASE_TXN, nonce='0x10', gasPrice='0x0', gas='0x5208', value='0x01'),
+        dict(BASE_TXN, to='0xF0109fC8DF283027b6285cc889F5aA624EaC1F55', value=1000000000),
+        dict(BASE_TXN, to=HexBytes('0xF0109fC8DF283027b6285cc889F5aA624EaC1F55')),
+        dict(BASE_TXN, to=b'\xf0' * 20, chainId=1337),
+        dict(BASE_TXN, to=None),
+        dict(BASE_TXN, to=''),
+        dict(BASE_TXN, data='0x6025515b525b'),
+        dict(BASE_TXN, data=b'\x60\x25'),
+        dict(BASE_TXN, data=bytearray(b'\x60\x25')),
+        dict(BASE_TXN, data=HexBytes('0x6025')),
+        dict(BASE_TXN, data=0x6025),
+        dict(BASE_TXN, data=''),
+    ),
+)
+def test_normalized_transaction_matches_formatter_pipeline(txn):
+    expected = legacy_serializable_transaction(txn)
+    actual = serializable_unsigned_transaction_from_dict(txn)
+    assert type(actual) is type(expected)
+    assert actual == expected
+    assert actual.hash() == expected.hash()
+
+
+def test_normalize_transaction_fields_chain_id_suffix():
+    assert normalize_transaction_fields(dict(BASE_TXN, chainId=5))[-3:] == (5, 0, 0)
+    assert len(normalize_transaction_fields(BASE_TXN)) == 6
+
+
+def test_normalize_transaction_fields_missing_required():
+    with pytest.raises(TypeError):
+        normalize_transaction_fields({'nonce': 0, 'gas': 21000})
+
+
+@pytest.mark.parametrize(
+    'value',
+    (0, 1, 0x7f, 0x80, 0xff, 0x100, 0xffff, 2 ** 64, 2 ** 256 - 1, 2 ** 448 + 1),
+)
+def test_encode_int_matches_rlp(value):
+    assert encode_int(value) == rlp.encode(value)
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        b'',
+        b'\x00',
+        b'\x7f',
+        b'\x80',
+        b'\xff',
+        b'ab',
+        b'\x01' * 55,
+        b'\x01' * 56,
+        b'\x01' * 255,
+        b'\x01' * 256,
+        b'\x01' * 65536,
+        bytearray(b'\x01\x02'),
+    ),
+)
+def test_encode_bytes_matches_rlp(value):
+    assert encode_bytes(value) == rlp.encode(value)
+
+
+def test_encode_negative_int_fails():
+    with pytest.raises(SerializationError):
+        encode_int(-1)
+
+
+@pytest.mark.parametrize('data_length', (0, 1, 10, 20, 21, 200, 70000))
+@pytest.mark.parametrize('chain_id', (None, 1, 127, 128, 2 ** 40))
+@pytest.mark.parametrize('to', (b'', b'\xf0' * 20))
+def test_transaction_encoders_match_rlp(data_length, chain_id, to):
+    random = Random(data_length)
+    fields = (
+        random.randrange(2 ** 64),
+        random.randrange(2 ** 80),
+        random.choice((0, 21000, 2 ** 24)),
+        to,
+        random.choice((0, 1, 2 ** 200)),
+        bytes(random.randrange(256) for _ in range(data_length)),
+    )
+    vrs = (random.randrange(27, 2 ** 42), random.randrange(1, 2 ** 256), random.randrange(2 ** 249))
+    unsigned_body = encode_unsigned_fields(*fields)
+
+    if chain_id is None:
+        expected_payload = rlp.encode(UnsignedTransaction(*fields))
+    else:
+        expected_payload = rlp.encode(Transaction(*fields + (chain_id, 0, 0)))
+    assert encode_signing_payload(unsigned_body, chain_id) == expected_payload
+
+    expected_signed = rlp.encode(Transaction(*fields + vrs))
+    assert encode_signed_transaction(unsigned_body, vrs) == expected_signed
+    assert encode_transaction(UnsignedTransaction(*fields), vrs) == expected_signed
+
+
+def test_encode_unsigned_fields_rejects_bad_address():
+    with pytest.raises(ObjectSerializationError) as excinfo:
+        encode_unsigned_fields(0, 0, 0, b'\x01' * 19, 0, b'')
+    assert excinfo.value.field == 'to'
+
+
+def test_encode_signed_transaction_rejects_negative_signature():
+    with pytest.raises(ObjectSerializationError) as excinfo:
+        encode_signed_transaction(encode_unsigned_fields(0, 0, 0, b'', 0, b''), (27, -1, 1))
+    assert excinfo.value.field == 'r'
+
+
+def random_signed_transaction(random, chain_id, data_length):
+    v = random.choice((27, 28)) if chain_id is None else chain_id * 2 + random.choice((35, 36))
+    return Transaction(
+        random.randrange(2 ** 64),
+        random.randrange(2 ** 80),
+        random.choice((0, 21000, 2 ** 24)),
+        random.choice((b'', b'\xf0' * 20)),
+        random.choice((0, 1, 2 ** 200)),
+        bytes(random.randrange(256) for _ in range(data_length)),
+        v,
+        random.randrange(1, 2 ** 256),
+        random.randrange(2 ** 249),
+    )
+
+
+@pytest.mark.parametrize('data_length', (0, 1, 30, 70000))
+@pytest.mark.parametrize('chain_id', (None, 1, 128, 2 ** 40))
+def test_hash_of_serialized_transaction_matches_decoded(data_length, chain_id):
+    txn = random_signed_transaction(Random(data_length), chain_id, data_length)
+    txn_bytes = rlp.encode(txn)
+    expected = (hash_of_signed_transaction(txn), (txn.v, txn.r, txn.s))
+
+    assert hash_and_vrs_of_serialized_transaction(txn_bytes) == expected
+    assert hash_and_vrs_of_serialized_transaction(memoryview(txn_bytes)) == expected
+
+
+def test_locate_signed_transaction_fields():
+    txn = random_signed_transaction(Random(0), 1, 100)
+    txn_bytes = rlp.encode(txn)
+    for (start, value_start, value_end), value in zip(
+            locate_signed_transaction_fields(txn_bytes),
+            rlp.decode(txn_bytes)):
+        assert txn_bytes[value_start:value_end] == value
+        assert txn_bytes[start:value_end] == rlp.encode(value)
+
+
+VALID_SIGNED_ITEMS = rlp.decode(rlp.encode(random_signed_transaction(Random(1), 1, 10)))
+
+
+@pytest.mark.parametrize(
+    'txn_bytes, error, field',
+    (
+        (b'', DecodingError, None),
+        (b'\x01\x02', DecodingError, None),
+        (rlp.encode(VALID_SIGNED_ITEMS) + b'\x00', DecodingError, None),
+        (rlp.encode(VALID_SIGNED_ITEMS)[:-1], DecodingError, None),
+        (rlp.encode(b'abc'), ObjectDeserializationError, None),
+        # single bytes below 0x80 must be encoded as themselves
+        (b'\xc2\x81\x05', DecodingError, None),
+        # payloads shorter than 56 bytes must use the short length form
+        (b'\xf8\x01\x80', DecodingError, None),
+        (b'\xc4\xb8\x01\x80\x80', DecodingError, None),
+        # invalid RLP nested in a field is a decoding error, not a field error
+        (b'\xcb\x80\x80\x80\x80\x80\xc2\x81\x05\x80\x80\x80', DecodingError, None),
+        (rlp.encode(VALID_SIGNED_ITEMS[:8]), ObjectDeserializationError, None),
+        (rlp.encode(VALID_SIGNED_ITEMS + [b'']), ObjectDeserializationError, None),
+        (rlp.encode([b'\x00'] + VALID_SIGNED_ITEMS[1:]), ObjectDeserializationError, 'nonce'),
+        (rlp.encode(VALID_SIGNED_ITEMS[:8] + [b'\x00\x01']), ObjectDeserializationError, 's'),
+        (rlp.encode(VALID_SIGNED_ITEMS[:3] + [b'\x01' * 19] + VALID_SIGNED_ITEMS[4:]), ObjectDeserializationError, 'to'),  # noqa: E501
+        (rlp.encode(VALID_SIGNED_ITEMS[:5] + [[b'']] + VALID_SIGNED_ITEMS[6:]), ObjectDeserializationError, 'data'),  # noqa: E501
+    ),
+)
+def test_invalid_serialized_transaction(txn_bytes, error, field):
+    # the same error as decoding the transaction in full
+    for decode in (Transaction.from_bytes, hash_and_vrs_of_serialized_transaction):
+        with pytest.raises(error) as excinfo:
+            decode(txn_bytes)
+        assert type(excinfo.value) is error
+        assert getattr(excinfo.value, 'field', None) == field
+
+
+@pytest.mark.parametrize('items', ([[b'']] + VALID_SIGNED_ITEMS[1:], VALID_SIGNED_ITEMS[:8] + [[]]))
+def test_serialized_transaction_with_list_in_int_field(items):
+    with pytest.raises(ObjectDeserializationError):
+        hash_and_vrs_of_serialized_transaction(rlp.encode(items))
+
+
+@pytest.mark.parametrize(
+    'items',
+    ([], [b''], [b'\x01' * 56, [b'a', [b'b']]], [b'\x7f', b'\x80', b'\xff' * 300]),
+)
+def test_decode_list_matches_rlp(items):
+    encoded = rlp.encode(items)
+    decoded = []
+    for is_list, start, value_start, value_end in decode_list(encoded):
+        assert is_list == isinstance(rlp.decode(encoded[start:value_end]), list)
+        decoded.append(rlp.decode(encoded[start:value_end]))
+    assert decoded == rlp.decode(encoded)
@@ -0,0 +1,166 @@
+import pytest
+
+from cytoolz import (
+    dissoc,
+)
+from eth_keys import (
+    keys,
+)
+from hexbytes import (
+    HexBytes,
+)
+import rlp
+from rlp.exceptions import (
+    DecodingError,
+    ObjectDeserializationError,
+    ObjectSerializationError,
+)
+
+from eth_account import (
+    Account,
+)
+from eth_account._utils.transactions import (
+    Transaction,
+)
+from eth_account.transactions import (
+    SignedTransactionView,
+    TransactionTemplate,
+)
+
+KEY = keys.PrivateKey(b'unicorns' * 4)
+
+TEMPLATES = (
+    {
+        'to': '0xF0109fC8DF283027b6285cc889F5aA624EaC1F55',
+        'value': 1000000000,
+        'gas': 2000000,
+        'gasPrice': 234567897654321,
+        'chainId': 1,
+    },
+    {
+        'to': b'',
+        'gas': 100000,
+        'gasPrice': '0x3b9aca00',
+        'data': '0x6025515b525b600a37f260003556601b596020356000355760015b525b54602052f2',
+    },
+    {
+        'to': '0xF0109fC8DF283027b6285cc889F5aA624EaC1F55',
+        'gas': 21000,
+        'gasPrice': 0,
+        'data': b'\xab' * 300,
+        'chainId': 1337,
+    },
+)
+
+
+@pytest.mark.parametrize('template_dict', TEMPLATES)
+@pytest.mark.parametrize('nonce', (0, 1, 127, 128, 2 ** 40, '0x10'))
+def test_template_matches_sign_transaction(template_dict, nonce):
+    template = TransactionTemplate(template_dict)
+    expected = Account.signTransaction(dict(template_dict, nonce=nonce), KEY)
+    assert template.signTransaction(nonce, KEY) == expected
+    assert template.signTransaction(nonce, b'unicorns' * 4) == expected
+
+
+@pytest.mark.parametrize('template_dict', TEMPLATES)
+def test_template_with_varying_value(template_dict):
+    template = TransactionTemplate(template_dict)
+    nonces = range(5)
+    values = (0, 1, 10 ** 18, '0x05', 2 ** 255)
+    expected = [
+        Account.signTransaction(dict(template_dict, nonce=nonce, value=value), KEY)
+        for nonce, value in zip(nonces, values)
+    ]
+    assert template.signTransactions(nonces, KEY, values=values) == expected
+    assert template.signTransaction(nonces[-1], KEY, value=values[-1]) == expected[-1]
+
+
+@pytest.mark.parametrize('values', ([5], [5, 6, 7, 8], []))
+def test_template_sign_transactions_value_count_mismatch(values):
+    template = TransactionTemplate(TEMPLATES[0])
+    with pytest.raises(ValueError):
+        template.signTransactions(range(3), KEY, values=values)
+    with pytest.raises(ValueError):
+        template.signTransactions(iter(range(3)), KEY, values=iter(values))
+
+
+def test_template_sign_transactions_without_values():
+    template = TransactionTemplate(TEMPLATES[0])
+    signed = template.signTransactions(range(3), KEY)
+    assert signed == Account.signTransactions(
+        [dict(TEMPLATES[0], nonce=nonce) for nonce in range(3)],
+        KEY,
+    )
+    assert template.chainId == 1
+    assert TransactionTemplate(TEMPLATES[1]).chainId is None
+
+
+@pytest.mark.parametrize(
+    'template_dict',
+    (
+        dict(TEMPLATES[0], nonce=0),
+        dissoc(TEMPLATES[0], 'gas'),
+        dict(TEMPLATES[0], to='0xf0109fc8df283027b6285cc889f5aa624eac1f55'),
+        dict(TEMPLATES[0], gasprice=1),
+        [('gas', 1)],
+    ),
+)
+def test_invalid_template(template_dict):
+    with pytest.raises(TypeError):
+        TransactionTemplate(template_dict)
+
+
+@pytest.mark.parametrize('nonce, value', ((None, None), ('1', None), (0, '1'), (0, b'\x01')))
+def test_template_rejects_invalid_varying_fields(nonce, value):
+    template = TransactionTemplate(TEMPLATES[0])
+    with pytest.raises(TypeError):
+        template.signTransaction(nonce, KEY, value=value)
+
+
+def test_template_unserializable_fields():
+    with pytest.raises(ObjectSerializationError):
+        TransactionTemplate(dict(TEMPLATES[0], gas=-1))
+    template = TransactionTemplate(TEMPLATES[0])
+    with pytest.raises(ObjectSerializationError):
+        template.signTransaction(-1, KEY)
+    with pytest.raises(ObjectSerializationError):
+        template.signTransaction(0, KEY, value=-1)
+
+
+@pytest.mark.parametrize('template_dict', TEMPLATES)
+@pytest.mark.parametrize('wrap', (bytes, bytearray, memoryview, HexBytes, lambda raw: raw.hex()))
+def test_signed_transaction_view_matches_decoded(template_dict, wrap):
+    signed = Account.signTransaction(dict(template_dict, nonce=5), KEY)
+    raw = bytes(signed.rawTransaction)
+    decoded = Transaction.from_bytes(raw)
+    view = SignedTransactionView(wrap(raw))
+
+    for name in ('nonce', 'gasPrice', 'gas', 'to', 'value', 'data', 'v', 'r', 's'):
+        assert getattr(view, name) == getattr(decoded, name)
+    assert view.chainId == template_dict.get('chainId')
+    assert view.hash == signed.hash
+    assert view.rawTransaction == signed.rawTransaction
+    assert len(view) == len(raw)
+    assert 'nonce=5' in repr(view)
+
+
+def test_signed_transaction_view_does_not_copy_data():
+    signed = Account.signTransaction(dict(TEMPLATES[2], nonce=0), KEY)
+    raw = bytearray(signed.rawTransaction)
+    view = SignedTransactionView(raw)
+    assert isinstance(view.data, memoryview)
+    assert view.data.obj is raw
+
+
+@pytest.mark.parametrize(
+    'raw, error',
+    (
+        (b'\x01\x02', DecodingError),
+        (rlp.encode([b''] * 8), ObjectDeserializationError),
+        (rlp.encode([b'\x00'] + [b''] * 8), ObjectDeserializationError),
+    ),
+)
+def test_signed_transaction_view_invalid(raw, error):
+    with pytest.raises(error) as excinfo:
+        SignedTransactionView(raw)
+    assert type(excinfo.value) is error
@@ -8,6 +8,12 @@ from cytoolz import (
 from eth_account import (
     Account,
 )
+from eth_account._utils.addresses import (
+    to_checksum_address,
+)
+from eth_account._utils.transactions import (
+    assert_valid_fields,
+)
 
 GOOD_TXN = {
     'gasPrice': 2,
@@ -66,3 +72,26 @@ def test_invalid_transaction_fields(txn_dict, bad_fields):
             Account.signTransaction(txn_dict, TEST_PRIVATE_KEY)
         for field in bad_fields:
             assert field in str(excinfo.value)
+
+
+def test_checksum_validation_is_cached_per_address():
+    to_checksum_address.cache_clear()
+    checksummed = dict(GOOD_TXN, to='0xF0109fC8DF283027b6285cc889F5aA624EaC1F55')
+    lowercased = dict(GOOD_TXN, to='0xf0109fc8df283027b6285cc889f5aa624eac1f55')
+
+    for _ in range(3):
+        assert_valid_fields(checksummed)
+        with pytest.raises(TypeError):
+            assert_valid_fields(lowercased)
+
+    # both spellings of the address share one cache entry
+    cache_info = to_checksum_address.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 5
+
+
+def test_missing_fields_reported_before_other_errors():
+    with pytest.raises(TypeError) as excinfo:
+        assert_valid_fields(dict(dissoc(GOOD_TXN, 'gas'), gasprice=1, nonce='0e1'))
+    assert 'must include' in str(excinfo.value)
+    assert 'gas' in str(excinfo.value)
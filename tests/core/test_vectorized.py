@@ -0,0 +1,114 @@
+from array import (
+    array,
+)
+import os
+import pytest
+
+from eth_account import (
+    Account,
+    vectorized,
+)
+from eth_account._utils.signing import (
+    extract_chain_id,
+    to_eth_v,
+    to_standard_v,
+)
+from eth_account.datastructures import (
+    SignatureArray,
+)
+from eth_account.vectorized import (
+    NO_CHAIN_ID,
+    extract_chain_ids,
+    to_eth_vs,
+    to_standard_vs,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RAW_VS = (0, 1, 2, 26, 27, 28, 29, 34, 35, 36, 37, 38, 2709, 2710, 2 ** 40 + 35, -1)
+
+
+@pytest.fixture(params=('numpy', 'array'))
+def implementation(request, monkeypatch):
+    if request.param == 'array':
+        monkeypatch.setattr(vectorized, 'np', None)
+    elif np is None:
+        # the test extra installs NumPy, so a missing NumPy is an error unless opted out
+        if not os.getenv('ETH_ACCOUNT_SKIP_NUMPY_TESTS'):
+            pytest.fail(
+                "NumPy is not installed: install the 'test' extra, or set "
+                "ETH_ACCOUNT_SKIP_NUMPY_TESTS=1 to skip the NumPy cases"
+            )
+        pytest.skip("NumPy is not installed, and ETH_ACCOUNT_SKIP_NUMPY_TESTS is set")
+    return request.param
+
+
+def expected_decoding(raw_v):
+    try:
+        (chain_id, _v) = extract_chain_id(raw_v)
+        standard_v = to_standard_v(raw_v)
+    except ValueError:
+        return (NO_CHAIN_ID, 0, False)
+    return (NO_CHAIN_ID if chain_id is None else chain_id, standard_v, True)
+
+
+def test_extract_chain_ids_matches_scalar(implementation):
+    (chain_ids, standard_vs, valid) = extract_chain_ids(RAW_VS)
+    if implementation == 'numpy':
+        assert isinstance(chain_ids, np.ndarray)
+        assert valid.dtype == bool
+    else:
+        assert isinstance(chain_ids, array)
+
+    expected = [expected_decoding(raw_v) for raw_v in RAW_VS]
+    assert list(zip(chain_ids, standard_vs, map(bool, valid))) == expected
+
+
+def test_to_standard_vs(implementation):
+    (standard_vs, valid) = to_standard_vs(array('q', (27, 28, 37, 3)))
+    assert list(standard_vs) == [0, 1, 0, 0]
+    assert list(map(bool, valid)) == [True, True, True, False]
+
+
+@pytest.mark.parametrize('chain_id', (None, 0, 1, 1337))
+def test_to_eth_vs_with_shared_chain_id(implementation, chain_id):
+    assert list(to_eth_vs([0, 1, 1, 0], chain_id)) == [
+        to_eth_v(standard_v, chain_id) for standard_v in (0, 1, 1, 0)
+    ]
+
+
+def test_to_eth_vs_with_chain_id_per_signature(implementation):
+    chain_ids = [NO_CHAIN_ID, 1, 0, 2 ** 40]
+    assert list(to_eth_vs([1, 0, 1, 1], chain_ids)) == [
+        to_eth_v(1), to_eth_v(0, 1), to_eth_v(1, 0), to_eth_v(1, 2 ** 40),
+    ]
+
+
+def test_round_trip(implementation):
+    (chain_ids, standard_vs, valid) = extract_chain_ids(RAW_VS)
+    eth_vs = to_eth_vs(standard_vs, chain_ids)
+    for raw_v, is_valid, eth_v in zip(RAW_VS, valid, eth_vs):
+        if is_valid and raw_v not in (0, 1):
+            assert eth_v == raw_v
+
+
+def test_signature_array_vs(implementation):
+    signatures = SignatureArray.fromSignatures(
+        Account.signHash(bytes([index]) * 32, b'unicorns' * 4).signature
+        for index in range(4)
+    )
+    # an EIP-155 v, for chain 1
+    signatures.append(signatures[0][:-1] + bytes([37]))
+    raw_vs = signatures.v
+    assert isinstance(raw_vs, bytes)
+
+    (chain_ids, standard_vs, valid) = extract_chain_ids(raw_vs)
+    assert list(zip(chain_ids, standard_vs, map(bool, valid))) == [
+        expected_decoding(raw_v) for raw_v in raw_vs
+    ]
+    chain_naive = bytes(standard_v for standard_v in standard_vs)
+    assert list(to_eth_vs(chain_naive)) == [to_eth_v(v) for v in chain_naive]
+    assert list(to_eth_vs(chain_naive, chain_ids)) == list(raw_vs)